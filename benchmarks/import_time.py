@@ -0,0 +1,55 @@
+"""Measure how long a fresh interpreter takes to `import todo_api.main`.
+
+Each run is a new subprocess so nothing is cached in `sys.modules`. `--top` also prints
+the slowest modules by cumulative import time from `python -X importtime`.
+
+Usage: `ENVIRONMENT=PRODUCTION python -m benchmarks.import_time`
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+MODULE = "todo_api.main"
+
+
+def time_import(module: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def slowest_imports(module: str, top: int) -> list[tuple[int, str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    # "import time: self [us] | cumulative | imported package"
+    entries: list[tuple[int, str]] = []
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        entries.append((int(cumulative), name.rstrip()))
+    return sorted(entries, reverse=True)[:top]
+
+
+def main(args: argparse.Namespace) -> None:
+    timings = [time_import(args.module) for _ in range(args.runs)]
+    print(
+        f"import {args.module}: n={args.runs} median={statistics.median(timings):.0f}ms "
+        f"min={min(timings):.0f}ms max={max(timings):.0f}ms"
+    )
+
+    for cumulative, name in slowest_imports(args.module, args.top):
+        print(f"{cumulative / 1000:>8.1f}ms {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default=MODULE)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=0, help="print the N slowest imports")
+    main(parser.parse_args())
@@ -0,0 +1,128 @@
+"""Compare `/todos/me` responses encoded by the stdlib `json` module and by pydantic-core.
+
+Serves a page of `--size` todos in-process through `create_app` with Starlette's
+`JSONResponse` (validate, dump to JSON-compatible Python objects, `json.dumps`) and with
+`todo_api.api.responses.JSONResponse` (validate, dump straight to JSON bytes). `serialize`
+times only the response encoding of the same page, `request` the whole request.
+
+Usage: `ENVIRONMENT=PRODUCTION DB_DATABASE=todo_api_bench python -m benchmarks.json_response`
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+from fastapi import Response
+from fastapi.responses import JSONResponse as StdlibJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from todo_api.api.app import create_app
+from todo_api.api.dependencies.auth import get_user_from_session
+from todo_api.api.pagination import Paginated
+from todo_api.api.responses import JSONResponse
+from todo_api.api.routers.todos import TODO_READ_COLUMNS
+from todo_api.api.schemas.todos import TodoRead
+from todo_api.core.database.base import (
+    Model,
+    dispose_engines,
+    get_async_engine,
+    get_async_session_maker,
+)
+from todo_api.todos.models import Todo
+from todo_api.todos.service import TodoService
+from todo_api.users.models import User
+
+USERNAME = "json_response"
+PAGE_ADAPTER = TypeAdapter(Paginated[TodoRead])
+
+
+async def seed(session: AsyncSession, size: int) -> User:
+    async with get_async_engine().begin() as conn:
+        tables = [Model.metadata.tables[model.__tablename__] for model in (User, Todo)]
+        await conn.run_sync(Model.metadata.create_all, tables=tables)
+
+    user = await session.scalar(select(User).where(User.username == USERNAME))
+    if user is None:
+        user = User(username=USERNAME, hashed_password="x")
+        session.add(user)
+        await session.flush()
+
+    existing = await session.scalar(select(func.count()).where(Todo.user_id == user.id)) or 0
+    session.add_all(
+        Todo(title=f"todo {i}", description="description " * 4, user_id=user.id)
+        for i in range(existing, size)
+    )
+    await session.commit()
+    return user
+
+
+def stdlib_encode(page: Any) -> bytes:  # noqa: ANN401
+    content = PAGE_ADAPTER.dump_python(page, mode="json", by_alias=True)
+    return bytes(StdlibJSONResponse(content).body)
+
+
+def pydantic_encode(page: Any) -> bytes:  # noqa: ANN401
+    return PAGE_ADAPTER.dump_json(page, by_alias=True)
+
+
+def time_serialize(encode: Callable[[Any], bytes], page: Any, n: int) -> float:  # noqa: ANN401
+    start = time.perf_counter()
+    for _ in range(n):
+        encode(page)
+    return (time.perf_counter() - start) / n * 1_000_000
+
+
+async def time_requests(call: Callable[[], Awaitable[httpx.Response]], n: int) -> list[float]:
+    timings: list[float] = []
+    for _ in range(n):
+        start = time.perf_counter()
+        response = await call()
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return timings
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with get_async_session_maker()() as session:
+        user = await seed(session, args.size)
+        rows, total = await TodoService(session).list_rows_and_count(
+            columns=TODO_READ_COLUMNS, user_id=user.id, limit=args.size
+        )
+    page = PAGE_ADAPTER.validate_python(
+        {"items": rows, "total": total, "page": 1, "size": args.size}
+    )
+    assert stdlib_encode(page) == pydantic_encode(page)
+
+    response_classes: tuple[tuple[str, type[Response], Callable[[Any], bytes]], ...] = (
+        ("stdlib", StdlibJSONResponse, stdlib_encode),
+        ("pydantic", JSONResponse, pydantic_encode),
+    )
+    for name, response_class, encode in response_classes:
+        app = create_app(default_response_class=response_class)
+        app.dependency_overrides[get_user_from_session] = lambda: user
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            timings = await time_requests(
+                lambda: client.get("/api/v1/todos/me", params={"size": args.size}), args.n
+            )
+        print(
+            f"{name:>8}: size={args.size} "
+            f"serialize={time_serialize(encode, page, args.n):.0f}us "
+            f"request p50={statistics.median(timings):.2f}ms "
+            f"p99={statistics.quantiles(timings, n=100)[98]:.2f}ms"
+        )
+
+    await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=500, help="requests per measurement")
+    parser.add_argument("--size", type=int, default=100, help="todos per page")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,102 @@
+"""Compare `CountStrategy.EXACT` (two queries) with `CountStrategy.WINDOW` (one query).
+
+Seeds the `todo` table of `DB_DATABASE` with `--rows` todos spread over `--users` users
+(only when it holds fewer rows) and times `TodoService.list_and_count` for one user.
+
+Usage: `ENVIRONMENT=PRODUCTION DB_DATABASE=todo_api_bench python -m benchmarks.list_and_count`
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import func, select, text
+
+from todo_api.core.database.base import (
+    Model,
+    dispose_engines,
+    get_async_engine,
+    get_async_session_maker,
+)
+from todo_api.core.database.service import CountStrategy
+from todo_api.todos.models import Todo
+from todo_api.todos.service import TodoService
+from todo_api.users.models import User
+
+SEED_USERS = text(
+    """
+    INSERT INTO users (username, hashed_password, created_at, updated_at)
+    SELECT 'bench_' || i, 'x', now(), now() FROM generate_series(1, :users) AS i
+    WHERE NOT EXISTS (SELECT 1 FROM users WHERE username = 'bench_' || i)
+    """
+)
+SEED_TODOS = text(
+    """
+    INSERT INTO todo (title, description, is_completed, user_id, created_at, updated_at)
+    SELECT
+        'todo ' || i,
+        NULL,
+        i % 3 = 0,
+        u.id,
+        now() - make_interval(secs => i),
+        now() - make_interval(secs => i)
+    FROM generate_series(1, :rows) AS i
+    JOIN users AS u ON u.username = 'bench_' || (i % :users + 1)
+    """
+)
+
+
+async def seed(rows: int, users: int) -> None:
+    async with get_async_engine().begin() as conn:
+        tables = [Model.metadata.tables[model.__tablename__] for model in (User, Todo)]
+        await conn.run_sync(Model.metadata.create_all, tables=tables)
+        existing = (await conn.execute(select(func.count()).select_from(Todo))).scalar_one()
+        if existing >= rows:
+            return
+        await conn.execute(SEED_USERS, {"users": users})
+        await conn.execute(SEED_TODOS, {"rows": rows - existing, "users": users})
+    async with get_async_engine().connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE todo"))
+
+
+async def run(strategy: CountStrategy, *, iterations: int, size: int, page: int) -> list[float]:
+    async with get_async_session_maker()() as session:
+        user_id = (
+            await session.execute(select(Todo.user_id).order_by(Todo.id).limit(1))
+        ).scalar_one()
+        service = TodoService(session, count_strategy=strategy)
+
+        timings: list[float] = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await service.list_and_count(user_id=user_id, limit=size, offset=(page - 1) * size)
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings
+
+
+async def main(args: argparse.Namespace) -> None:
+    await seed(args.rows, args.users)
+
+    print(f"rows={args.rows} users={args.users} size={args.size} page={args.page}")
+    for strategy in (CountStrategy.EXACT, CountStrategy.WINDOW):
+        await run(strategy, iterations=args.warmup, size=args.size, page=args.page)
+        timings = await run(strategy, iterations=args.iterations, size=args.size, page=args.page)
+        print(
+            f"{strategy:>8}: median={statistics.median(timings):.2f}ms "
+            f"p95={statistics.quantiles(timings, n=20)[-1]:.2f}ms"
+        )
+
+    await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--size", type=int, default=50)
+    parser.add_argument("--page", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,134 @@
+"""Measure `/todos/me` latency while a storm of logins hashes passwords on the same worker.
+
+Runs the app in-process (single event loop, like one granian worker) and reports
+`/todos/me` latency percentiles alone and during `--logins` concurrent logins.
+`--blocking` verifies passwords on the event loop, as `login` did before hashing
+was moved to worker threads.
+
+Usage:
+`ENVIRONMENT=PRODUCTION OTEL_ENABLED=false DB_DATABASE=todo_api_bench python -m benchmarks.login_storm`
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+from asgi_lifespan import LifespanManager
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from todo_api.auth.models import UserSession
+from todo_api.core.database.base import (
+    Model,
+    dispose_engines,
+    get_async_engine,
+    get_async_session_maker,
+)
+from todo_api.main import create_app
+from todo_api.todos.models import Todo
+from todo_api.users import security
+from todo_api.users.models import User
+
+PASSWORD = "benchmark-password"
+
+
+async def _blocking_verify_password(plain_password: str, hashed_password: str) -> bool:
+    return security.verify_password(plain_password, hashed_password)
+
+
+def copy_request_state(app: ASGIApp) -> ASGIApp:
+    """Give each request its own copy of lifespan state, as ASGI servers do."""
+
+    async def app_with_request_state(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            scope["state"] = scope["state"].copy()
+        await app(scope, receive, send)
+
+    return app_with_request_state
+
+
+async def seed() -> str:
+    async with get_async_engine().begin() as conn:
+        tables = [Model.metadata.tables[m.__tablename__] for m in (User, UserSession, Todo)]
+        await conn.run_sync(Model.metadata.create_all, tables=tables)
+
+    username = f"storm_{uuid.uuid4().hex[:8]}"
+    async with get_async_session_maker()() as session:
+        session.add(User(username=username, hashed_password=security.get_password_hash(PASSWORD)))
+        await session.commit()
+    return username
+
+
+async def measure_reads(client: httpx.AsyncClient, token: str, stop: asyncio.Event) -> list[float]:
+    timings: list[float] = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get(
+            "/api/v1/todos/me", headers={"Authorization": f"Bearer {token}"}
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return timings
+
+
+async def login(
+    client: httpx.AsyncClient, username: str, semaphore: asyncio.Semaphore | None = None
+) -> str:
+    if semaphore is not None:
+        async with semaphore:
+            return await login(client, username)
+
+    response = await client.post(
+        "/api/v1/users/login", json={"username": username, "password": PASSWORD}
+    )
+    response.raise_for_status()
+    return response.json()["token"]
+
+
+def report(name: str, timings: list[float]) -> None:
+    percentiles = statistics.quantiles(timings, n=100)
+    print(
+        f"{name:>12}: n={len(timings)} p50={percentiles[49]:.2f}ms "
+        f"p99={percentiles[98]:.2f}ms max={max(timings):.2f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.blocking:
+        security.verify_password_async = _blocking_verify_password
+
+    username = await seed()
+    app = create_app()
+    async with LifespanManager(copy_request_state(app)) as manager:
+        transport = httpx.ASGITransport(app=manager.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            token = await login(client, username)
+
+            stop = asyncio.Event()
+            reads = asyncio.create_task(measure_reads(client, token, stop))
+            await asyncio.sleep(args.duration)
+            stop.set()
+            report("baseline", await reads)
+
+            stop = asyncio.Event()
+            reads = asyncio.create_task(measure_reads(client, token, stop))
+            start = time.perf_counter()
+            semaphore = asyncio.Semaphore(args.concurrency)
+            await asyncio.gather(*(login(client, username, semaphore) for _ in range(args.logins)))
+            storm_duration = time.perf_counter() - start
+            stop.set()
+            report("login storm", await reads)
+            print(f"{args.logins} logins in {storm_duration:.2f}s")
+
+    await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10, help="logins in flight")
+    parser.add_argument("--duration", type=float, default=3.0, help="baseline duration (s)")
+    parser.add_argument("--blocking", action="store_true")
+    asyncio.run(main(parser.parse_args()))
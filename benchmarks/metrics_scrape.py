@@ -0,0 +1,110 @@
+"""Measure multiprocess `/metrics` scrapes with many worker files.
+
+Writes the metric files of `--workers` live workers (idle child processes) plus
+`--restarts` generations of dead ones into a temporary directory, each with the request
+counters and latency histograms of `--routes` routes. Times aggregating the directory from scratch on every scrape (a new
+registry and `MultiProcessCollector` per request), the same after compacting the dead
+workers, and `MultiProcessScrape` answering `--concurrency` concurrent scrapes per TTL.
+
+Usage: `ENVIRONMENT=PRODUCTION python -m benchmarks.metrics_scrape`
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from prometheus_client import CollectorRegistry, generate_latest, multiprocess
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
+
+from todo_api.api.config import api_settings
+from todo_api.core.observability.multiprocess import MultiProcessScrape, compact_dead_workers
+
+# Above the Linux pid_max, so never a running process
+DEAD_PID_START = 4_194_305
+
+
+def write_worker_files(path: Path, pid: int, routes: int) -> None:
+    counters = MmapedDict(str(path / f"counter_{pid}.db"))
+    histograms = MmapedDict(str(path / f"histogram_{pid}.db"))
+    buckets = [*map(str, api_settings.PROMETHEUS_LATENCY_BUCKETS), "+Inf"]
+    for route in range(routes):
+        labels = ["method", "path", "status_code"]
+        values = ["GET", f"/resource{route}/{{item_id}}", "200"]
+        key = mmap_key("responses", "responses_total", labels, values, "Responses")
+        counters.write_value(key, 10, 0)  # pyright: ignore[reportUnknownMemberType]
+        for bucket in buckets:
+            key = mmap_key(
+                "latency", "latency_bucket", [*labels, "le"], [*values, bucket], "Latency"
+            )
+            histograms.write_value(key, 1, 0)  # pyright: ignore[reportUnknownMemberType]
+        key = mmap_key("latency", "latency_sum", labels, values, "Latency")
+        histograms.write_value(key, 1, 0)  # pyright: ignore[reportUnknownMemberType]
+    counters.close()
+    histograms.close()
+
+
+def scrape_from_scratch(path: Path) -> bytes:
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, str(path))
+    return generate_latest(registry)
+
+
+def time_scrapes(path: Path, n: int) -> float:
+    timings: list[float] = []
+    for _ in range(n):
+        start = time.perf_counter()
+        scrape_from_scratch(path)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+async def time_cached_scrapes(path: Path, n: int, concurrency: int, ttl: float) -> float:
+    scrape = MultiProcessScrape(str(path), ttl=ttl)
+    start = time.perf_counter()
+    for _ in range(n):
+        await asyncio.gather(*(scrape.generate() for _ in range(concurrency)))
+        await asyncio.sleep(ttl)
+    elapsed = time.perf_counter() - start - n * ttl
+    return elapsed / (n * concurrency) * 1000
+
+
+def main(args: argparse.Namespace) -> None:
+    workers = [subprocess.Popen(["sleep", "3600"]) for _ in range(args.workers)]
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory)
+            for worker in workers:
+                write_worker_files(path, worker.pid, args.routes)
+            for restart in range(args.restarts * args.workers):
+                write_worker_files(path, DEAD_PID_START + restart, args.routes)
+
+            files = len(list(path.glob("*.db")))
+            print(f"  from scratch: files={files} p50={time_scrapes(path, args.n):.1f}ms")
+
+            compact_dead_workers(directory)
+            files = len(list(path.glob("*.db")))
+            print(f"     compacted: files={files} p50={time_scrapes(path, args.n):.1f}ms")
+
+            cached = asyncio.run(time_cached_scrapes(path, args.n, args.concurrency, args.ttl))
+            print(
+                f"cached (x{args.concurrency:<2}):  files={files} mean={cached:.2f}ms per scrape"
+            )
+    finally:
+        for worker in workers:
+            worker.kill()
+            worker.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=20, help="scrapes per measurement")
+    parser.add_argument("--workers", type=int, default=32, help="live workers")
+    parser.add_argument("--restarts", type=int, default=3, help="dead generations of workers")
+    parser.add_argument("--routes", type=int, default=60, help="routes with metrics")
+    parser.add_argument("--concurrency", type=int, default=4, help="scrapes per TTL")
+    parser.add_argument("--ttl", type=float, default=0.05, help="scrape cache TTL in seconds")
+    main(parser.parse_args())
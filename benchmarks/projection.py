@@ -0,0 +1,114 @@
+"""Compare `/todos/me` pages built from ORM instances with pages built from plain rows.
+
+For a page of `--size` todos, times fetching with `TodoService.list_and_count` (ORM
+instances, identity map) or `list_rows_and_count` (selected columns as dicts) plus validating
+and serializing `Paginated[TodoRead]` like the route does, and reports the peak memory traced
+per page.
+
+Usage: `ENVIRONMENT=PRODUCTION DB_DATABASE=todo_api_bench python -m benchmarks.projection`
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from todo_api.api.pagination import Paginated
+from todo_api.api.routers.todos import TODO_READ_COLUMNS
+from todo_api.api.schemas.todos import TodoRead
+from todo_api.core.database.base import (
+    Model,
+    dispose_engines,
+    get_async_engine,
+    get_async_session_maker,
+)
+from todo_api.core.database.service import OrderBy
+from todo_api.todos.models import Todo
+from todo_api.todos.service import TodoService
+from todo_api.users.models import User
+
+USERNAME = "projection"
+ORDER_BY = OrderBy(field="created_at", order="desc")
+
+
+async def seed(session: AsyncSession, size: int) -> int:
+    async with get_async_engine().begin() as conn:
+        tables = [Model.metadata.tables[model.__tablename__] for model in (User, Todo)]
+        await conn.run_sync(Model.metadata.create_all, tables=tables)
+
+    user_id = await session.scalar(select(User.id).where(User.username == USERNAME))
+    if user_id is None:
+        user = User(username=USERNAME, hashed_password="x")
+        session.add(user)
+        await session.flush()
+        user_id = user.id
+
+    existing = await session.scalar(select(func.count()).where(Todo.user_id == user_id)) or 0
+    session.add_all(
+        Todo(title=f"todo {i}", description="description " * 4, user_id=user_id)
+        for i in range(existing, size)
+    )
+    await session.commit()
+    return user_id
+
+
+def serialize(items: Sequence[object], total: int | None, size: int) -> bytes:
+    page = Paginated[TodoRead].model_validate(
+        {"items": items, "total": total, "page": 1, "size": size}
+    )
+    return page.model_dump_json(by_alias=True).encode()
+
+
+async def measure(call: Callable[[], Awaitable[bytes]], n: int) -> tuple[list[float], int]:
+    timings: list[float] = []
+    for _ in range(n):
+        start = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    await call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return timings, peak
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with get_async_session_maker()() as session:
+        user_id = await seed(session, args.size)
+        service = TodoService(session)
+
+        async def orm_page() -> bytes:
+            items, total = await service.list_and_count(
+                user_id=user_id, limit=args.size, order_by=ORDER_BY
+            )
+            body = serialize(items, total, args.size)
+            session.expunge_all()
+            return body
+
+        async def rows_page() -> bytes:
+            rows, total = await service.list_rows_and_count(
+                columns=TODO_READ_COLUMNS, user_id=user_id, limit=args.size, order_by=ORDER_BY
+            )
+            return serialize(rows, total, args.size)
+
+        for name, call in (("orm", orm_page), ("rows", rows_page)):
+            timings, peak = await measure(call, args.n)
+            print(
+                f"{name:>5}: size={args.size} p50={statistics.median(timings):.2f}ms "
+                f"p99={statistics.quantiles(timings, n=100)[98]:.2f}ms peak={peak / 1024:.0f}KiB"
+            )
+
+    await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=500, help="pages per measurement")
+    parser.add_argument("--size", type=int, default=100, help="todos per page")
+    asyncio.run(main(parser.parse_args()))
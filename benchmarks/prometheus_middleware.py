@@ -0,0 +1,143 @@
+"""Measure the per-request overhead of `PrometheusMiddleware` on an app with many routes.
+
+Builds a FastAPI app with `--routes` parameterised routes and calls it as a plain ASGI app,
+without a server or HTTP client, for requests spread over all routes. Compares the app
+without the middleware, with the middleware matching every request against all routes
+(`route_cache_size=0`), with the default route template cache and without the in-progress
+gauge. `labels` times the metric updates of one request through `.labels()` lookups and
+through the label children bound by the middleware.
+
+Usage: `ENVIRONMENT=PRODUCTION python -m benchmarks.prometheus_middleware`
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Scope
+
+from todo_api.api.middleware.prometheus import (
+    REQUESTS,
+    REQUESTS_IN_PROGRESS,
+    REQUESTS_PROCESS_TIME,
+    RESPONSES,
+    PrometheusMiddleware,
+    RouteMetrics,
+)
+
+
+def build_app(
+    routes: int, route_cache_size: int | None, track_in_progress: bool = True
+) -> ASGIApp:
+    app = FastAPI()
+    for i in range(routes):
+
+        async def endpoint(item_id: int) -> int:
+            return item_id
+
+        app.add_api_route(f"/resource{i}/{{item_id}}", endpoint, methods=["GET"])
+
+    if route_cache_size is not None:
+        app.add_middleware(
+            PrometheusMiddleware,
+            route_cache_size=route_cache_size,
+            track_in_progress=track_in_progress,
+        )
+    return app
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: Message) -> None:
+    pass
+
+
+def scope(path: str) -> Scope:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "root_path": "",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "server": ("bench", 80),
+    }
+
+
+def update_with_labels(method: str, path: str) -> None:
+    REQUESTS_IN_PROGRESS.labels(method=method, path=path).inc()
+    REQUESTS.labels(method=method, path=path).inc()
+    REQUESTS_PROCESS_TIME.labels(method=method, path=path, status_code="200").observe(0.01)
+    RESPONSES.labels(method=method, path=path, status_code="200").inc()
+    REQUESTS_IN_PROGRESS.labels(method=method, path=path).dec()
+
+
+def update_bound(route_metrics: RouteMetrics) -> None:
+    assert route_metrics.in_progress is not None
+    route_metrics.in_progress.inc()
+    route_metrics.requests.inc()
+    responses, process_time = route_metrics.responses("200")
+    process_time.observe(0.01)
+    responses.inc()
+    route_metrics.in_progress.dec()
+
+
+def time_labels(n: int) -> tuple[float, float]:
+    method, path = "GET", "/resource0/{item_id}"
+    route_metrics = RouteMetrics(method, path)
+
+    start = time.perf_counter()
+    for _ in range(n):
+        update_with_labels(method, path)
+    with_labels = (time.perf_counter() - start) / n * 1_000_000
+
+    start = time.perf_counter()
+    for _ in range(n):
+        update_bound(route_metrics)
+    return with_labels, (time.perf_counter() - start) / n * 1_000_000
+
+
+async def measure(app: ASGIApp, paths: list[str], n: int) -> list[float]:
+    timings: list[float] = []
+    for i in range(n):
+        start = time.perf_counter()
+        await app(scope(paths[i % len(paths)]), receive, send)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+async def main(args: argparse.Namespace) -> None:
+    # 10 ids per route, so the cache holds every path shape of the run
+    paths = [f"/resource{i}/{item_id}" for item_id in range(10) for i in range(args.routes)]
+    with_labels, bound = time_labels(args.n)
+    print(f"        labels: .labels()={with_labels:.2f}us bound={bound:.2f}us")
+
+    apps: tuple[tuple[str, int | None, bool], ...] = (
+        ("no middleware", None, True),
+        ("uncached", 0, True),
+        ("cached", 1024, True),
+        ("no in-progress", 1024, False),
+    )
+    baseline: float | None = None
+    for name, route_cache_size, track_in_progress in apps:
+        app = build_app(args.routes, route_cache_size, track_in_progress)
+        await measure(app, paths, len(paths))
+        p50 = statistics.median(await measure(app, paths, args.n))
+        overhead = "" if baseline is None else f" overhead={p50 - baseline:.1f}us"
+        baseline = p50 if baseline is None else baseline
+        print(f"{name:>14}: routes={args.routes} p50={p50:.1f}us{overhead}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=20_000, help="requests per measurement")
+    parser.add_argument("--routes", type=int, default=60, help="routes in the app")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,111 @@
+"""Compare `TodoService.get_one` with and without `SQLAlchemyModelServiceInstrumentator`.
+
+Times `get_one` uninstrumented and instrumented with a no-op tracer, with a sampler dropping
+every trace (non-recording spans) and with every span recorded, and reports the overhead of
+each over the uninstrumented call. The row is fetched once and replayed from a frozen result
+on every call, the database round trip would otherwise drown the difference.
+
+Usage: `ENVIRONMENT=PRODUCTION DB_DATABASE=todo_api_bench python -m benchmarks.service_instrumentation`
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ALWAYS_ON
+from opentelemetry.trace import NoOpTracerProvider, TracerProvider as TracerProviderABC
+from sqlalchemy import Result, select
+from sqlalchemy.engine import FrozenResult
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from todo_api.core.database.base import (
+    Model,
+    dispose_engines,
+    get_async_engine,
+    get_async_session_maker,
+)
+from todo_api.core.observability.sqlalchemy_model_service import (
+    SQLAlchemyModelServiceInstrumentator,
+)
+from todo_api.todos.models import Todo
+from todo_api.todos.service import TodoService
+from todo_api.users.models import User
+
+TRACER_PROVIDERS: dict[str, TracerProviderABC] = {
+    "no-op tracer": NoOpTracerProvider(),
+    "not sampled": TracerProvider(sampler=ALWAYS_OFF),
+    "recorded": TracerProvider(sampler=ALWAYS_ON),
+}
+
+
+class ReplaySession(AsyncSession):
+    """Session answering every `execute` with the same frozen result"""
+
+    frozen_result: FrozenResult[Any]
+
+    async def execute(self, *args: object, **kwargs: object) -> Result[Any]:
+        return self.frozen_result()
+
+
+async def seed(session: AsyncSession) -> FrozenResult[Any]:
+    async with get_async_engine().begin() as conn:
+        tables = [Model.metadata.tables[model.__tablename__] for model in (User, Todo)]
+        await conn.run_sync(Model.metadata.create_all, tables=tables)
+
+    user = User(username="service_instrumentation", hashed_password="x")
+    session.add(user)
+    await session.flush()
+    todo = Todo(title="todo", user_id=user.id)
+    session.add(todo)
+    await session.commit()
+
+    result = await session.execute(select(Todo).where(Todo.id == todo.id))
+    return result.freeze()
+
+
+async def time_get_one(service: TodoService, n: int) -> list[float]:
+    timings: list[float] = []
+    for _ in range(n):
+        start = time.perf_counter()
+        await service.get_one(id=1)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with get_async_session_maker()() as session:
+        frozen_result = await seed(session)
+    await dispose_engines()
+
+    replay = ReplaySession()
+    replay.frozen_result = frozen_result
+    service = TodoService(replay)
+    instrumentator = SQLAlchemyModelServiceInstrumentator()
+
+    timings: dict[str, list[float]] = {}
+    for name in ("uninstrumented", *TRACER_PROVIDERS):
+        timings[name] = []
+    # Modes take turns in rounds, so that frequency scaling and noise hit them alike
+    for _ in range(args.rounds):
+        timings["uninstrumented"] += await time_get_one(service, args.n // args.rounds)
+        for name, tracer_provider in TRACER_PROVIDERS.items():
+            instrumentator.instrument(tracer_provider=tracer_provider, skip_dep_check=True)
+            try:
+                timings[name] += await time_get_one(service, args.n // args.rounds)
+            finally:
+                instrumentator.uninstrument()
+
+    baseline = statistics.median(timings["uninstrumented"])
+    for name, mode_timings in timings.items():
+        p50 = statistics.median(mode_timings)
+        print(f"{name:>16}: get_one p50={p50:.1f}us overhead={p50 - baseline:+.1f}us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=20000, help="calls per measurement")
+    parser.add_argument("--rounds", type=int, default=10, help="turns taken by each mode")
+    asyncio.run(main(parser.parse_args()))
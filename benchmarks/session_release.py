@@ -0,0 +1,154 @@
+"""Load test `/todos/me` at a fixed pool size, releasing the session before serialization or not.
+
+Runs the app in-process (single event loop, like one granian worker) with `--pool-size`
+connections and no overflow, and `--concurrency` clients requesting pages of `--size` todos
+for `--duration` seconds. Each mode runs in its own process, routes read
+`RELEASE_SESSION_BEFORE_SERIALIZATION` when they are created. Reports the throughput, the
+latency percentiles and how long connections stay checked out per checkout.
+
+Usage:
+`ENVIRONMENT=PRODUCTION OTEL_ENABLED=false DB_DATABASE=todo_api_bench python -m benchmarks.session_release`
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+import httpx
+from asgi_lifespan import LifespanManager
+
+from benchmarks.login_storm import PASSWORD, copy_request_state, login
+from todo_api.auth.models import UserSession
+from todo_api.core.config import settings
+from todo_api.core.database.base import (
+    Model,
+    dispose_engines,
+    get_async_engine,
+    get_async_session_maker,
+)
+from todo_api.core.observability.pool import POOL_HOLD_TIME
+from todo_api.main import create_app
+from todo_api.todos.models import Todo
+from todo_api.users import security
+from todo_api.users.models import User
+
+MODES = {"released": "true", "held": "false"}
+
+
+async def seed(todos: int) -> str:
+    async with get_async_engine().begin() as conn:
+        tables = [Model.metadata.tables[m.__tablename__] for m in (User, UserSession, Todo)]
+        await conn.run_sync(Model.metadata.create_all, tables=tables)
+
+    username = f"release_{uuid.uuid4().hex[:8]}"
+    async with get_async_session_maker()() as session:
+        user = User(username=username, hashed_password=security.get_password_hash(PASSWORD))
+        session.add(user)
+        await session.flush()
+        session.add_all(
+            Todo(title=f"todo {i}", description="x" * 200, user_id=user.id) for i in range(todos)
+        )
+        await session.commit()
+    return username
+
+
+def hold_time() -> tuple[float, float]:
+    """Total seconds connections were checked out, and the number of checkouts"""
+    total = count = 0.0
+    for metric in POOL_HOLD_TIME.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_sum"):
+                total += sample.value
+            elif sample.name.endswith("_count"):
+                count += sample.value
+    return total, count
+
+
+async def request_pages(
+    client: httpx.AsyncClient, token: str, size: int, deadline: float
+) -> list[float]:
+    timings: list[float] = []
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.get(
+            "/api/v1/todos/me",
+            params={"size": size},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return timings
+
+
+async def run(args: argparse.Namespace) -> None:
+    settings.DB_POOL_SIZE = args.pool_size
+    settings.DB_MAX_OVERFLOW = 0
+    username = await seed(args.size)
+    await dispose_engines()
+
+    app = create_app()
+    async with LifespanManager(copy_request_state(app)) as manager:
+        transport = httpx.ASGITransport(app=manager.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            token = await login(client, username)
+            # Warm up the pool and the statement caches
+            await request_pages(client, token, args.size, time.perf_counter() + 1)
+
+            hold_before = hold_time()
+            start = time.perf_counter()
+            deadline = start + args.duration
+            results = await asyncio.gather(
+                *(
+                    request_pages(client, token, args.size, deadline)
+                    for _ in range(args.concurrency)
+                )
+            )
+            elapsed = time.perf_counter() - start
+            hold_after = hold_time()
+
+    await dispose_engines()
+
+    timings = [timing for result in results for timing in result]
+    percentiles = statistics.quantiles(timings, n=100)
+    hold_per_checkout = (hold_after[0] - hold_before[0]) / (hold_after[1] - hold_before[1])
+    print(
+        f"{args.mode:>8}: {len(timings) / elapsed:.0f} req/s p50={percentiles[49]:.2f}ms "
+        f"p99={percentiles[98]:.2f}ms hold={hold_per_checkout * 1000:.2f}ms/checkout"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(
+        f"pool_size={args.pool_size} concurrency={args.concurrency} size={args.size} "
+        f"duration={args.duration}s"
+    )
+    # Modes take turns in rounds, so that noise hits them alike
+    for _ in range(args.rounds):
+        for mode, release in MODES.items():
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-m",
+                "benchmarks.session_release",
+                *sys.argv[1:],
+                "--mode",
+                mode,
+                env=os.environ | {"RELEASE_SESSION_BEFORE_SERIALIZATION": release},
+            )
+            if await process.wait():
+                raise SystemExit(process.returncode)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pool-size", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=20, help="clients in flight")
+    parser.add_argument("--size", type=int, default=100, help="todos per page")
+    parser.add_argument("--duration", type=float, default=5.0, help="load duration (s)")
+    parser.add_argument("--rounds", type=int, default=3, help="turns taken by each mode")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    asyncio.run(run(args) if args.mode else main(args))
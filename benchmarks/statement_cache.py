@@ -0,0 +1,114 @@
+# pyright: reportPrivateUsage=false
+"""Compare building statements from kwargs on every call with reusing cached statement shapes.
+
+`construct` times building the `/todos/me` page statement and its SQLAlchemy cache key,
+the work done on every call before the compiled SQL is found in the compiled cache.
+`round trip` times `TodoService.list_and_count` and `get_one` against the database, where
+psycopg also prepares the repeated SQL server-side after `DB_PREPARE_THRESHOLD` executions.
+
+Usage: `ENVIRONMENT=PRODUCTION DB_DATABASE=todo_api_bench python -m benchmarks.statement_cache`
+Run with `DB_PREPARED_STATEMENTS=false` to compare against unprepared statements.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from todo_api.core.database.base import (
+    Model,
+    dispose_engines,
+    get_async_engine,
+    get_async_session_maker,
+)
+from todo_api.core.database.service import OrderBy
+from todo_api.todos.models import Todo
+from todo_api.todos.service import TodoService
+from todo_api.users.models import User
+
+PAGE_KWARGS: dict[str, Any] = {
+    "user_id": 1,
+    "offset": 0,
+    "limit": 20,
+    "order_by": OrderBy(field="created_at", order="desc"),
+}
+
+
+def build_from_kwargs(service: TodoService) -> Select[Any]:
+    stmt = service._get_statement()
+    stmt = service._where_from_kwargs(stmt, **PAGE_KWARGS)
+    stmt = service._paginate_from_kwargs(stmt, **PAGE_KWARGS)
+    return service._order_by_from_kwargs(stmt, **PAGE_KWARGS)
+
+
+def build_shaped(service: TodoService) -> Select[Any]:
+    shaped = service._shaped_statement("select", **PAGE_KWARGS)
+    assert shaped is not None
+    return shaped[0]
+
+
+def time_construct(
+    build: Callable[[TodoService], Select[Any]], service: TodoService, n: int
+) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        build(service)._generate_cache_key()
+    return (time.perf_counter() - start) / n * 1_000_000
+
+
+async def time_round_trip(call: Callable[[], Awaitable[Any]], n: int) -> list[float]:
+    timings: list[float] = []
+    for _ in range(n):
+        start = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+async def seed(session: AsyncSession) -> tuple[int, int]:
+    async with get_async_engine().begin() as conn:
+        tables = [Model.metadata.tables[model.__tablename__] for model in (User, Todo)]
+        await conn.run_sync(Model.metadata.create_all, tables=tables)
+
+    user = User(username="statement_cache", hashed_password="x")
+    session.add(user)
+    await session.flush()
+    todos = [Todo(title=f"todo {i}", user_id=user.id) for i in range(50)]
+    session.add_all(todos)
+    await session.commit()
+    return user.id, todos[0].id
+
+
+async def main(args: argparse.Namespace) -> None:
+    service = TodoService(AsyncSession())
+    uncached = time_construct(build_from_kwargs, service, args.n)
+    cached = time_construct(build_shaped, service, args.n)
+    print(f"   construct: from kwargs={uncached:.1f}us shaped={cached:.1f}us")
+
+    async with get_async_session_maker()() as session:
+        user_id, todo_id = await seed(session)
+        service = TodoService(session)
+        kwargs: dict[str, Any] = {**PAGE_KWARGS, "user_id": user_id}
+
+        for statement_cache in (False, True):
+            TodoService.statement_cache = statement_cache
+            list_timings = await time_round_trip(lambda: service.list_and_count(**kwargs), args.n)
+            get_timings = await time_round_trip(lambda: service.get_one(id=todo_id), args.n)
+            print(
+                f"  round trip: statement_cache={statement_cache!s:<5} "
+                f"list_and_count p50={statistics.median(list_timings):.0f}us "
+                f"get_one p50={statistics.median(get_timings):.0f}us"
+            )
+
+    await dispose_engines()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=2000, help="calls per measurement")
+    asyncio.run(main(parser.parse_args()))
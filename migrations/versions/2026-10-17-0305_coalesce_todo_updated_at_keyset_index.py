@@ -0,0 +1,40 @@
+"""Seek todos by updated_at falling back to created_at
+
+Revision ID: 8c4e1a7d2b63
+Revises: 5f2b8d3e9a41
+Create Date: 2026-10-17 03:05:12.482913
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4e1a7d2b63"
+down_revision: str | None = "5f2b8d3e9a41"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f("ix_todo_user_id_todo_updated_at_todo_id"), table_name="todo")
+    op.create_index(
+        "ix_todo_user_id_todo_coalesce_updated_at_todo_id",
+        "todo",
+        ["user_id", sa.text("coalesce(updated_at, created_at)"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_todo_user_id_todo_coalesce_updated_at_todo_id", table_name="todo")
+    op.create_index(
+        op.f("ix_todo_user_id_todo_updated_at_todo_id"),
+        "todo",
+        ["user_id", "updated_at", "id"],
+        unique=False,
+    )
@@ -0,0 +1,131 @@
+from collections.abc import Iterator
+from datetime import timedelta
+
+import httpx
+import pytest
+from fastapi import status
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.fixtures.auth import AuthenticateAs
+from tests.fixtures.database import SaveModel
+from todo_api.auth.cache import CachedSession, SessionCache, session_cache
+from todo_api.auth.models import UserSession
+from todo_api.auth.service import UserSessionService
+from todo_api.users.models import User
+from todo_api.users.security import get_password_hash
+from todo_api.utils import utc_now
+
+TEST_USERNAME = "testuser"
+TEST_PASSWORD = "testpassword"
+
+
+@pytest.fixture(autouse=True)
+def clear_session_cache() -> Iterator[None]:
+    session_cache.clear()
+    yield
+    session_cache.clear()
+
+
+def _cached_session(*, expires_in: timedelta = timedelta(hours=1)) -> CachedSession:
+    return CachedSession(user_id=1, username="user", expires_at=utc_now() + expires_in)
+
+
+def test_session_cache_get_set():
+    cache = SessionCache(max_size=10, ttl=60)
+    cached_session = _cached_session()
+
+    assert cache.get("token") is None
+    cache.set("token", cached_session)
+
+    assert cache.get("token") == cached_session
+    assert cache.get("other") is None
+
+
+def test_session_cache_keys_are_token_hashes():
+    cache = SessionCache(max_size=10, ttl=60)
+    cache.set("token", _cached_session())
+
+    assert "token" not in cache._entries  # pyright: ignore[reportPrivateUsage]
+
+
+def test_session_cache_evicts_least_recently_used():
+    cache = SessionCache(max_size=2, ttl=60)
+    cache.set("a", _cached_session())
+    cache.set("b", _cached_session())
+    assert cache.get("a") is not None
+
+    cache.set("c", _cached_session())
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_session_cache_respects_ttl():
+    cache = SessionCache(max_size=10, ttl=0)
+    cache.set("token", _cached_session())
+
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_session_cache_respects_session_expires_at():
+    cache = SessionCache(max_size=10, ttl=60)
+    cache.set("token", _cached_session(expires_in=-timedelta(seconds=1)))
+
+    assert cache.get("token") is None
+
+
+def test_session_cache_invalidate():
+    cache = SessionCache(max_size=10, ttl=60)
+    cache.set("token", _cached_session())
+
+    cache.invalidate("token")
+    cache.invalidate("missing")
+
+    assert cache.get("token") is None
+
+
+@pytest.mark.auth(AuthenticateAs(type_="dont_override"))
+async def test_session_lookup_is_cached(
+    client: httpx.AsyncClient, session: AsyncSession, save_model_fixture: SaveModel
+):
+    user = User(username=TEST_USERNAME, hashed_password=get_password_hash(TEST_PASSWORD))
+    await save_model_fixture(user)
+    user_session = UserSession(user_id=user.id, expires_at=utc_now() + timedelta(hours=1))
+    await save_model_fixture(user_session)
+    headers = {"Authorization": f"Bearer {user_session.session_token}"}
+
+    response = await client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(session_cache) == 1
+
+    # Bulk delete bypasses ORM events, the cached session is still served
+    await session.execute(delete(UserSession))
+    await session.commit()
+
+    response = await client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"id": user.id, "username": TEST_USERNAME}
+
+
+@pytest.mark.auth(AuthenticateAs(type_="dont_override"))
+async def test_session_delete_invalidates_cache(
+    client: httpx.AsyncClient, session: AsyncSession, save_model_fixture: SaveModel
+):
+    user = User(username=TEST_USERNAME, hashed_password=get_password_hash(TEST_PASSWORD))
+    await save_model_fixture(user)
+    user_session = UserSession(user_id=user.id, expires_at=utc_now() + timedelta(hours=1))
+    await save_model_fixture(user_session)
+    headers = {"Authorization": f"Bearer {user_session.session_token}"}
+
+    response = await client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    await UserSessionService(session).delete(user_session.id, auto_commit=True)
+
+    assert len(session_cache) == 0
+    response = await client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
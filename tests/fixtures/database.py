@@ -1,10 +1,11 @@
 # pyright: reportUnknownVariableType=false, reportMissingTypeStubs=false
 import os
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Callable, Coroutine, Generator, Iterator
+from contextlib import AbstractContextManager, asynccontextmanager, contextmanager
 from typing import Any
 from uuid import uuid4
 
+import pytest
 import pytest_asyncio
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import URL, Connection
@@ -12,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engin
 
 from todo_api.core.config import settings
 from todo_api.core.database.base import Model
+from todo_api.core.database.query_counter import QueryCounter, count_queries
 
 
 def _build_postgres_dsn(database_name: str) -> str:
@@ -95,9 +97,8 @@ async def template_database() -> AsyncGenerator[str]:
         _drop_database(template_database_name)
 
 
-@pytest_asyncio.fixture
-async def engine(template_database: str) -> AsyncGenerator[AsyncEngine]:
-    """Create a fresh cloned database and async engine"""
+@asynccontextmanager
+async def _cloned_database_engine(template_database: str) -> AsyncGenerator[AsyncEngine]:
     worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
     database_name = f"test_db_{worker_id}_{uuid4().hex}".lower()
 
@@ -111,6 +112,20 @@ async def engine(template_database: str) -> AsyncGenerator[AsyncEngine]:
         _drop_database(database_name)
 
 
+@pytest_asyncio.fixture
+async def engine(template_database: str) -> AsyncGenerator[AsyncEngine]:
+    """Create a fresh cloned database and async engine"""
+    async with _cloned_database_engine(template_database) as test_engine:
+        yield test_engine
+
+
+@pytest_asyncio.fixture
+async def replica_engine(template_database: str) -> AsyncGenerator[AsyncEngine]:
+    """Second cloned database standing in for a read replica of `engine`"""
+    async with _cloned_database_engine(template_database) as test_engine:
+        yield test_engine
+
+
 @pytest_asyncio.fixture
 async def session(engine: AsyncEngine) -> AsyncGenerator[AsyncSession]:
     """Provide a session bound to the test's dedicated cloned database"""
@@ -138,6 +153,31 @@ async def save_model_fixture(session: AsyncSession) -> SaveModel:
     return _save_model_fixture_factory(session)
 
 
+AssertMaxQueries = Callable[[int], AbstractContextManager[QueryCounter]]
+
+
+@pytest.fixture
+def assert_max_queries() -> AssertMaxQueries:
+    """Fail when the block executes more than `n` queries, e.g. lazy loads in a loop
+
+    Usage:
+        with assert_max_queries(2):
+            await client.get("/api/v1/todos/me")
+    """
+
+    @contextmanager
+    def _assert_max_queries(n: int) -> Generator[QueryCounter]:
+        with count_queries() as counter:
+            yield counter
+
+        statements = "\n".join(counter.statements)
+        assert counter.count <= n, (
+            f"{counter.count} queries executed, expected at most {n}:\n{statements}"
+        )
+
+    return _assert_max_queries
+
+
 @pytest_asyncio.fixture
 async def seed_db(engine: AsyncEngine) -> AsyncGenerator[None]:
     async with engine.begin() as conn:
@@ -0,0 +1,14 @@
+from todo_api.core.database.base import dispose_engines, get_async_engine, get_engine
+
+
+async def test_dispose_engines_disposes_only_created_engines():
+    await dispose_engines()
+    async_engine = get_async_engine()
+    assert get_async_engine() is async_engine
+
+    await dispose_engines()
+
+    assert get_engine.cache_info().currsize == 0
+    assert get_async_engine.cache_info().currsize == 0
+    assert get_async_engine() is not async_engine
+    await dispose_engines()
@@ -0,0 +1,93 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from prometheus_client import CollectorRegistry, multiprocess
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
+
+from todo_api.core.observability.multiprocess import (
+    MultiProcessScrape,
+    compact_dead_workers,
+    compact_worker_files,
+)
+
+# Above the Linux pid_max, so never a running process
+DEAD_PID = 4_194_305
+
+
+def _write_counter(path: Path, pid: int, value: float) -> None:
+    values = MmapedDict(str(path / f"counter_{pid}.db"))
+    key = mmap_key("requests", "requests_total", ["path"], ["/items"], "Requests")
+    values.write_value(key, value, 0)  # pyright: ignore[reportUnknownMemberType]
+    values.close()
+
+
+def _write_live_gauge(path: Path, pid: int, value: float, mode: str = "livesum") -> None:
+    values = MmapedDict(str(path / f"gauge_{mode}_{pid}.db"))
+    key = mmap_key("in_progress", "in_progress", [], [], "In progress")
+    values.write_value(key, value, 0)  # pyright: ignore[reportUnknownMemberType]
+    values.close()
+
+
+def _collect(path: Path) -> dict[str, float]:
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, str(path))
+    return {
+        sample.name: sample.value for metric in registry.collect() for sample in metric.samples
+    }
+
+
+def test_compact_worker_files_keeps_totals(tmp_path: Path):
+    for pid, value in ((1, 2), (2, 3), (3, 5)):
+        _write_counter(tmp_path, pid, value)
+    assert _collect(tmp_path) == {"requests_total": 10}
+
+    compact_worker_files(str(tmp_path), 1)
+    compact_worker_files(str(tmp_path), 2)
+
+    assert sorted(p.name for p in tmp_path.glob("*.db")) == ["counter_3.db", "counter_archive.db"]
+    assert _collect(tmp_path) == {"requests_total": 10}
+
+
+def test_compact_dead_workers(tmp_path: Path):
+    alive_pid = os.getpid()
+    _write_counter(tmp_path, alive_pid, 1)
+    _write_counter(tmp_path, DEAD_PID, 2)
+    _write_live_gauge(tmp_path, alive_pid, 3)
+    _write_live_gauge(tmp_path, DEAD_PID, 4)
+    _write_live_gauge(tmp_path, DEAD_PID, 5, mode="all")
+
+    compact_dead_workers(str(tmp_path))
+
+    assert sorted(p.name for p in tmp_path.glob("*.db")) == sorted(
+        ["counter_archive.db", f"counter_{alive_pid}.db", f"gauge_livesum_{alive_pid}.db"]
+    )
+    assert _collect(tmp_path) == {"requests_total": 3, "in_progress": 3}
+
+
+def test_compact_dead_workers_concurrently(tmp_path: Path):
+    for pid in range(DEAD_PID, DEAD_PID + 20):
+        _write_counter(tmp_path, pid, 1)
+        _write_live_gauge(tmp_path, pid, 1)
+
+    # Workers starting together each compact the same dead workers
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(compact_dead_workers, str(tmp_path)) for _ in range(4)]:
+            future.result()
+
+    assert [p.name for p in tmp_path.glob("*.db")] == ["counter_archive.db"]
+    assert _collect(tmp_path) == {"requests_total": 20}
+
+
+async def test_multiprocess_scrape_caches_within_ttl(tmp_path: Path):
+    _write_counter(tmp_path, 1, 1)
+    scrape = MultiProcessScrape(str(tmp_path), ttl=60)
+
+    body = await scrape.generate()
+    assert b'requests_total{path="/items"} 1.0' in body
+
+    _write_counter(tmp_path, 2, 1)
+    assert await scrape.generate() is body
+
+    uncached = MultiProcessScrape(str(tmp_path), ttl=0)
+    assert b'requests_total{path="/items"} 2.0' in await uncached.generate()
@@ -1,4 +1,5 @@
 import json
+from typing import Any
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncEngine
@@ -215,3 +216,193 @@ async def test_sqlalchemy_service_instrumentation_creates_spans(engine: AsyncEng
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
         SQLAlchemyServiceInstrumentator().uninstrument()
+
+
+def test_sqlalchemy_model_service_bulk_method_attributes():
+    from unittest.mock import Mock
+
+    from todo_api.core.observability.sqlalchemy_model_service import (
+        _build_attribute_extractor,  # pyright: ignore[reportPrivateUsage]
+    )
+
+    service = Mock()
+    service.model.__name__ = "Todo"
+
+    attrs = _build_attribute_extractor("create_many")(service, ([object(), object()],), {})
+    assert attrs == {"model_type": "Todo", "record_count": 2}
+
+    attrs = _build_attribute_extractor("delete_many")(service, (), {"ids": [1, 2, 3]})
+    assert attrs == {"model_type": "Todo", "record_count": 3}
+
+    attrs = _build_attribute_extractor("delete")(service, (7,), {"auto_commit": False})
+    assert attrs == {"model_type": "Todo", "record_id": "7", "auto_commit": False}
+
+    attrs = _build_attribute_extractor("count")(service, (object(),), {"id": 1})
+    assert attrs == {"model_type": "Todo", "record_id": "1"}
+
+
+async def test_sqlalchemy_model_service_attributes_do_not_load_expired_instances(
+    engine: AsyncEngine,
+):
+    """Test that reading the record id of an expired instance emits no SQL"""
+    from sqlalchemy import MetaData, event
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlalchemy.orm import Mapped, declarative_base, mapped_column
+
+    from todo_api.core.database.service import SQLAlchemyModelService
+    from todo_api.core.observability.sqlalchemy_model_service import (
+        _build_attribute_extractor,  # pyright: ignore[reportPrivateUsage]
+    )
+
+    metadata = MetaData()
+    Base = declarative_base(metadata=metadata)
+
+    class ExpiredModel(Base):
+        __tablename__ = "test_expired_otel"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str] = mapped_column()
+
+    class ExpiredService(SQLAlchemyModelService[ExpiredModel, int]):
+        model = ExpiredModel
+
+    statements: list[str] = []
+
+    def before_cursor_execute(_conn: object, _cursor: object, statement: str, *_: object) -> None:
+        statements.append(statement)
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with async_sessionmaker(engine)() as session:
+            instance = ExpiredModel(id=5, name="expired")
+            session.add(instance)
+            await session.commit()
+
+            event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+            try:
+                extract = _build_attribute_extractor("update")
+                attrs = extract(ExpiredService(session), (instance,), {})
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+            assert attrs == {"model_type": "ExpiredModel", "record_id": "5"}
+            assert statements == []
+            assert "name" not in instance.__dict__
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+
+
+async def test_otel_metrics_middleware_records_request_metrics():
+    """Test that request metrics are recorded by route template with OpenTelemetry"""
+    import httpx
+    from fastapi import FastAPI
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+    from todo_api.api.middleware.otel_metrics import OpenTelemetryMetricsMiddleware
+
+    reader = InMemoryMetricReader()
+    app = FastAPI()
+    app.add_middleware(
+        OpenTelemetryMetricsMiddleware, meter_provider=MeterProvider(metric_readers=[reader])
+    )
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):  # pyright: ignore[reportUnusedFunction]
+        return {"id": item_id}
+
+    @app.get("/fail")
+    async def fail():  # pyright: ignore[reportUnusedFunction]
+        raise RuntimeError
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get("/items/1")).status_code == 200
+        assert (await client.get("/items/2")).status_code == 200
+        assert (await client.get("/fail")).status_code == 500
+
+    metrics_data = reader.get_metrics_data()
+    assert metrics_data is not None
+    points: dict[str, dict[tuple[tuple[str, Any], ...], Any]] = {
+        metric.name: {
+            tuple(sorted((point.attributes or {}).items())): point
+            for point in metric.data.data_points
+        }
+        for resource_metrics in metrics_data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+    item_route = (("http.request.method", "GET"), ("http.route", "/items/{item_id}"))
+    item_ok = tuple(sorted((*item_route, ("http.response.status_code", 200))))
+    assert points["todo_api.requests"][item_route].value == 2
+    assert points["todo_api.responses"][item_ok].value == 2
+    assert points["todo_api.request.duration"][item_ok].count == 2
+
+    fail_route = (("http.request.method", "GET"), ("http.route", "/fail"))
+    fail_error = tuple(sorted((*fail_route, ("error.type", "RuntimeError"))))
+    assert points["todo_api.exceptions"][fail_error].value == 1
+    assert (
+        tuple(sorted((*fail_route, ("http.response.status_code", 500))))
+        not in (points["todo_api.request.duration"])
+    )
+
+
+def test_route_rate_sampler_budgets_each_route():
+    from opentelemetry.sdk.trace.sampling import Decision
+
+    from todo_api.core.observability.sampling import RouteRateSampler
+
+    sampler = RouteRateSampler(rate=2)
+
+    def decide(route: str) -> Decision:
+        return sampler.should_sample(None, 1, "GET", attributes={"http.route": route}).decision
+
+    assert [decide("/todos") for _ in range(3)] == [
+        Decision.RECORD_AND_SAMPLE,
+        Decision.RECORD_AND_SAMPLE,
+        Decision.RECORD_ONLY,
+    ]
+    assert decide("/users") == Decision.RECORD_AND_SAMPLE
+
+
+def test_tail_sampling_keeps_failed_and_slow_traces():
+    import time
+
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.trace import Status, StatusCode
+
+    from todo_api.core.observability.sampling import TailSamplingSpanProcessor, adaptive_sampler
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider(sampler=adaptive_sampler(rate=1))
+    provider.add_span_processor(
+        TailSamplingSpanProcessor(SimpleSpanProcessor(exporter), latency_threshold=0.05)
+    )
+    tracer = provider.get_tracer(__name__)
+    route = {"http.route": "/todos"}
+
+    # Within the route budget
+    with tracer.start_as_current_span("sampled", attributes=route):
+        pass
+    # Over the budget, fast and successful
+    with (
+        tracer.start_as_current_span("dropped", attributes=route),
+        tracer.start_as_current_span("dropped_child"),
+    ):
+        pass
+    # Over the budget, with a failed child span
+    with tracer.start_as_current_span("failed", attributes=route):
+        with tracer.start_as_current_span("failed_child") as child:
+            child.set_status(Status(StatusCode.ERROR))
+    # Over the budget, slow
+    with tracer.start_as_current_span("slow", attributes=route):
+        time.sleep(0.06)
+
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["sampled", "failed_child", "failed", "slow"]
+    assert all(span.context is not None and span.context.trace_flags.sampled for span in spans)
@@ -1,4 +1,9 @@
+from datetime import UTC, datetime
+
+import pytest
+
 from todo_api.api import pagination
+from todo_api.core.database.service import DEFAULT_COUNT_CAP, CountStrategy, Keyset, OrderBy
 
 
 def test_paginated_calculates_pages():
@@ -12,3 +17,51 @@ def test_paginated_calculates_pages():
     assert paginated.size == 100
     assert paginated.pages == 10
     assert paginated.total == 1000
+
+
+def test_cursor_round_trip():
+    order_by = OrderBy(field="created_at", order="desc")
+    keyset = Keyset(value=datetime(2025, 1, 1, 12, 30, tzinfo=UTC), id=42)
+
+    cursor = pagination.encode_cursor(keyset, order_by)
+
+    assert pagination.decode_cursor(cursor, order_by) == keyset
+
+
+def test_cursor_tampered():
+    order_by = OrderBy(field="id", order="asc")
+    cursor = pagination.encode_cursor(Keyset(value=1, id=1), order_by)
+    payload, signature = cursor.split(".")
+    forged_payload = pagination.encode_cursor(Keyset(value=1000, id=1000), order_by).split(".")[0]
+
+    for invalid_cursor in ("", "not-a-cursor", f"{forged_payload}.{signature}", f"{payload}.x"):
+        with pytest.raises(pagination.PaginationError):
+            pagination.decode_cursor(invalid_cursor, order_by)
+
+
+def test_cursor_different_order_by():
+    cursor = pagination.encode_cursor(Keyset(value=1, id=1), None)
+
+    with pytest.raises(pagination.PaginationError):
+        pagination.decode_cursor(cursor, OrderBy(field="created_at", order="asc"))
+
+
+def test_paginated_without_total():
+    paginated = pagination.Paginated[int].model_validate(
+        {"items": [1, 2], "page": 1, "size": 2, "total": None}
+    )
+
+    assert paginated.total is None
+    assert paginated.pages is None
+    assert paginated.approximate_total is False
+
+
+def test_pagination_params_approximate_total():
+    exact = pagination.PaginationParams(page=1, size=10)
+    estimate = pagination.PaginationParams(page=1, size=10, count_strategy=CountStrategy.ESTIMATE)
+    capped = pagination.PaginationParams(page=1, size=10, count_strategy=CountStrategy.CAPPED)
+
+    assert exact.is_total_approximate(DEFAULT_COUNT_CAP) is False
+    assert estimate.is_total_approximate(5) is True
+    assert capped.is_total_approximate(5) is False
+    assert capped.is_total_approximate(DEFAULT_COUNT_CAP) is True
@@ -0,0 +1,31 @@
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from todo_api.core.database.base import create_async_engine
+
+
+def _sample(name: str) -> float | None:
+    return REGISTRY.get_sample_value(name, {"pool": "async"})
+
+
+async def test_pool_metrics(engine: AsyncEngine):
+    pool_engine = create_async_engine(
+        dsn=engine.url.render_as_string(hide_password=False), pool_size=1, max_overflow=1
+    )
+    wait_count_before = _sample("todo_api_db_pool_wait_seconds_count") or 0
+    hold_count_before = _sample("todo_api_db_pool_hold_seconds_count") or 0
+
+    try:
+        async with pool_engine.connect() as conn1, pool_engine.connect() as conn2:
+            await conn1.execute(text("SELECT 1"))
+            await conn2.execute(text("SELECT 1"))
+
+            assert _sample("todo_api_db_pool_checked_out") == 2
+            assert _sample("todo_api_db_pool_overflow") == 1
+
+        assert _sample("todo_api_db_pool_checked_out") == 0
+        assert _sample("todo_api_db_pool_wait_seconds_count") == wait_count_before + 2
+        assert _sample("todo_api_db_pool_hold_seconds_count") == hold_count_before + 2
+    finally:
+        await pool_engine.dispose()
@@ -0,0 +1,71 @@
+import httpx
+from asgi_lifespan import LifespanManager
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+
+from todo_api.api.middleware.prometheus import PrometheusMiddleware
+
+
+def _create_app(*, track_in_progress: bool = True) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> int:  # pyright: ignore[reportUnusedFunction]
+        return item_id
+
+    @app.post("/items")
+    async def create_item() -> None:  # pyright: ignore[reportUnusedFunction]
+        return None
+
+    app.add_middleware(
+        PrometheusMiddleware, route_cache_size=2, track_in_progress=track_in_progress
+    )
+    return app
+
+
+def _get_middleware(app: FastAPI) -> PrometheusMiddleware:
+    middleware = app.middleware_stack
+    while not isinstance(middleware, PrometheusMiddleware):
+        middleware = middleware.app  # type: ignore
+    return middleware
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+async def test_prometheus_middleware_labels_by_cached_route_template():
+    app = _create_app()
+    before = _sample("todo_api_requests_total", method="GET", path="/items/{item_id}")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for path in ("/items/1", "/items/1", "/items/2"):
+            assert (await client.get(path)).status_code == 200
+        assert (await client.get("/items")).status_code == 405
+        assert (await client.get("/missing")).status_code == 404
+
+    assert _sample("todo_api_requests_total", method="GET", path="/items/{item_id}") == before + 3
+    assert _sample("todo_api_requests_total", method="GET", path="/items") >= 1
+    assert _sample("todo_api_requests_total", method="GET", path="/missing") >= 1
+    assert _sample(
+        "todo_api_responses_total", method="GET", path="/items/{item_id}", status_code="200"
+    ) == _sample(
+        "todo_api_requests_process_time_seconds_count",
+        method="GET",
+        path="/items/{item_id}",
+        status_code="200",
+    )
+
+    cache_info = _get_middleware(app)._resolve_route_metrics.cache_info()  # pyright: ignore[reportPrivateUsage]
+    assert cache_info.hits == 1
+    assert cache_info.currsize == 2
+
+
+async def test_prometheus_middleware_binds_routes_at_startup():
+    app = _create_app(track_in_progress=False)
+
+    async with LifespanManager(app):
+        route_metrics = _get_middleware(app)._route_metrics  # pyright: ignore[reportPrivateUsage]
+        assert {("GET", "/items/{item_id}"), ("POST", "/items")} <= set(route_metrics)
+        assert all(metrics.in_progress is None for metrics in route_metrics.values())
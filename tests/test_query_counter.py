@@ -0,0 +1,64 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from structlog.testing import capture_logs
+
+from tests.fixtures.database import AssertMaxQueries
+from todo_api.api.middleware.query_budget import QueryBudgetMiddleware
+from todo_api.core.database.query_counter import count_queries
+
+
+async def test_count_queries_nested(engine: AsyncEngine):
+    async with engine.connect() as conn:
+        with count_queries() as outer:
+            await conn.execute(text("SELECT 1"))
+            with count_queries() as inner:
+                await conn.execute(text("SELECT 2"))
+            await conn.execute(text("SELECT 3"))
+        await conn.execute(text("SELECT 4"))
+
+    assert outer.count == 3
+    assert inner.count == 1
+    assert inner.statements == ["SELECT 2"]
+
+
+async def test_assert_max_queries(engine: AsyncEngine, assert_max_queries: AssertMaxQueries):
+    async with engine.connect() as conn:
+        with assert_max_queries(2):
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+
+        with pytest.raises(AssertionError, match="3 queries executed, expected at most 2"):
+            with assert_max_queries(2):
+                for i in range(3):
+                    await conn.execute(text(f"SELECT {i}"))
+
+
+async def test_query_budget_middleware_warns(engine: AsyncEngine):
+    app = FastAPI()
+
+    @app.get("/todos/{id}")
+    async def n_plus_one(id: int) -> dict[str, int]:  # pyright: ignore[reportUnusedFunction]
+        async with engine.connect() as conn:
+            for i in range(id):
+                await conn.execute(text(f"SELECT {i}"))
+        return {}
+
+    transport = httpx.ASGITransport(app=QueryBudgetMiddleware(app, budget=2))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        with capture_logs() as logs:
+            await client.get("/todos/2")
+            await client.get("/todos/3")
+
+    assert logs == [
+        {
+            "event": "Request exceeded its query budget",
+            "log_level": "warning",
+            "queries": 3,
+            "budget": 2,
+            "route": "/todos/{id}",
+            "repeated": [{"statement": "SELECT ?", "count": 3}],
+        }
+    ]
@@ -0,0 +1,97 @@
+import httpx
+from fastapi import status
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from todo_api.core.observability.queries import (
+    QueryStats,
+    current_service_method,
+    fingerprint,
+    query_stats,
+)
+
+
+def test_fingerprint_normalizes_statement_shape():
+    statement_id, shape = fingerprint(
+        "SELECT todos.id FROM todos\n  WHERE todos.user_id = %(user_id_1)s "
+        "AND todos.title = 'it''s' AND todos.id IN (%(id_1_1)s::INTEGER, %(id_1_2)s::INTEGER) "
+        "LIMIT 20"
+    )
+    assert shape == (
+        "SELECT todos.id FROM todos WHERE todos.user_id = ? AND todos.title = ? "
+        "AND todos.id IN (?, ...) LIMIT ?"
+    )
+
+    other_id, _ = fingerprint(
+        "SELECT todos.id FROM todos WHERE todos.user_id = %(user_id_1)s "
+        "AND todos.title = 'x' AND todos.id IN (%(id_1_1)s) LIMIT 50"
+    )
+    assert other_id == statement_id
+
+    _, shape = fingerprint("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)")
+    assert shape == "INSERT INTO t (a, b) VALUES (?, ?), ..."
+
+
+async def test_query_stats_by_statement_and_service_method(engine: AsyncEngine):
+    stats = QueryStats()
+    stats.track(engine.sync_engine)
+
+    token = current_service_method.set("TodoService.list")
+    try:
+        async with engine.connect() as conn:
+            for i in range(3):
+                await conn.execute(text(f"SELECT generate_series(1, {i + 1})"))
+    finally:
+        current_service_method.reset(token)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    shapes = {
+        (shape.statement, shape.service_method): shape for shape in stats.top(order_by="count")
+    }
+    series = shapes["SELECT generate_series(?, ?)", "TodoService.list"]
+    assert series.count == 3
+    assert series.rows == 1 + 2 + 3
+    assert 0 < series.max_time <= series.total_time
+    assert shapes["SELECT ?", "none"].count == 1
+
+    labels = {"service_method": "TodoService.list", "statement": series.statement_id}
+    assert REGISTRY.get_sample_value("todo_api_db_query_duration_seconds_count", labels) == 3
+    assert REGISTRY.get_sample_value("todo_api_db_query_rows_sum", labels) == 6
+
+
+def test_query_stats_shapes_are_bounded():
+    stats = QueryStats(max_shapes=2)
+    for table in ("a", "b", "c", "d"):
+        stats.record(f"SELECT * FROM {table}", 0.01, 1)
+
+    assert sorted(shape.statement for shape in stats.top()) == [
+        "SELECT * FROM a",
+        "SELECT * FROM b",
+        "other",
+    ]
+    assert stats.top(1, "count")[0].count == 2
+
+
+async def test_debug_queries_lists_slowest_shapes(client: httpx.AsyncClient):
+    query_stats.reset()
+    query_stats.record("SELECT * FROM todos WHERE id = %(id_1)s", 0.5, 1, "TodoService.get_one")
+    query_stats.record("SELECT * FROM users", 0.1, 10, "UserService.list")
+
+    response = await client.get("/api/v1/debug/queries", params={"limit": 1})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {
+            "statementId": fingerprint("SELECT * FROM todos WHERE id = ?")[0],
+            "statement": "SELECT * FROM todos WHERE id = ?",
+            "serviceMethod": "TodoService.get_one",
+            "count": 1,
+            "totalTime": 0.5,
+            "meanTime": 0.5,
+            "maxTime": 0.5,
+            "rows": 1,
+        }
+    ]
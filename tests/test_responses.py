@@ -0,0 +1,65 @@
+import math
+from datetime import UTC, datetime
+
+import httpx
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse as StdlibJSONResponse
+
+from todo_api.api.responses import JSONResponse, JSONRoute, SerializedJSON
+from todo_api.api.schemas.base import BaseSchema
+
+
+class Item(BaseSchema):
+    item_id: int
+    created_at: datetime
+    note: str | None = None
+
+
+ITEM: dict[str, object] = {
+    "item_id": 1,
+    "created_at": datetime(2024, 1, 1, tzinfo=UTC),
+    "secret": "x",
+}
+
+
+def _create_app(default_response_class: type[StdlibJSONResponse]) -> FastAPI:
+    app = FastAPI(default_response_class=default_response_class)
+    router = APIRouter(route_class=JSONRoute)
+
+    @router.get("/item", response_model=Item, response_model_exclude_none=True)
+    async def get_item() -> dict[str, object]:  # pyright: ignore[reportUnusedFunction]
+        return ITEM
+
+    @router.get("/items", response_model=list[Item])
+    async def get_items() -> list[dict[str, object]]:  # pyright: ignore[reportUnusedFunction]
+        return [ITEM, ITEM]
+
+    app.include_router(router)
+    return app
+
+
+async def _get(app: FastAPI, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+async def test_json_route_matches_stdlib_response():
+    for path in ("/item", "/items"):
+        fast = await _get(_create_app(JSONResponse), path)
+        stdlib = await _get(_create_app(StdlibJSONResponse), path)
+
+        assert fast.status_code == stdlib.status_code == 200
+        assert fast.headers["content-type"] == stdlib.headers["content-type"]
+        assert fast.json() == stdlib.json()
+
+
+async def test_json_route_applies_response_model_options():
+    response = await _get(_create_app(JSONResponse), "/item")
+
+    assert response.content == b'{"itemId":1,"createdAt":"2024-01-01T00:00:00Z"}'
+
+
+def test_json_response_renders_plain_content():
+    assert JSONResponse({"a": [1, math.inf]}).body == b'{"a":[1,null]}'
+    assert JSONResponse(SerializedJSON(b'{"a":1}')).body == b'{"a":1}'
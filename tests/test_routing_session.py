@@ -0,0 +1,103 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from pydantic import SecretStr
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from todo_api.core.config import settings
+from todo_api.core.database.base import dispose_engines, get_async_session_maker
+from todo_api.core.database.routing import RoutingSession
+from todo_api.core.database.service import Explain
+from todo_api.users.models import User
+from todo_api.users.service import UserService
+
+
+async def _add_user(engine: AsyncEngine, username: str) -> None:
+    async with AsyncSession(engine) as session:
+        session.add(User(username=username, hashed_password="x"))
+        await session.commit()
+
+
+@pytest_asyncio.fixture
+async def routing_session(
+    engine: AsyncEngine, replica_engine: AsyncEngine
+) -> AsyncGenerator[AsyncSession]:
+    await _add_user(engine, "on_primary")
+    await _add_user(replica_engine, "on_replica")
+
+    session = AsyncSession(
+        engine,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        replicas=[replica_engine.sync_engine],
+    )
+    yield session
+    await session.close()
+
+
+async def test_routing_session_reads_from_replica(routing_session: AsyncSession):
+    user_service = UserService(routing_session)
+
+    assert [user.username for user in await user_service.list()] == ["on_replica"]
+    assert await user_service.count() == 1
+    assert await user_service.exists(username="on_replica")
+    assert (await user_service.get_one(id=1)).username == "on_replica"
+
+
+async def test_routing_session_reads_own_writes(routing_session: AsyncSession):
+    user_service = UserService(routing_session)
+    assert await user_service.exists(username="on_replica")
+
+    await user_service.create(User(username="new", hashed_password="x"))
+
+    assert sorted(user.username for user in await user_service.list()) == ["new", "on_primary"]
+
+
+async def test_routing_session_select_for_update_uses_primary(routing_session: AsyncSession):
+    locked = await routing_session.scalar(select(User).with_for_update())
+    assert locked is not None
+    assert locked.username == "on_primary"
+
+    assert await UserService(routing_session).exists(username="on_primary")
+
+
+async def test_routing_session_explain_uses_replica(routing_session: AsyncSession):
+    await routing_session.execute(Explain(select(User)))
+
+    assert await UserService(routing_session).exists(username="on_replica")
+
+
+async def test_routing_session_round_robin(engine: AsyncEngine, replica_engine: AsyncEngine):
+    await _add_user(engine, "on_primary")
+    await _add_user(replica_engine, "on_replica")
+    session_maker = async_sessionmaker(
+        engine,
+        sync_session_class=RoutingSession,
+        replicas=[engine.sync_engine, replica_engine.sync_engine],
+    )
+
+    usernames: set[str] = set()
+    for _ in range(2):
+        async with session_maker() as session:
+            usernames.add(await session.scalar(select(User.username)) or "")
+
+    assert usernames == {"on_primary", "on_replica"}
+
+
+@pytest.mark.parametrize(
+    ("replica_dsns", "session_class"),
+    [([], "Session"), ([SecretStr("postgresql+psycopg://replica/db")], "RoutingSession")],
+)
+async def test_get_async_session_maker_routes_when_replicas_configured(
+    monkeypatch: pytest.MonkeyPatch, replica_dsns: list[SecretStr], session_class: str
+):
+    monkeypatch.setattr(settings, "DB_REPLICA_DSNS", replica_dsns)
+    await dispose_engines()
+
+    try:
+        session = get_async_session_maker()()
+        assert type(session.sync_session).__name__ == session_class
+    finally:
+        await dispose_engines()
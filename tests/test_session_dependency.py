@@ -0,0 +1,97 @@
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI, Request
+from pydantic import field_serializer
+from sqlalchemy import QueuePool, event, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from todo_api.api.config import api_settings
+from todo_api.api.dependencies import database
+from todo_api.api.responses import JSONResponse, JSONRoute
+from todo_api.api.schemas.base import BaseSchema
+from todo_api.core.database.base import has_writes
+from todo_api.users.models import User
+
+
+async def test_has_writes(session: AsyncSession):
+    assert not has_writes(session)
+
+    await session.scalar(select(User))
+    assert not has_writes(session)
+
+    session.add(User(username="writer", hashed_password="x"))
+    assert has_writes(session)
+    await session.flush()
+    assert has_writes(session)
+
+    await session.commit()
+    assert not has_writes(session)
+
+    await session.execute(update(User).values(hashed_password="y"))
+    assert has_writes(session)
+    await session.rollback()
+    assert not has_writes(session)
+
+
+@pytest.mark.parametrize(("write", "commits"), [(False, 0), (True, 1)])
+async def test_get_async_session_commits_only_writes(
+    monkeypatch: pytest.MonkeyPatch, engine: AsyncEngine, write: bool, commits: int
+):
+    monkeypatch.setattr(database, "get_async_session_maker", lambda: async_sessionmaker(engine))
+    committed: list[object] = []
+    event.listen(engine.sync_engine, "commit", committed.append)
+
+    dependency = database.get_async_session(Request({"type": "http", "state": {}}))
+    session = await anext(dependency)
+    await session.scalar(select(User))
+    if write:
+        session.add(User(username="writer", hashed_password="x"))
+    with pytest.raises(StopAsyncIteration):
+        await anext(dependency)
+
+    assert len(committed) == commits
+    async with AsyncSession(engine) as check:
+        assert (await check.scalar(select(User.username))) == ("writer" if write else None)
+
+
+@pytest.mark.parametrize(("release", "checked_out"), [(True, 0), (False, 1)])
+async def test_session_released_before_serialization(
+    monkeypatch: pytest.MonkeyPatch, engine: AsyncEngine, release: bool, checked_out: int
+):
+    monkeypatch.setattr(
+        database,
+        "get_async_session_maker",
+        lambda: async_sessionmaker(engine, expire_on_commit=False),
+    )
+    monkeypatch.setattr(api_settings, "RELEASE_SESSION_BEFORE_SERIALIZATION", release)
+    pool = engine.sync_engine.pool
+    assert isinstance(pool, QueuePool)
+    checked_out_while_serializing: list[int] = []
+
+    class UserRead(BaseSchema):
+        username: str
+
+        @field_serializer("username")
+        def serialize_username(self, username: str) -> str:
+            checked_out_while_serializing.append(pool.checkedout())
+            return username
+
+    app = FastAPI(default_response_class=JSONResponse)
+    router = APIRouter(route_class=JSONRoute)
+
+    @router.post("/users", response_model=UserRead)
+    async def create_user(session: database.AsyncDbSession) -> User:  # pyright: ignore[reportUnusedFunction]
+        user = User(username="writer", hashed_password="x")
+        session.add(user)
+        await session.flush()
+        return user
+
+    app.include_router(router)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/users")
+
+    assert response.json() == {"username": "writer"}
+    assert checked_out_while_serializing == [checked_out]
+    async with AsyncSession(engine) as check:
+        assert (await check.scalar(select(User.username))) == "writer"
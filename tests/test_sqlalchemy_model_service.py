@@ -1,21 +1,39 @@
+from datetime import UTC, datetime
+from typing import Any
+
 # pyright: reportPrivateUsage=false
 from unittest.mock import patch
 
 import pytest
-from sqlalchemy import Select, select
+from sqlalchemy import Select, inspect, select
 from sqlalchemy.dialects import postgresql
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, InvalidRequestError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute, Mapped, mapped_column
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Mapped,
+    defer,
+    load_only,
+    mapped_column,
+    with_loader_criteria,
+)
 
-from tests.fixtures.database import SaveModel
+from tests.fixtures.database import AssertMaxQueries, SaveModel
+from todo_api.auth.models import UserSession
+from todo_api.auth.service import UserSessionService
 from todo_api.core.database.base import Model
 from todo_api.core.database.exceptions import (
     DatabaseOperationError,
     IntegrityConstraintError,
     RecordNotFoundError,
 )
-from todo_api.core.database.service import OrderBy, SQLAlchemyModelService
+from todo_api.core.database.service import (
+    CountStrategy,
+    Keyset,
+    OrderBy,
+    SQLAlchemyModelService,
+)
+from todo_api.users.models import User
 
 DIALECT = postgresql.dialect()
 
@@ -590,3 +608,456 @@ async def test_list_and_count_with_filter_and_order(
     assert len(items) == 1
     assert total == 1
     assert items[0].title == "Task A"
+
+
+async def test_list_keyset(session: AsyncSession, save_model_fixture: SaveModel):
+    tasks = [Task(title=f"Task {i}", priority=i % 2) for i in range(5)]
+    for task in tasks:
+        await save_model_fixture(task)
+    service = TaskService(session)
+
+    order_by = OrderBy(field="priority", order="desc")
+    seen: list[Task] = []
+    items, keyset = await service.list_keyset(limit=2, order_by=order_by)
+    seen.extend(items)
+    while keyset is not None:
+        items, keyset = await service.list_keyset(limit=2, keyset=keyset, order_by=order_by)
+        seen.extend(items)
+
+    # Ties on `priority` are broken by `id` (same direction), nothing is skipped or repeated
+    expected = sorted(tasks, key=lambda task: (task.priority, task.id), reverse=True)
+    assert [task.id for task in seen] == [task.id for task in expected]
+
+
+async def test_list_keyset_last_page(session: AsyncSession, save_model_fixture: SaveModel):
+    tasks = [Task(title=f"Task {i}") for i in range(3)]
+    for task in tasks:
+        await save_model_fixture(task)
+    service = TaskService(session)
+
+    items, keyset = await service.list_keyset(limit=3)
+    assert items == tasks
+    assert keyset is None
+
+    items, keyset = await service.list_keyset(limit=2)
+    assert items == tasks[:2]
+    assert keyset == Keyset(value=tasks[1].id, id=tasks[1].id)
+
+
+async def test_list_keyset_with_filter(session: AsyncSession, save_model_fixture: SaveModel):
+    tasks = [Task(title="A" if i % 2 else "B") for i in range(6)]
+    for task in tasks:
+        await save_model_fixture(task)
+    service = TaskService(session)
+
+    items, keyset = await service.list_keyset(title="A", limit=2)
+    assert keyset is not None
+    next_items, next_keyset = await service.list_keyset(title="A", limit=2, keyset=keyset)
+
+    assert all(item.title == "A" for item in [*items, *next_items])
+    assert len(items) + len(next_items) == 3
+    assert next_keyset is None
+
+
+async def test_list_and_count_count_strategies(
+    session: AsyncSession, save_model_fixture: SaveModel
+):
+    tasks = [Task(title=f"Task {i}") for i in range(5)]
+    for task in tasks:
+        await save_model_fixture(task)
+    service = TaskService(session)
+
+    items, total = await service.list_and_count(limit=2, count_strategy=CountStrategy.NONE)
+    assert len(items) == 2
+    assert total is None
+
+    items, total = await service.list_and_count(
+        limit=2, count_strategy=CountStrategy.CAPPED, count_cap=3
+    )
+    assert len(items) == 2
+    assert total == 3
+
+    items, total = await service.list_and_count(
+        limit=2, count_strategy=CountStrategy.CAPPED, count_cap=10
+    )
+    assert total == 5
+
+    items, total = await service.list_and_count(limit=2, count_strategy=CountStrategy.ESTIMATE)
+    assert len(items) == 2
+    assert isinstance(total, int)
+    assert total >= 0
+
+
+async def test_list_and_count_window_strategy(
+    session: AsyncSession, save_model_fixture: SaveModel
+):
+    tasks = [Task(title=f"Task {i}") for i in range(5)]
+    for task in tasks:
+        await save_model_fixture(task)
+    service = TaskService(session, count_strategy=CountStrategy.WINDOW)
+
+    items, total = await service.list_and_count(
+        limit=2, offset=1, order_by=OrderBy(field="id", order="asc")
+    )
+    assert [item.id for item in items] == [tasks[1].id, tasks[2].id]
+    assert all(isinstance(item, Task) for item in items)
+    assert total == 5
+
+    items, total = await service.list_and_count(limit=2, offset=10)
+    assert items == []
+    assert total == 5
+
+    items, total = await service.list_and_count(limit=2, count_strategy=CountStrategy.NONE)
+    assert len(items) == 2
+    assert total is None
+
+
+async def test_create_many(session: AsyncSession):
+    service = TaskService(session)
+
+    created = await service.create_many(
+        [Task(title="A", priority=2), Task(title="B"), Task(title="C", description="c")]
+    )
+
+    assert [task.title for task in created] == ["A", "B", "C"]
+    assert all(task.id is not None for task in created)
+    assert [task.priority for task in created] == [2, 1, 1]
+    assert await service.count() == 3
+
+
+async def test_create_many_expunge(session: AsyncSession):
+    service = TaskService(session)
+
+    created = await service.create_many([Task(title="A")], auto_expunge=True)
+
+    assert created[0] not in session
+
+
+async def test_update_many(session: AsyncSession, save_model_fixture: SaveModel):
+    tasks = [Task(title=f"Task {i}") for i in range(3)]
+    for task in tasks:
+        await save_model_fixture(task)
+    service = TaskService(session)
+
+    for task in tasks:
+        task.priority = 7
+    updated = await service.update_many(tasks, auto_commit=True)
+
+    assert [task.priority for task in updated] == [7, 7, 7]
+    assert await service.count(priority=7) == 3
+
+
+async def test_update_many_detached(
+    session: AsyncSession, save_model_fixture: SaveModel, assert_max_queries: AssertMaxQueries
+):
+    tasks = [Task(title=f"Task {i}") for i in range(3)]
+    for task in tasks:
+        await save_model_fixture(task)
+    session.expunge_all()
+    service = TaskService(session)
+
+    for task in tasks:
+        task.priority = 7
+    tasks[0].title = "Renamed"
+    # One executemany per set of changed columns and the SELECT of the updated rows
+    with assert_max_queries(3):
+        updated = await service.update_many(tasks)
+
+    assert [(task.title, task.priority) for task in updated] == [
+        ("Renamed", 7),
+        ("Task 1", 7),
+        ("Task 2", 7),
+    ]
+    assert await service.count(priority=7) == 3
+
+
+async def test_upsert_many(session: AsyncSession, save_model_fixture: SaveModel):
+    existing = Task(title="Old", priority=1)
+    await save_model_fixture(existing)
+    service = TaskService(session)
+
+    upserted = await service.upsert_many(
+        [
+            {"id": existing.id, "title": "New", "priority": 3},
+            {"id": existing.id + 1, "title": "Inserted", "priority": 4},
+        ]
+    )
+
+    assert {(task.id, task.title, task.priority) for task in upserted} == {
+        (existing.id, "New", 3),
+        (existing.id + 1, "Inserted", 4),
+    }
+    assert existing.title == "New"
+    assert await service.count() == 2
+
+
+async def test_upsert_many_update_fields(session: AsyncSession, save_model_fixture: SaveModel):
+    existing = Task(title="Old", priority=1)
+    await save_model_fixture(existing)
+    service = TaskService(session)
+
+    [upserted] = await service.upsert_many(
+        [{"id": existing.id, "title": "New", "priority": 3}], update_fields=["priority"]
+    )
+
+    assert upserted.title == "Old"
+    assert upserted.priority == 3
+
+
+async def test_upsert_many_nothing_to_update(session: AsyncSession, save_model_fixture: SaveModel):
+    existing = Task(title="Old", priority=1)
+    await save_model_fixture(existing)
+    service = TaskService(session)
+
+    [inserted] = await service.upsert_many(
+        [
+            {"id": existing.id, "title": "New", "priority": 3},
+            {"id": existing.id + 1, "title": "Inserted", "priority": 4},
+        ],
+        update_fields=[],
+    )
+
+    assert inserted.id == existing.id + 1
+    assert await service.upsert_many([{"id": existing.id, "title": "New"}], update_fields=[]) == []
+    assert existing.title == "Old"
+    assert await service.count() == 2
+
+
+async def test_delete_many(session: AsyncSession, save_model_fixture: SaveModel):
+    tasks = [Task(title=f"Task {i}") for i in range(3)]
+    for task in tasks:
+        await save_model_fixture(task)
+    service = TaskService(session)
+
+    deleted = await service.delete_many([tasks[0].id, tasks[1].id, 999])
+
+    assert {task.id for task in deleted} == {tasks[0].id, tasks[1].id}
+    assert await service.count() == 1
+    assert await service.delete_many([]) == []
+
+
+async def test_delete_where(session: AsyncSession, save_model_fixture: SaveModel):
+    for i in range(4):
+        await save_model_fixture(Task(title=f"Task {i}", priority=i % 2))
+    service = TaskService(session)
+
+    deleted = await service.delete_where(priority=1, auto_commit=True)
+
+    assert len(deleted) == 2
+    assert all(task.priority == 1 for task in deleted)
+    assert await service.count() == 2
+
+
+async def test_delete_where_requires_filter(session: AsyncSession):
+    service = TaskService(session)
+
+    with pytest.raises(DatabaseOperationError):
+        await service.delete_where()
+
+    with pytest.raises(DatabaseOperationError):
+        await service.delete_where(non_existent="x")
+
+
+async def test_delete_where_rejects_unknown_filters(
+    session: AsyncSession, save_model_fixture: SaveModel
+):
+    await save_model_fixture(Task(title="Task", priority=1))
+    service = TaskService(session)
+
+    with pytest.raises(DatabaseOperationError):
+        await service.delete_where(priority=1, non_existent="x")
+
+    assert await service.count() == 1
+
+
+async def test_update_where(session: AsyncSession, save_model_fixture: SaveModel):
+    for i in range(4):
+        await save_model_fixture(Task(title=f"Task {i}", priority=i % 2))
+    service = TaskService(session)
+
+    updated = await service.update_where({"description": "odd"}, priority=1)
+
+    assert len(updated) == 2
+    assert all(task.description == "odd" for task in updated)
+    assert await service.count(description="odd") == 2
+    assert await service.update_where({"description": "x"}, title="missing") == []
+
+
+async def test_update_where_requires_filter(session: AsyncSession):
+    service = TaskService(session)
+
+    with pytest.raises(DatabaseOperationError):
+        await service.update_where({"priority": 1})
+
+    with pytest.raises(DatabaseOperationError):
+        await service.update_where({"priority": 1}, title="Task", non_existent="x")
+
+
+async def test_shaped_statement_is_reused(session: AsyncSession):
+    service = TaskService(session)
+
+    shaped1 = service._shaped_statement("select", title="A", limit=2, offset=0)
+    shaped2 = service._shaped_statement("select", title="B", offset=4, limit=2)
+    assert shaped1 is not None
+    assert shaped2 is not None
+    (stmt1, params1), (stmt2, params2) = shaped1, shaped2
+
+    assert stmt1 is stmt2
+    assert params1 == {"filter_title": "A", "page_offset": 0, "page_limit": 2}
+    assert params2 == {"filter_title": "B", "page_offset": 4, "page_limit": 2}
+    assert_statement_equal(
+        stmt1.params(params1),
+        select(Task).where(Task.title == "A").offset(0).limit(2),
+    )
+
+
+@pytest.mark.parametrize(
+    ("statement", "kwargs"),
+    [
+        (select(Task), {}),
+        (None, {"description": None}),
+        (None, {"nonexistent": 1}),
+        (None, {"priority": Task.id}),
+        (None, {"order_by": OrderBy(field="nonexistent", order="asc")}),
+    ],
+)
+async def test_shaped_statement_not_used(
+    session: AsyncSession, statement: Select[tuple[Task]] | None, kwargs: dict[str, Any]
+):
+    service = TaskService(session)
+
+    assert service._shaped_statement("select", statement, **kwargs) is None
+
+
+async def test_list_and_count_with_shaped_statement(
+    session: AsyncSession, save_model_fixture: SaveModel
+):
+    for task in (
+        Task(title="A", priority=1),
+        Task(title="B", priority=2, description="x"),
+        Task(title="C", priority=2),
+    ):
+        await save_model_fixture(task)
+    service = TaskService(session)
+
+    items, total = await service.list_and_count(
+        priority=2, limit=1, offset=1, order_by=OrderBy(field="title", order="asc")
+    )
+    assert [item.title for item in items] == ["C"]
+    assert total == 2
+
+    items, total = await service.list_and_count(
+        priority=2, limit=1, count_strategy=CountStrategy.WINDOW
+    )
+    assert len(items) == 1
+    assert total == 2
+
+    assert await service.count(description=None) == 2
+    assert await service.exists(priority=1)
+    assert not await service.exists(priority=3)
+
+
+async def test_loader_options(session: AsyncSession, save_model_fixture: SaveModel):
+    await save_model_fixture(Task(title="A", description="x", priority=2))
+    session.expunge_all()
+    only_title = (load_only(Task.title),)
+    service = TaskService(session)
+
+    item = await service.get_one(title="A", options=only_title)
+    assert inspect(item).unloaded == {"description", "priority"}
+    session.expunge_all()
+
+    items, total = await service.list_and_count(priority=2, options=only_title)
+    assert total == 1
+    assert inspect(items[0]).unloaded == {"description", "priority"}
+    session.expunge_all()
+
+    service = TaskService(session, options=(defer(Task.description, raiseload=True),))
+    (item,) = await service.list(options=only_title)
+    assert inspect(item).unloaded == {"description", "priority"}
+    with pytest.raises(InvalidRequestError):
+        _ = item.description
+
+
+async def test_shaped_statement_with_options(session: AsyncSession):
+    only_title = (load_only(Task.title),)
+    service = TaskService(session)
+
+    shaped1 = service._shaped_statement("select", None, only_title, title="A")
+    shaped2 = service._shaped_statement("select", None, only_title, title="B")
+    shaped3 = service._shaped_statement("select", title="A")
+    assert shaped1 is not None
+    assert shaped2 is not None
+    assert shaped3 is not None
+
+    assert shaped1[0] is shaped2[0]
+    assert shaped1[0] is not shaped3[0]
+
+    # Equal options built on every call share the statement, options with bound values skip it
+    fresh = service._shaped_statement("select", None, (load_only(Task.title),), title="C")
+    assert fresh is not None
+    assert fresh[0] is shaped1[0]
+    criteria = (with_loader_criteria(Task, Task.priority == 1),)
+    assert service._shaped_statement("select", None, criteria, title="A") is None
+
+
+async def test_relationship_filters_are_not_shaped(
+    session: AsyncSession, save_model_fixture: SaveModel
+):
+    user = User(username="owner", hashed_password="x")
+    await save_model_fixture(user)
+    await save_model_fixture(UserSession(user_id=user.id, expires_at=datetime.now(UTC)))
+    service = UserSessionService(session)
+
+    assert service._shaped_statement("exists", user=user) is None
+    assert await service.exists(user=user)
+
+
+async def test_list_rows(session: AsyncSession, save_model_fixture: SaveModel):
+    for task in (
+        Task(title="A", priority=2),
+        Task(title="B", priority=1),
+        Task(title="C", priority=2),
+    ):
+        await save_model_fixture(task)
+    session.expunge_all()
+    service = TaskService(session)
+
+    rows = await service.list_rows(
+        columns=("id", "title"), priority=2, order_by=OrderBy(field="title", order="desc")
+    )
+
+    assert [row["title"] for row in rows] == ["C", "A"]
+    assert rows[0].keys() == {"id", "title"}
+    assert len(session.identity_map) == 0
+
+    rows = await service.list_rows(
+        select(Task).where(Task.title != "C"), columns=("title",), priority=2
+    )
+    assert rows == [{"title": "A"}]
+
+
+@pytest.mark.parametrize("count_strategy", [CountStrategy.EXACT, CountStrategy.WINDOW])
+async def test_list_rows_and_count(
+    session: AsyncSession, save_model_fixture: SaveModel, count_strategy: CountStrategy
+):
+    for i in range(5):
+        await save_model_fixture(Task(title=f"Task {i}", priority=i % 2))
+    service = TaskService(session)
+
+    rows, total = await service.list_rows_and_count(
+        columns=("title",),
+        priority=0,
+        limit=2,
+        order_by=OrderBy(field="title", order="asc"),
+        count_strategy=count_strategy,
+    )
+
+    assert total == 3
+    assert rows == [{"title": "Task 0"}, {"title": "Task 2"}]
+
+    rows, total = await service.list_rows_and_count(
+        columns=("title",), priority=0, offset=10, count_strategy=count_strategy
+    )
+    assert rows == []
+    assert total == 3
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from todo_api.core.database.base import Model
 from todo_api.core.database.exceptions import RecordNotFoundError
 from todo_api.core.database.mixins import TimestampMixin
-from todo_api.core.database.service import SQLAlchemyService
+from todo_api.core.database.service import CountStrategy, SQLAlchemyService
 
 
 class User_(TimestampMixin, Model):
@@ -100,6 +100,16 @@ async def test_execute_list_and_count_with_pagination(
     assert items[0].username == "user2"
 
 
+async def test_execute_list_and_count_without_count(
+    service: SQLAlchemyService, seeded_users: list[User_]
+):
+    stmt = select(User_).order_by(User_.username.asc()).limit(1)
+    items, count = await service.execute_list_and_count(stmt, count_strategy=CountStrategy.NONE)
+
+    assert count is None
+    assert len(items) == 1
+
+
 async def test_execute_rows_cte(service: SQLAlchemyService, seeded_users: list[User_]):
     cte = select(User_.id, User_.username).where(User_.username == "user1").cte("user_cte")
     stmt = select(cte.c.id, cte.c.username)
@@ -204,3 +214,15 @@ async def test_execute_rows_aggregation(
     assert results[0][1] == 90000.0  # (100k + 80k) / 2
     assert results[1][0] == "Marketing"
     assert results[1][1] == 90000.0
+
+
+async def test_execute_list_and_count_window_strategy(
+    session: AsyncSession, seeded_users: list[User_]
+):
+    service = SQLAlchemyService(session, count_strategy=CountStrategy.WINDOW)
+    stmt = select(User_).order_by(User_.username.asc()).limit(1).offset(1)
+    items, count = await service.execute_list_and_count(stmt)
+
+    assert count == 2
+    assert len(items) == 1
+    assert items[0].username == "user2"
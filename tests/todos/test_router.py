@@ -6,10 +6,11 @@ from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.fixtures.auth import AuthenticateAs
-from tests.fixtures.database import SaveModel
-from tests.fixtures.objects import create_user
+from tests.fixtures.database import AssertMaxQueries, SaveModel
+from tests.fixtures.objects import create_todo, create_user
 from todo_api.api.dependencies.auth import AnonymousUser
 from todo_api.api.exceptions import ErrorCode
+from todo_api.api.schemas.todos import BATCH_MAX_SIZE
 from todo_api.todos.models import Todo
 from todo_api.users.models import User
 
@@ -76,6 +77,24 @@ async def test_get_user_todos_success(
     assert returned_titles == {"Todo 1", "Todo 2"}
 
 
+@pytest.mark.auth(AuthenticateAs(type_="user"))
+async def test_get_user_todos_query_count(
+    auth_as: User,
+    client: httpx.AsyncClient,
+    save_model_fixture: SaveModel,
+    assert_max_queries: AssertMaxQueries,
+):
+    """Test that the page and its total are read in a fixed number of queries"""
+    for i in range(10):
+        await save_model_fixture(Todo(user_id=auth_as.id, title=f"Todo {i}"))
+
+    with assert_max_queries(2):
+        response = await client.get("/api/v1/todos/me")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["items"]) == 10
+
+
 @pytest.mark.auth(AuthenticateAs(type_="user"))
 async def test_get_user_todos_pagination(
     auth_as: User, client: httpx.AsyncClient, save_model_fixture: SaveModel
@@ -104,6 +123,36 @@ async def test_get_user_todos_pagination(
     assert data["pages"] == 2
 
 
+@pytest.mark.auth(AuthenticateAs(type_="user"))
+async def test_get_user_todos_count_strategy(
+    auth_as: User, client: httpx.AsyncClient, save_model_fixture: SaveModel
+):
+    """Test skipping or estimating the total count of user's todos"""
+    for i in range(3):
+        await save_model_fixture(Todo(user_id=auth_as.id, title=f"Todo {i + 1}"))
+
+    response = await client.get("/api/v1/todos/me?size=2&count=none")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert data["total"] is None
+    assert data["pages"] is None
+    assert data["approximateTotal"] is False
+
+    response = await client.get("/api/v1/todos/me?size=2&count=estimate")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert isinstance(data["total"], int)
+    assert data["approximateTotal"] is True
+
+    response = await client.get("/api/v1/todos/me?size=2&count=capped")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total"] == 3
+    assert data["approximateTotal"] is False
+
+
 @pytest.mark.auth(AuthenticateAs(type_="user"))
 async def test_get_user_todos_sorting(
     auth_as: User, client: httpx.AsyncClient, save_model_fixture: SaveModel
@@ -139,6 +188,41 @@ async def test_get_user_todos_sorting(
     assert data["items"][1]["title"] == "First"
 
 
+@pytest.mark.auth(AuthenticateAs(type_="user"))
+async def test_get_user_todos_cursor_pagination(
+    auth_as: User, client: httpx.AsyncClient, save_model_fixture: SaveModel
+):
+    """Test walking user's todos with cursor pagination"""
+    for i in range(5):
+        await save_model_fixture(Todo(user_id=auth_as.id, title=f"Todo {i + 1}"))
+
+    other_user = await create_user(save_model_fixture, username="user2")
+    await save_model_fixture(Todo(user_id=other_user.id, title="Other User Todo"))
+
+    titles: list[str] = []
+    params: dict[str, str | int] = {"size": 2, "orderBy": "createdAt.desc"}
+    while True:
+        response = await client.get("/api/v1/todos/me/cursor", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["size"] == 2
+        titles.extend(item["title"] for item in data["items"])
+
+        if data["nextCursor"] is None:
+            break
+        params["cursor"] = data["nextCursor"]
+
+    assert titles == [f"Todo {i}" for i in range(5, 0, -1)]
+
+
+@pytest.mark.auth(AuthenticateAs(type_="user"))
+async def test_get_user_todos_cursor_invalid(auth_as: User, client: httpx.AsyncClient):
+    response = await client.get("/api/v1/todos/me/cursor", params={"cursor": "invalid"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["code"] == ErrorCode.INVALID_CURSOR
+
+
 async def test_get_user_todos_unauthenticated(client: httpx.AsyncClient, auth_as: AnonymousUser):
     """Test getting user todos fails when effectively unauthenticated"""
     response = await client.get("/api/v1/todos/me")
@@ -334,3 +418,120 @@ async def test_delete_todo_unauthenticated(
 
     db_todo = await session.get(Todo, todo_id)
     assert db_todo is not None
+
+
+@pytest.mark.auth(AuthenticateAs(type_="user"))
+async def test_create_todo_batch(auth_as: User, client: httpx.AsyncClient, session: AsyncSession):
+    payload = {"items": [{"title": "First"}, {"title": "Second", "isCompleted": True}]}
+
+    response = await client.post("/api/v1/todos/batch", json=payload)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    items = response.json()["items"]
+    assert [item["status"] for item in items] == [201, 201]
+    assert [item["item"]["title"] for item in items] == ["First", "Second"]
+    assert items[1]["item"]["isCompleted"] is True
+    assert items[0]["item"]["createdAt"] is not None
+
+    for item in items:
+        db_todo = await session.get(Todo, item["id"])
+        assert db_todo is not None
+        assert db_todo.user_id == auth_as.id
+
+
+@pytest.mark.auth(AuthenticateAs(type_="user"))
+async def test_create_todo_batch_too_large(auth_as: User, client: httpx.AsyncClient):
+    payload = {"items": [{"title": str(i)} for i in range(BATCH_MAX_SIZE + 1)]}
+
+    response = await client.post("/api/v1/todos/batch", json=payload)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+@pytest.mark.auth(AuthenticateAs(type_="user", username="batch_updater"))
+async def test_update_todo_batch(
+    auth_as: User, client: httpx.AsyncClient, save_model_fixture: SaveModel
+):
+    other_user = await create_user(save_model_fixture, username="batch_other")
+    todo = await create_todo(save_model_fixture, user_id=auth_as.id, title="Mine")
+    other_todo = await create_todo(save_model_fixture, user_id=other_user.id, title="Theirs")
+
+    payload = {
+        "items": [
+            {"id": todo.id, "isCompleted": True, "description": None},
+            {"id": other_todo.id, "title": "Hijacked"},
+            {"id": 999_999, "title": "Missing"},
+        ]
+    }
+    response = await client.patch("/api/v1/todos/batch", json=payload)
+
+    assert response.status_code == status.HTTP_200_OK
+    updated, forbidden, missing = response.json()["items"]
+    assert updated["status"] == status.HTTP_200_OK
+    assert updated["item"]["title"] == "Mine"
+    assert updated["item"]["isCompleted"] is True
+    assert updated["item"]["description"] is None
+    assert forbidden["status"] == status.HTTP_403_FORBIDDEN
+    assert forbidden["error"]["code"] == ErrorCode.NOT_OWNER
+    assert missing["status"] == status.HTTP_404_NOT_FOUND
+    assert other_todo.title == "Theirs"
+
+
+@pytest.mark.auth(AuthenticateAs(type_="user"))
+async def test_update_todo_batch_rejects_null_title(
+    auth_as: User, client: httpx.AsyncClient, save_model_fixture: SaveModel
+):
+    todo = await create_todo(save_model_fixture, user_id=auth_as.id)
+
+    response = await client.patch(
+        "/api/v1/todos/batch", json={"items": [{"id": todo.id, "title": None}]}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+@pytest.mark.auth(AuthenticateAs(type_="user", username="batch_deleter"))
+async def test_delete_todo_batch(
+    auth_as: User, client: httpx.AsyncClient, save_model_fixture: SaveModel, session: AsyncSession
+):
+    other_user = await create_user(save_model_fixture, username="batch_delete_other")
+    todo = await create_todo(save_model_fixture, user_id=auth_as.id)
+    other_todo = await create_todo(save_model_fixture, user_id=other_user.id)
+    todo_id, other_todo_id = todo.id, other_todo.id
+
+    response = await client.request(
+        "DELETE", "/api/v1/todos/batch", json={"ids": [todo_id, other_todo_id]}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    deleted, forbidden = response.json()["items"]
+    assert deleted == {"id": todo_id, "status": 204, "item": None, "error": None}
+    assert forbidden["status"] == status.HTTP_403_FORBIDDEN
+
+    session.expunge_all()
+    assert await session.get(Todo, todo_id) is None
+    assert await session.get(Todo, other_todo_id) is not None
+
+
+@pytest.mark.auth(AuthenticateAs(type_="user"))
+async def test_todo_batch_rejects_duplicate_ids(
+    auth_as: User, client: httpx.AsyncClient, save_model_fixture: SaveModel
+):
+    todo = await create_todo(save_model_fixture, user_id=auth_as.id)
+
+    update_response = await client.patch(
+        "/api/v1/todos/batch",
+        json={"items": [{"id": todo.id, "title": "A"}, {"id": todo.id, "title": "B"}]},
+    )
+    delete_response = await client.request(
+        "DELETE", "/api/v1/todos/batch", json={"ids": [todo.id, todo.id]}
+    )
+
+    assert update_response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert delete_response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+async def test_todo_batch_unauthenticated(client: httpx.AsyncClient, auth_as: AnonymousUser):
+    response = await client.post("/api/v1/todos/batch", json={"items": [{"title": "x"}]})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.fixtures.database import SaveModel
+from tests.fixtures.objects import create_todo, create_user
+from todo_api.core.database.exceptions import DatabaseOperationError
+from todo_api.core.database.service import OrderBy
+from todo_api.todos.models import Todo
+from todo_api.todos.service import TodoService
+
+
+async def test_owned_writes_skip_other_users_todos(
+    session: AsyncSession, save_model_fixture: SaveModel
+):
+    owner = await create_user(save_model_fixture, username="owner")
+    other = await create_user(save_model_fixture, username="other")
+    todo = await create_todo(save_model_fixture, user_id=other.id, title="Theirs")
+    service = TodoService(session)
+
+    assert await service.update_owned(todo.id, owner.id, {"title": "Mine"}) is None
+    assert await service.delete_owned(todo.id, owner.id) is None
+
+    assert await session.scalar(select(Todo.title).where(Todo.id == todo.id)) == "Theirs"
+
+
+async def test_misspelled_ownership_filter_raises(
+    session: AsyncSession, save_model_fixture: SaveModel
+):
+    owner = await create_user(save_model_fixture, username="owner")
+    other = await create_user(save_model_fixture, username="other")
+    todo = await create_todo(save_model_fixture, user_id=other.id, title="Theirs")
+    service = TodoService(session)
+
+    with pytest.raises(DatabaseOperationError):
+        await service.update_where({"title": "Mine"}, id=todo.id, owner_id=owner.id)
+    with pytest.raises(DatabaseOperationError):
+        await service.delete_where(id=todo.id, owner_id=owner.id)
+
+    assert await session.scalar(select(Todo.title).where(Todo.id == todo.id)) == "Theirs"
+
+
+async def test_list_keyset_by_updated_at_falls_back_to_created_at(
+    session: AsyncSession, save_model_fixture: SaveModel
+):
+    user = await create_user(save_model_fixture)
+    todos = [await create_todo(save_model_fixture, user_id=user.id) for _ in range(5)]
+    await session.execute(update(Todo).where(Todo.id == todos[2].id).values(updated_at=None))
+    service = TodoService(session)
+
+    order_by = OrderBy(field="updated_at", order="asc")
+    seen: list[int] = []
+    items, keyset = await service.list_keyset(user_id=user.id, limit=2, order_by=order_by)
+    seen.extend(todo.id for todo in items)
+    while keyset is not None:
+        items, keyset = await service.list_keyset(
+            user_id=user.id, limit=2, keyset=keyset, order_by=order_by
+        )
+        seen.extend(todo.id for todo in items)
+
+    # A NULL `updated_at` would end the pagination early
+    assert seen == [todo.id for todo in todos]
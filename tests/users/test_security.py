@@ -0,0 +1,43 @@
+import threading
+import time
+
+import anyio
+from pytest_mock import MockerFixture
+
+from todo_api.core.config import settings
+from todo_api.users import security
+
+
+async def test_password_hash_async_roundtrip():
+    hashed_password = await security.get_password_hash_async("password")
+
+    assert await security.verify_password_async("password", hashed_password)
+    assert not await security.verify_password_async("wrong", hashed_password)
+
+
+async def test_password_hashing_concurrency_is_bounded(mocker: MockerFixture):
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+    event_loop_thread = threading.get_ident()
+    hashing_threads: set[int] = set()
+
+    def slow_hash(password: str) -> str:
+        nonlocal running, max_running
+        hashing_threads.add(threading.get_ident())
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return password
+
+    mocker.patch.object(security.pwd_context, "hash", side_effect=slow_hash)
+
+    async with anyio.create_task_group() as tg:
+        for i in range(settings.PASSWORD_HASHING_CONCURRENCY * 3):
+            tg.start_soon(security.get_password_hash_async, str(i))
+
+    assert max_running == settings.PASSWORD_HASHING_CONCURRENCY
+    assert event_loop_thread not in hashing_threads
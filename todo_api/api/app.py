@@ -1,17 +1,21 @@
+import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import TypedDict, cast
+from typing import TypedDict
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from todo_api.api.config import api_settings
 from todo_api.api.exception_handlers import configure as configure_exception_handlers
 from todo_api.api.exceptions import ResponseValidationError
 from todo_api.api.middleware import configure as configure_middleware
+from todo_api.api.responses import JSONResponse
 from todo_api.api.router import router_v1
 from todo_api.core.config import settings
+from todo_api.core.database.base import dispose_engines
 from todo_api.core.logging import configure as configure_logging
+from todo_api.core.observability.multiprocess import compact_dead_workers, mark_worker_dead
 from todo_api.version import __version__
 
 if settings.OTEL_ENABLED:
@@ -23,6 +27,22 @@ if settings.OTEL_ENABLED:
         app_environment=settings.ENVIRONMENT,
         otlp_endpoint=settings.OTLP_GRPC_ENDPOINT,
         otlp_endpoint_insecure=settings.OTLP_EXPORTER_INSECURE,
+        sampler=settings.OTEL_SAMPLER,
+        sampling_ratio=settings.OTEL_SAMPLING_RATIO,
+        sampling_route_rate=settings.OTEL_SAMPLING_ROUTE_RATE,
+        tail_latency_threshold=settings.OTEL_TAIL_LATENCY_THRESHOLD,
+    )
+
+if settings.OTEL_METRICS_ENABLED:
+    from todo_api.core.observability.instrumentation import configure_metrics
+
+    configure_metrics(
+        app_name=settings.APP_NAME,
+        app_version=__version__,
+        app_environment=settings.ENVIRONMENT,
+        otlp_endpoint=settings.OTLP_GRPC_ENDPOINT,
+        otlp_endpoint_insecure=settings.OTLP_EXPORTER_INSECURE,
+        export_interval=settings.OTEL_METRICS_EXPORT_INTERVAL,
     )
 
 
@@ -33,19 +53,34 @@ class State(TypedDict):
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[State]:
+    # Metric files of each worker stay behind when it exits, merge them to keep scrapes fast
+    multiprocess_dir = settings.PROMETHEUS_MULTIPROC_DIR
+    if settings.ENVIRONMENT.is_testing or not (
+        multiprocess_dir and os.path.isdir(multiprocess_dir)
+    ):
+        multiprocess_dir = None
+    if multiprocess_dir:
+        compact_dead_workers(multiprocess_dir)
+
     yield {
         "auth_cookie_name": api_settings.AUTH_COOKIE_NAME,
         "auth_cookie_domain": api_settings.AUTH_COOKIE_DOMAIN,
     }
 
+    await dispose_engines()
+    if multiprocess_dir:
+        mark_worker_dead(multiprocess_dir, os.getpid())
+
     from opentelemetry import trace
     from opentelemetry.sdk.trace import TracerProvider
 
-    provider = cast(TracerProvider, trace.get_tracer_provider())
-    provider.force_flush(timeout_millis=5000)
+    # Only configured when `OTEL_ENABLED`
+    provider = trace.get_tracer_provider()
+    if isinstance(provider, TracerProvider):
+        provider.force_flush(timeout_millis=5000)
 
 
-def create_app() -> FastAPI:
+def create_app(*, default_response_class: type[Response] = JSONResponse) -> FastAPI:
     from opentelemetry.instrumentation.fastapi import (  # pyright: ignore[reportMissingTypeStubs]
         FastAPIInstrumentor,
     )
@@ -64,12 +99,13 @@ def create_app() -> FastAPI:
         title=settings.APP_NAME,
         version=__version__,
         lifespan=lifespan,
+        default_response_class=default_response_class,
         responses={
             422: {"description": "Response Validation Error", "model": ResponseValidationError}
         },
     )
 
-    configure_middleware(app, settings.ENVIRONMENT)
+    configure_middleware(app, settings.ENVIRONMENT, otel_metrics=settings.OTEL_METRICS_ENABLED)
     configure_exception_handlers(app)
 
     cors_origins = ["*"] if settings.ENVIRONMENT.is_development else api_settings.ALLOWED_ORIGINS
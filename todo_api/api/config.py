@@ -5,6 +5,17 @@ class ApiSettings(BaseSettings):
     AUTH_COOKIE_NAME: str = "todo_auth"
     AUTH_COOKIE_DOMAIN: str = "127.0.0.1"
     ALLOWED_ORIGINS: list[str] = ["*"]
+    # Route templates resolved by the Prometheus middleware, cached per method and path
+    PROMETHEUS_ROUTE_CACHE_SIZE: int = 1024
+    # Request latency histogram buckets in seconds, finest between the 100ms and 500ms SLOs
+    PROMETHEUS_LATENCY_BUCKETS: list[float] = [0.01, 0.025, 0.05, 0.1, 0.15, 0.2, 0.3, 0.5, 1, 5]
+    # Track requests in progress per route, two extra gauge updates per request
+    PROMETHEUS_IN_PROGRESS_ENABLED: bool = True
+    # Database queries per request before a warning is logged in development
+    QUERY_BUDGET: int = 10
+    # Commit and return the request's connection once async endpoints return, before the
+    # response is validated and serialized instead of after it is sent
+    RELEASE_SESSION_BEFORE_SERIALIZATION: bool = True
 
 
 api_settings = ApiSettings()
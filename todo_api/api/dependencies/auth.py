@@ -2,11 +2,15 @@ from typing import Annotated
 
 import structlog
 from fastapi import Depends, Request
+from sqlalchemy.orm import joinedload
 
 from todo_api.api.auth import get_bearer_token
 from todo_api.api.dependencies.database import AsyncDbSession
 from todo_api.api.exceptions import UnauthorizedError
+from todo_api.auth.cache import CachedSession, session_cache
+from todo_api.auth.models import UserSession
 from todo_api.auth.service import UserSessionService as UserSessionService_
+from todo_api.core.config import settings
 from todo_api.users.models import User
 from todo_api.utils import utc_now
 
@@ -31,6 +35,10 @@ UserSessionService = Annotated[UserSessionService_, Depends(get_user_session_ser
 class AnonymousUser: ...
 
 
+# Authentication never needs the password hash, raise if something tries to lazy load it
+USER_SESSION_OPTIONS = (joinedload(UserSession.user).defer(User.hashed_password, raiseload=True),)
+
+
 async def get_user_from_session(
     request: Request,
     auth_cookie_name: AuthCookieName,
@@ -40,10 +48,26 @@ async def get_user_from_session(
         request.headers.get("Authorization")
     )
 
-    if session_token:
-        user_session = await user_session_service.get_one_or_none(session_token=session_token)
-        if user_session and user_session.expires_at > utc_now():
-            return user_session.user
+    if not session_token:
+        return AnonymousUser()
+
+    if settings.SESSION_CACHE_ENABLED and (cached := session_cache.get(session_token)):
+        return User(id=cached.user_id, username=cached.username)
+
+    user_session = await user_session_service.get_one_or_none(
+        session_token=session_token, options=USER_SESSION_OPTIONS
+    )
+    if user_session and user_session.expires_at > utc_now():
+        if settings.SESSION_CACHE_ENABLED:
+            session_cache.set(
+                session_token,
+                CachedSession(
+                    user_id=user_session.user.id,
+                    username=user_session.user.username,
+                    expires_at=user_session.expires_at,
+                ),
+            )
+        return user_session.user
 
     return AnonymousUser()
 
@@ -1,4 +1,6 @@
-from collections.abc import AsyncGenerator, Generator
+import functools
+from collections.abc import AsyncGenerator, Callable, Coroutine, Generator
+from contextvars import ContextVar
 from typing import Annotated, Any
 
 from fastapi import Depends
@@ -6,7 +8,7 @@ from fastapi.requests import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from todo_api.core.database.base import AsyncSessionMaker, SyncSessionMaker
+from todo_api.core.database.base import get_async_session_maker, get_session_maker, has_writes
 from todo_api.core.database.service import SQLAlchemyService as SQLAlchemyService_
 
 
@@ -14,7 +16,7 @@ def get_session(request: Request) -> Generator[Session, Any]:
     if session := getattr(request.state, "session", None):
         yield session
     else:
-        with SyncSessionMaker() as session:
+        with get_session_maker()() as session:
             try:
                 request.state.session = session
                 yield session
@@ -22,17 +24,24 @@ def get_session(request: Request) -> Generator[Session, Any]:
                 session.rollback()
                 raise
             else:
-                session.commit()
+                if has_writes(session):
+                    session.commit()
 
 
 DbSession = Annotated[Session, Depends(get_session)]
 
 
+_request_async_session: ContextVar[AsyncSession | None] = ContextVar(
+    "request_async_session", default=None
+)
+
+
 async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, Any]:
     if session := getattr(request.state, "async_session", None):
         yield session
     else:
-        async with AsyncSessionMaker() as session:
+        async with get_async_session_maker()() as session:
+            token = _request_async_session.set(session)
             try:
                 request.state.async_session = session
                 yield session
@@ -40,7 +49,42 @@ async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, An
                 await session.rollback()
                 raise
             else:
-                await session.commit()
+                # Read only requests skip the COMMIT, closing the session rolls back
+                if has_writes(session):
+                    await session.commit()
+            finally:
+                _request_async_session.reset(token)
+
+
+async def release_async_session() -> None:
+    """End the transaction of the request's session and return its connection to the pool.
+
+    The session stays usable, a later query checks out a connection again.
+    """
+    if session := _request_async_session.get():
+        if has_writes(session):
+            await session.commit()
+        await session.close()
+
+
+def releasing_async_session[**P, R](
+    endpoint: Callable[P, Coroutine[Any, Any, R]],
+) -> Callable[P, Coroutine[Any, Any, R]]:
+    """Wrap `endpoint` to release the request's session as soon as it returned.
+
+    Yield dependencies exit after the response is serialized and sent, so the connection
+    would otherwise stay checked out during `response_model` validation and encoding.
+    Those can't lazy load on an async session anyway, returned instances are detached with
+    their loaded attributes.
+    """
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        response = await endpoint(*args, **kwargs)
+        await release_async_session()
+        return response
+
+    return wrapper
 
 
 AsyncDbSession = Annotated[AsyncSession, Depends(get_async_session)]
@@ -57,4 +101,6 @@ __all__ = (
     "DbSession",
     "AsyncDbSession",
     "SQLAlchemyService",
+    "release_async_session",
+    "releasing_async_session",
 )
@@ -13,6 +13,7 @@ class ErrorCode(StrEnum):
     INVALID_USERNAME_OR_PASSWORD = "INVALID_USERNAME_OR_PASSWORD"
     USERNAME_EXISTS = "USERNAME_EXISTS"
     NOT_OWNER = "NOT_OWNER"
+    INVALID_CURSOR = "INVALID_CURSOR"
 
 
 class ErrorResponse(BaseModel):
@@ -4,8 +4,10 @@ from typing import TYPE_CHECKING
 import structlog
 from fastapi import FastAPI
 
+from todo_api.api.config import api_settings
 from todo_api.api.middleware.logging import LoggingMiddleware
 from todo_api.api.middleware.prometheus import PrometheusMiddleware
+from todo_api.api.middleware.query_budget import QueryBudgetMiddleware
 from todo_api.api.middleware.request_id import RequestIdMiddleware
 
 if TYPE_CHECKING:
@@ -14,7 +16,7 @@ if TYPE_CHECKING:
 logger: structlog.stdlib.BoundLogger = structlog.get_logger()
 
 
-def configure(app: FastAPI, environment: Environment) -> None:
+def configure(app: FastAPI, environment: Environment, *, otel_metrics: bool = False) -> None:
     app.add_middleware(
         RequestIdMiddleware,
         header_name="x-request-id",
@@ -23,6 +25,20 @@ def configure(app: FastAPI, environment: Environment) -> None:
 
     if not environment.is_testing:
         logger.info("Prometheus middleware enabled")
-        app.add_middleware(PrometheusMiddleware)
+        app.add_middleware(
+            PrometheusMiddleware,
+            route_cache_size=api_settings.PROMETHEUS_ROUTE_CACHE_SIZE,
+            track_in_progress=api_settings.PROMETHEUS_IN_PROGRESS_ENABLED,
+        )
+
+    if otel_metrics:
+        from todo_api.api.middleware.otel_metrics import OpenTelemetryMetricsMiddleware
+
+        logger.info("OpenTelemetry metrics middleware enabled")
+        app.add_middleware(OpenTelemetryMetricsMiddleware)
+
+    if environment.is_development:
+        logger.info("Query budget middleware enabled")
+        app.add_middleware(QueryBudgetMiddleware, budget=api_settings.QUERY_BUDGET)
 
     app.add_middleware(LoggingMiddleware)
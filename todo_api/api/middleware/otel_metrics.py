@@ -0,0 +1,82 @@
+import time
+
+from opentelemetry import metrics
+from opentelemetry.metrics import MeterProvider
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from todo_api.api.config import api_settings
+from todo_api.version import __version__
+
+
+class OpenTelemetryMetricsMiddleware:
+    """Record the request metrics of `PrometheusMiddleware` with OpenTelemetry.
+
+    Nothing is recorded before the response, so the route template is read from the scope
+    once routing set it rather than matched up front.
+    """
+
+    def __init__(self, app: ASGIApp, meter_provider: MeterProvider | None = None) -> None:
+        self.app = app
+        meter = metrics.get_meter(__name__, __version__, meter_provider)
+        self.requests = meter.create_counter(
+            "todo_api.requests",
+            unit="{request}",
+            description="Count of requests by method and route",
+        )
+        self.responses = meter.create_counter(
+            "todo_api.responses",
+            unit="{response}",
+            description="Count of responses by method, route and status code",
+        )
+        self.request_duration = meter.create_histogram(
+            "todo_api.request.duration",
+            unit="s",
+            description="Requests process time by method, route and status code",
+            explicit_bucket_boundaries_advisory=api_settings.PROMETHEUS_LATENCY_BUCKETS,
+        )
+        self.exceptions = meter.create_counter(
+            "todo_api.exceptions",
+            unit="{exception}",
+            description="Count of exceptions raised by method, route and exception type",
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        t0 = time.perf_counter()
+
+        status_code = 418
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                nonlocal status_code
+                status_code = message["status"]
+            await send(message)
+
+        duration: float | None = None
+        exception_type: str | None = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as exc:
+            status_code = 500
+            exception_type = type(exc).__name__
+            raise exc
+        else:
+            duration = time.perf_counter() - t0
+        finally:
+            route = scope.get("route")
+            attributes = {
+                "http.request.method": scope["method"],
+                "http.route": getattr(route, "path", scope["path"]),
+            }
+            self.requests.add(1, attributes)
+            if exception_type is not None:
+                self.exceptions.add(1, {**attributes, "error.type": exception_type})
+
+            # The SDK keeps a reference to the attributes of each point, copy rather than update
+            response_attributes = {**attributes, "http.response.status_code": status_code}
+            if duration is not None:
+                self.request_duration.record(duration, response_attributes)
+            self.responses.add(1, response_attributes)
@@ -1,10 +1,13 @@
 import time
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from prometheus_client import Counter, Gauge, Histogram
-from starlette.requests import Request
 from starlette.routing import Match
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from todo_api.api.config import api_settings
+
 REQUESTS = Counter(
     "todo_api_requests_total",
     "Total count of requests by method and path",
@@ -21,6 +24,7 @@ REQUESTS_PROCESS_TIME = Histogram(
     "todo_api_requests_process_time_seconds",
     "Histogram of requests process time by method, path and status code in seconds",
     ["method", "path", "status_code"],
+    buckets=api_settings.PROMETHEUS_LATENCY_BUCKETS,
 )
 
 EXCEPTIONS = Counter(
@@ -28,26 +32,112 @@ EXCEPTIONS = Counter(
     "Total count of exceptions raised by method, path and exception type",
     ["method", "path", "exception_type"],
 )
+
 REQUESTS_IN_PROGRESS = Gauge(
     "todo_api_requests_in_progress",
     "Gauge of requests currently being processed by method and path",
     ["method", "path"],
+    multiprocess_mode="livesum",
 )
 
 
+@dataclass(slots=True)
+class RouteMetrics:
+    """Label children of one method and route template.
+
+    Looking a child up with `.labels()` takes a lock and builds the label key, so children
+    are bound once per route, and per status code on first use.
+    """
+
+    method: str
+    path: str
+    track_in_progress: bool = True
+    requests: Counter = field(init=False)
+    in_progress: Gauge | None = field(init=False)
+    _responses: dict[str, tuple[Counter, Histogram]] = field(
+        init=False, default_factory=dict[str, tuple[Counter, Histogram]]
+    )
+
+    def __post_init__(self) -> None:
+        self.requests = REQUESTS.labels(method=self.method, path=self.path)
+        self.in_progress = (
+            REQUESTS_IN_PROGRESS.labels(method=self.method, path=self.path)
+            if self.track_in_progress
+            else None
+        )
+
+    def responses(self, status_code: str) -> tuple[Counter, Histogram]:
+        children = self._responses.get(status_code)
+        if children is None:
+            labels = {"method": self.method, "path": self.path, "status_code": status_code}
+            children = RESPONSES.labels(**labels), REQUESTS_PROCESS_TIME.labels(**labels)
+            self._responses[status_code] = children
+        return children
+
+
 class PrometheusMiddleware:
-    def __init__(self, app: ASGIApp) -> None:
+    """Record request metrics labelled by the matched route template.
+
+    Resolving the template means matching the request against every route, so the result
+    is cached per app, method, root path and path in a bounded LRU cache of
+    `route_cache_size` entries. Paths of parameterised routes are cached one by one, so
+    the size should cover the paths hit repeatedly; misses fall back to matching. Routes
+    are expected not to change once the app serves requests.
+
+    Label children of every route are bound at startup. `track_in_progress=False` skips
+    the in-progress gauge, saving two updates per request.
+    """
+
+    def __init__(
+        self, app: ASGIApp, route_cache_size: int = 1024, track_in_progress: bool = True
+    ) -> None:
         self.app = app
+        self.track_in_progress = track_in_progress
+        self._route_metrics: dict[tuple[str, str], RouteMetrics] = {}
+        self._resolve_route_metrics = lru_cache(maxsize=route_cache_size)(
+            self._match_route_metrics
+        )
 
     @staticmethod
-    def get_route_path_string(request: Request) -> str:
-        for route in request.app.routes:
-            match, _ = route.matches(request.scope)
+    def _match_route_path(app: ASGIApp, method: str, root_path: str, path: str) -> str | None:
+        scope: Scope = {"type": "http", "method": method, "root_path": root_path, "path": path}
+        for route in getattr(app, "routes", ()):
+            match, _ = route.matches(scope)
             if match == Match.FULL:
                 return route.path
-        return request.url.path
+        return None
+
+    def _get_route_metrics(self, method: str, path: str) -> RouteMetrics:
+        key = (method, path)
+        route_metrics = self._route_metrics.get(key)
+        if route_metrics is None:
+            route_metrics = RouteMetrics(method, path, self.track_in_progress)
+            self._route_metrics[key] = route_metrics
+        return route_metrics
+
+    def _match_route_metrics(
+        self, app: ASGIApp, method: str, root_path: str, path: str
+    ) -> RouteMetrics:
+        route_path = self._match_route_path(app, method, root_path, path)
+        if route_path is None:
+            # Unmatched paths are only kept in the bounded cache
+            return RouteMetrics(method, path, self.track_in_progress)
+        return self._get_route_metrics(method, route_path)
+
+    def bind_routes(self, app: ASGIApp) -> None:
+        """Bind the label children of every route of `app` and its methods."""
+        for route in getattr(app, "routes", ()):
+            for method in getattr(route, "methods", None) or ():
+                self._get_route_metrics(method, route.path)
+
+    def get_route_metrics(self, scope: Scope) -> RouteMetrics:
+        return self._resolve_route_metrics(
+            scope["app"], scope["method"], scope.get("root_path", ""), scope["path"]
+        )
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            self.bind_routes(scope["app"])
         if scope["type"] not in {"http"}:
             await self.app(scope, receive, send)
             return
@@ -59,27 +149,33 @@ class PrometheusMiddleware:
         async def send_wrapper(message: Message) -> None:
             if message["type"] == "http.response.start":
                 nonlocal status_code
-                status_code = message["status"]
+                status_code = str(message["status"])
             await send(message)
 
-        request = Request(scope)
-        method = request.method
-        path = self.get_route_path_string(request)
+        route_metrics = self.get_route_metrics(scope)
+        in_progress = route_metrics.in_progress
 
-        REQUESTS_IN_PROGRESS.labels(method=method, path=path).inc()
-        REQUESTS.labels(method=method, path=path).inc()
+        if in_progress is not None:
+            in_progress.inc()
+        route_metrics.requests.inc()
 
+        duration: float | None = None
         try:
             await self.app(scope, receive, send_wrapper)
         except BaseException as exc:
             status_code = "500"
-            EXCEPTIONS.labels(method=method, path=path, exception_type=type(exc).__name__).inc()
+            EXCEPTIONS.labels(
+                method=route_metrics.method,
+                path=route_metrics.path,
+                exception_type=type(exc).__name__,
+            ).inc()
             raise exc
         else:
             duration = time.perf_counter() - t0
-            REQUESTS_PROCESS_TIME.labels(
-                method=method, path=path, status_code=status_code
-            ).observe(duration)
         finally:
-            RESPONSES.labels(method=method, path=path, status_code=status_code).inc()
-            REQUESTS_IN_PROGRESS.labels(method=method, path=path).dec()
+            responses, process_time = route_metrics.responses(status_code)
+            if duration is not None:
+                process_time.observe(duration)
+            responses.inc()
+            if in_progress is not None:
+                in_progress.dec()
@@ -0,0 +1,46 @@
+from collections import Counter
+
+import structlog
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from todo_api.core.database.query_counter import count_queries
+from todo_api.core.observability.queries import fingerprint
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger()
+
+
+class QueryBudgetMiddleware:
+    """Warn about requests executing more than `budget` database queries.
+
+    The most repeated statement shapes are logged with the warning, a shape repeated once
+    per returned row usually is a lazy load to replace with an eager loader option.
+    """
+
+    app: ASGIApp
+    budget: int
+
+    def __init__(self, app: ASGIApp, budget: int) -> None:
+        self.app = app
+        self.budget = budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        with count_queries() as counter:
+            await self.app(scope, receive, send)
+
+        if counter.count > self.budget:
+            shapes = Counter(fingerprint(statement)[1] for statement in counter.statements)
+            route = scope.get("route")
+            logger.warning(
+                "Request exceeded its query budget",
+                queries=counter.count,
+                budget=self.budget,
+                route=getattr(route, "path", scope["path"]),
+                repeated=[
+                    {"statement": shape, "count": count}
+                    for shape, count in shapes.most_common(3)
+                    if count > 1
+                ],
+            )
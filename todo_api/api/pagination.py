@@ -1,4 +1,10 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
 from collections.abc import Sequence
+from datetime import datetime
 from math import ceil
 from typing import (
     Annotated,
@@ -11,8 +17,10 @@ from typing import (
 from fastapi import Depends, Query
 from pydantic import Field, model_validator
 
-from todo_api.api.exceptions import BadRequestError
+from todo_api.api.exceptions import BadRequestError, ErrorCode
 from todo_api.api.schemas.base import BaseSchema
+from todo_api.core.config import settings
+from todo_api.core.database.service import DEFAULT_COUNT_CAP, CountStrategy, Keyset, OrderBy
 
 ModelT = TypeVar("ModelT")
 
@@ -23,6 +31,7 @@ class PaginationError(BadRequestError): ...
 class PaginationParams(NamedTuple):
     page: int
     size: int
+    count_strategy: CountStrategy = CountStrategy.EXACT
 
     @property
     def offset(self) -> int:
@@ -32,27 +41,132 @@ class PaginationParams(NamedTuple):
     def limit(self) -> int:
         return self.size
 
+    def is_total_approximate(self, total: int | None) -> bool:
+        if self.count_strategy == CountStrategy.ESTIMATE:
+            return True
+        # Counting stopped at the cap, there may be more rows
+        return (
+            self.count_strategy == CountStrategy.CAPPED
+            and total is not None
+            and total >= DEFAULT_COUNT_CAP
+        )
+
 
 async def get_pagination_params(
     page: int | None = Query(1, gt=0, description="Page number"),
     size: int | None = Query(50, gt=0, le=100, description="Page size"),
+    count: CountStrategy | None = Query(
+        CountStrategy.EXACT,
+        description=(
+            "How `total` is computed: `exact`, `none` (not counted), `estimate` (query planner "
+            f"estimate) or `capped` (exact up to {DEFAULT_COUNT_CAP})"
+        ),
+    ),
 ) -> PaginationParams:
     # Cast because of `Query` default value
     page = cast(int, page)
     size = cast(int, size)
+    count = cast(CountStrategy, count)
 
-    return PaginationParams(page, size)
+    return PaginationParams(page, size, count)
 
 
 PaginationParamsQuery = Annotated[PaginationParams, Depends(get_pagination_params)]
 
 
+class CursorPaginationParams(NamedTuple):
+    cursor: str | None
+    size: int
+
+
+async def get_cursor_pagination_params(
+    cursor: str | None = Query(
+        None, description="Opaque cursor taken from `nextCursor` of the previous page"
+    ),
+    size: int | None = Query(50, gt=0, le=100, description="Page size"),
+) -> CursorPaginationParams:
+    # Cast because of `Query` default value
+    size = cast(int, size)
+
+    return CursorPaginationParams(cursor, size)
+
+
+CursorPaginationParamsQuery = Annotated[
+    CursorPaginationParams, Depends(get_cursor_pagination_params)
+]
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(settings.SECRET.get_secret_value().encode(), payload, hashlib.sha256).digest()
+
+
+def _order_by_key(order_by: OrderBy | None) -> str | None:
+    return f"{order_by.field}.{order_by.order}" if order_by is not None else None
+
+
+def encode_cursor(keyset: Keyset, order_by: OrderBy | None) -> str:
+    """Encode `keyset` as an opaque, signed cursor token bound to `order_by`."""
+    value = keyset.value
+    payload = json.dumps(
+        {
+            "o": _order_by_key(order_by),
+            "v": value.isoformat() if isinstance(value, datetime) else value,
+            "t": isinstance(value, datetime),
+            "i": keyset.id,
+        },
+        separators=(",", ":"),
+    ).encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(cursor: str, order_by: OrderBy | None) -> Keyset:
+    """Decode a cursor created by `encode_cursor`.
+
+    Raises `PaginationError` if the cursor was tampered with or was issued for a different
+    `order_by` than the one of the current request.
+    """
+    invalid_cursor = PaginationError(detail="Invalid cursor", code=ErrorCode.INVALID_CURSOR)
+
+    try:
+        encoded_payload, encoded_signature = cursor.split(".")
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except (ValueError, binascii.Error):
+        raise invalid_cursor from None
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise invalid_cursor
+
+    data = cast(dict[str, Any], json.loads(payload))
+    if data["o"] != _order_by_key(order_by):
+        raise PaginationError(
+            detail="Cursor was issued for a different ordering",
+            code=ErrorCode.INVALID_CURSOR,
+        )
+
+    value = datetime.fromisoformat(data["v"]) if data["t"] else data["v"]
+    return Keyset(value=value, id=data["i"])
+
+
 class Paginated[ModelT](BaseSchema):
     items: Sequence[ModelT]
     page: Annotated[int, Field(gt=0, description="Page number")]
     size: Annotated[int, Field(gt=0, le=100, description="Page size")]
     pages: Annotated[int | None, Field(gt=0, description="Number of pages")]
-    total: Annotated[int, Field(ge=0, description="Total number of items")]
+    total: Annotated[
+        int | None, Field(ge=0, description="Total number of items, `null` if not counted")
+    ]
+    approximate_total: Annotated[
+        bool, Field(description="Whether `total` (and `pages`) is an estimate")
+    ] = False
 
     @model_validator(mode="before")
     @classmethod
@@ -66,7 +180,17 @@ class Paginated[ModelT](BaseSchema):
 
             size = cast(Any, data.get("size"))  # pyright: ignore[reportUnknownMemberType]
 
-            if isinstance(total, int) and isinstance(size, int) and size > 0:
+            if total is None:
+                data["pages"] = None
+            elif isinstance(total, int) and isinstance(size, int) and size > 0:
                 data["pages"] = ceil(total / size) if total > 0 and size > 0 else 1
 
         return data  # pyright: ignore[reportUnknownVariableType]
+
+
+class CursorPaginated[ModelT](BaseSchema):
+    items: Sequence[ModelT]
+    size: Annotated[int, Field(gt=0, le=100, description="Page size")]
+    next_cursor: Annotated[
+        str | None, Field(description="Cursor of the next page, `null` on the last page")
+    ]
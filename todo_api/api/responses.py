@@ -0,0 +1,93 @@
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, replace
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi._compat.v2 import ModelField
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse as JSONResponse_
+from fastapi.routing import APIRoute
+from pydantic.main import IncEx
+from pydantic_core import to_json
+
+from todo_api.api.config import api_settings
+from todo_api.api.dependencies.database import releasing_async_session
+
+
+@dataclass(frozen=True, slots=True)
+class SerializedJSON:
+    body: bytes
+
+
+class JSONResponse(JSONResponse_):
+    """JSON response encoded by pydantic-core instead of the stdlib `json` module.
+
+    Bodies already serialized by `JSONRoute` are sent as they are.
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        if isinstance(content, SerializedJSON):
+            return content.body
+        return to_json(content, inf_nan_mode="null")
+
+
+# Relies on FastAPI internals (`_type_adapter`), fastapi is pinned exactly for it
+@dataclass
+class _JSONModelField(ModelField):
+    def serialize(
+        self,
+        value: Any,  # noqa: ANN401
+        *,
+        mode: str = "json",
+        include: IncEx | None = None,
+        exclude: IncEx | None = None,
+        by_alias: bool = True,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> SerializedJSON:
+        return SerializedJSON(
+            self._type_adapter.dump_json(
+                value,
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
+        )
+
+
+class JSONRoute(APIRoute):
+    """Route that dumps the validated `response_model` value straight to JSON bytes.
+
+    FastAPI dumps the validated value to JSON-compatible Python objects which the response
+    class then encodes again. When the route responds with `JSONResponse`, the value is
+    dumped once by the response model's pydantic serializer instead.
+
+    Async endpoints release the request's database session as soon as they return, so the
+    connection isn't held while the response is validated, serialized and sent.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        response_class = (
+            self.response_class.value
+            if isinstance(self.response_class, DefaultPlaceholder)
+            else self.response_class
+        )
+        field = self.secure_cloned_response_field
+        if isinstance(field, ModelField) and issubclass(response_class, JSONResponse):
+            # FastAPI's own pydantic v2 field doesn't statically match its `ModelField` protocol
+            self.secure_cloned_response_field = _JSONModelField(  # pyright: ignore[reportAttributeAccessIssue]
+                field_info=field.field_info, name=field.name, mode=field.mode
+            )
+        if (
+            api_settings.RELEASE_SESSION_BEFORE_SERIALIZATION
+            and self.dependant.is_coroutine_callable
+        ):
+            self.dependant = replace(self.dependant, call=releasing_async_session(self.endpoint))
+        return super().get_route_handler()
+
+
+__all__ = ("JSONResponse", "JSONRoute", "SerializedJSON")
@@ -3,9 +3,16 @@ from fastapi import APIRouter
 from todo_api.api.routers.metrics import router as metrics_router
 from todo_api.api.routers.todos import router as todos_router
 from todo_api.api.routers.users import router as users_router
+from todo_api.core.config import settings
 
 router_v1 = APIRouter(prefix="/v1")
 
 router_v1.include_router(metrics_router)
 router_v1.include_router(todos_router)
 router_v1.include_router(users_router)
+
+# Statement text and timings are for debugging, only exposed in development and testing
+if settings.ENVIRONMENT.is_development or settings.ENVIRONMENT.is_testing:
+    from todo_api.api.routers.debug import router as debug_router
+
+    router_v1.include_router(debug_router)
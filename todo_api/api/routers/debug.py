@@ -0,0 +1,21 @@
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Query
+
+from todo_api.api.responses import JSONRoute
+from todo_api.api.schemas import debug as schemas
+from todo_api.core.observability.queries import query_stats
+
+router = APIRouter(prefix="/debug", tags=["debug"], route_class=JSONRoute)
+
+
+@router.get("/queries", response_model=list[schemas.QueryShapeRead])
+async def get_query_stats(
+    limit: Annotated[int, Query(gt=0, le=500, description="Number of statement shapes")] = 20,
+    order_by: Annotated[
+        Literal["total_time", "mean_time", "max_time", "count"],
+        Query(description="Statistic the shapes are sorted by, descending"),
+    ] = "total_time",
+):
+    """Slowest statement shapes executed by this worker, by service method."""
+    return query_stats.top(limit, order_by)
@@ -1,30 +1,31 @@
+from functools import cache
+
 from fastapi import APIRouter, status
-from fastapi.requests import Request
 from fastapi.responses import Response
-from prometheus_client import (
-    CONTENT_TYPE_LATEST,
-    REGISTRY,
-    CollectorRegistry,
-    generate_latest,
-    multiprocess,
-)
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
 
 from todo_api.core.config import settings
+from todo_api.core.observability.multiprocess import MultiProcessScrape
 
 router = APIRouter()
 
 
+@cache
+def get_multiprocess_scrape(path: str) -> MultiProcessScrape:
+    return MultiProcessScrape(path, ttl=settings.PROMETHEUS_SCRAPE_CACHE_TTL)
+
+
 @router.get("/metrics", include_in_schema=False)
-def handle_metrics(request: Request) -> Response:
+async def handle_metrics() -> Response:
     headers = {"Content-Type": CONTENT_TYPE_LATEST}
-    registry = REGISTRY
 
     if settings.PROMETHEUS_MULTIPROC_DIR:
-        registry = CollectorRegistry()
-        multiprocess.MultiProcessCollector(registry)
+        body = await get_multiprocess_scrape(settings.PROMETHEUS_MULTIPROC_DIR).generate()
+    else:
+        body = generate_latest(REGISTRY)
 
     return Response(
-        generate_latest(registry),
+        body,
         status_code=status.HTTP_200_OK,
         headers=headers,
     )
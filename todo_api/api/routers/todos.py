@@ -1,13 +1,51 @@
+from collections.abc import Sequence
+from typing import Any, NoReturn
+
 from fastapi import APIRouter, status
+from sqlalchemy.orm import load_only
 
 from todo_api.api import exceptions, pagination, sorting
 from todo_api.api.dependencies.auth import CurrentUser
 from todo_api.api.dependencies.todos import TodoService
-from todo_api.api.exceptions import ForbiddenError
+from todo_api.api.exceptions import ApiError, ForbiddenError, NotFoundError
+from todo_api.api.responses import JSONRoute
 from todo_api.api.schemas import todos as schemas
 from todo_api.todos.models import Todo
 
-router = APIRouter(prefix="/todos", tags=["todos"])
+router = APIRouter(prefix="/todos", tags=["todos"], route_class=JSONRoute)
+
+# List endpoints only select the columns `TodoRead` serializes
+TODO_READ_COLUMNS = tuple(schemas.TodoRead.model_fields)
+TODO_READ_OPTIONS = (load_only(*(getattr(Todo, column) for column in TODO_READ_COLUMNS)),)
+
+
+def _batch_error(id: int, exc: ApiError) -> dict[str, Any]:
+    return {"id": id, "status": exc.status_code, "error": exc.to_response()}
+
+
+async def _raise_not_owned(todo_service: TodoService, id: int) -> NoReturn:
+    """Tell apart a missing todo from someone else's after an ownership-filtered write."""
+    if await todo_service.exists(id=id):
+        raise ForbiddenError(code=exceptions.ErrorCode.NOT_OWNER)
+    raise NotFoundError(detail="No record found")
+
+
+def _check_batch_ownership(
+    ids: Sequence[int], todos: Sequence[Todo], user_id: int
+) -> tuple[dict[int, Todo], dict[int, dict[str, Any]]]:
+    """Split requested ids into owned todos and per-item errors."""
+    todos_by_id = {todo.id: todo for todo in todos}
+    owned: dict[int, Todo] = {}
+    errors: dict[int, dict[str, Any]] = {}
+    for id in ids:
+        todo = todos_by_id.get(id)
+        if todo is None:
+            errors[id] = _batch_error(id, NotFoundError(detail="No record found"))
+        elif todo.user_id != user_id:
+            errors[id] = _batch_error(id, ForbiddenError(code=exceptions.ErrorCode.NOT_OWNER))
+        else:
+            owned[id] = todo
+    return owned, errors
 
 
 @router.get(
@@ -21,20 +59,120 @@ async def get_user_todo(
     user: CurrentUser,
     todo_service: TodoService,
 ):
-    todos, total = await todo_service.list_and_count(
+    todos, total = await todo_service.list_rows_and_count(
+        columns=TODO_READ_COLUMNS,
         user_id=user.id,
         offset=pagination_params.offset,
         limit=pagination_params.limit,
         order_by=order_by,
+        count_strategy=pagination_params.count_strategy,
     )
     return {
         "items": todos,
         "total": total,
+        "approximate_total": pagination_params.is_total_approximate(total),
         "page": pagination_params.page,
         "size": pagination_params.size,
     }
 
 
+@router.get(
+    "/me/cursor",
+    response_model=pagination.CursorPaginated[schemas.TodoRead],
+    responses={
+        400: {"description": "Bad Request", "model": exceptions.ErrorResponse},
+        401: {"description": "Unauthorized", "model": exceptions.ErrorResponse},
+    },
+)
+async def get_user_todo_cursor(
+    pagination_params: pagination.CursorPaginationParamsQuery,
+    order_by: sorting.TimestampOrderByParamsQuery,
+    user: CurrentUser,
+    todo_service: TodoService,
+):
+    keyset = (
+        pagination.decode_cursor(pagination_params.cursor, order_by)
+        if pagination_params.cursor
+        else None
+    )
+    todos, next_keyset = await todo_service.list_keyset(
+        user_id=user.id,
+        keyset=keyset,
+        limit=pagination_params.size,
+        order_by=order_by,
+        options=TODO_READ_OPTIONS,
+    )
+    return {
+        "items": todos,
+        "size": pagination_params.size,
+        "next_cursor": (
+            pagination.encode_cursor(next_keyset, order_by) if next_keyset is not None else None
+        ),
+    }
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=schemas.TodoBatchResult,
+    responses={401: {"description": "Unauthorized", "model": exceptions.ErrorResponse}},
+)
+async def create_todo_batch(
+    data: schemas.TodoBatchCreate, user: CurrentUser, todo_service: TodoService
+):
+    todos = await todo_service.create_many(
+        [Todo(user_id=user.id, **item.model_dump()) for item in data.items]
+    )
+    return {
+        "items": [
+            {"id": todo.id, "status": status.HTTP_201_CREATED, "item": todo} for todo in todos
+        ]
+    }
+
+
+@router.patch(
+    "/batch",
+    response_model=schemas.TodoBatchResult,
+    responses={401: {"description": "Unauthorized", "model": exceptions.ErrorResponse}},
+)
+async def update_todo_batch(
+    data: schemas.TodoBatchUpdate, user: CurrentUser, todo_service: TodoService
+):
+    ids = [item.id for item in data.items]
+    owned, errors = _check_batch_ownership(ids, await todo_service.list_by_ids(ids), user.id)
+
+    for item in data.items:
+        if todo := owned.get(item.id):
+            for key, value in item.model_dump(exclude_unset=True, exclude={"id"}).items():
+                setattr(todo, key, value)
+    updated = {todo.id: todo for todo in await todo_service.update_many(list(owned.values()))}
+
+    return {
+        "items": [
+            errors.get(id) or {"id": id, "status": status.HTTP_200_OK, "item": updated[id]}
+            for id in ids
+        ]
+    }
+
+
+@router.delete(
+    "/batch",
+    response_model=schemas.TodoBatchResult,
+    responses={401: {"description": "Unauthorized", "model": exceptions.ErrorResponse}},
+)
+async def delete_todo_batch(
+    data: schemas.TodoBatchDelete, user: CurrentUser, todo_service: TodoService
+):
+    ids = data.ids
+    owned, errors = _check_batch_ownership(ids, await todo_service.list_by_ids(ids), user.id)
+
+    await todo_service.delete_many(list(owned))
+
+    return {
+        "items": [errors.get(id) or {"id": id, "status": status.HTTP_204_NO_CONTENT} for id in ids]
+    }
+
+
 @router.get(
     "/{id}",
     response_model=schemas.TodoRead,
@@ -72,13 +210,10 @@ async def update_todo(
     data: schemas.TodoUpdate,
     todo_service: TodoService,
 ):
-    todo = await todo_service.get_one(id=id)
-    if todo.user_id != user.id:
-        raise ForbiddenError(code=exceptions.ErrorCode.NOT_OWNER)
-
-    for key, value in data.model_dump(exclude_unset=True).items():
-        setattr(todo, key, value)
-    return await todo_service.update(todo)
+    todo = await todo_service.update_owned(id, user.id, data.model_dump(exclude_unset=True))
+    if todo is None:
+        await _raise_not_owned(todo_service, id)
+    return todo
 
 
 @router.delete(
@@ -91,7 +226,5 @@ async def update_todo(
     },
 )
 async def delete_todo(id: int, user: CurrentUser, todo_service: TodoService):
-    todo = await todo_service.get_one(id=id)
-    if todo.user_id != user.id:
-        raise ForbiddenError(code=exceptions.ErrorCode.NOT_OWNER)
-    await todo_service.delete(id)
+    if await todo_service.delete_owned(id, user.id) is None:
+        await _raise_not_owned(todo_service, id)
@@ -13,6 +13,7 @@ from todo_api.api.dependencies.auth import (
 )
 from todo_api.api.dependencies.users import UserService
 from todo_api.api.exceptions import ConflictError, ForbiddenError, UnauthorizedError
+from todo_api.api.responses import JSONRoute
 from todo_api.api.schemas import users as schemas
 from todo_api.auth import service as auth_service
 from todo_api.auth.models import UserSession
@@ -20,7 +21,7 @@ from todo_api.core.config import settings
 from todo_api.users import security
 from todo_api.users.models import User
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(prefix="/users", tags=["users"], route_class=JSONRoute)
 
 
 @router.get(
@@ -54,7 +55,7 @@ async def login(
         raise ForbiddenError(code=exceptions.ErrorCode.ALREADY_LOGGED_IN)
 
     user = await user_service.get_one_or_none(username=data.username)
-    if not user or not security.verify_password(
+    if not user or not await security.verify_password_async(
         data.password.get_secret_value(), user.hashed_password
     ):
         raise UnauthorizedError(
@@ -105,7 +106,7 @@ async def register(
 
     user = User(
         username=data.username,
-        hashed_password=security.get_password_hash(data.password.get_secret_value()),
+        hashed_password=await security.get_password_hash_async(data.password.get_secret_value()),
     )
     return await user_service.create(user)
 
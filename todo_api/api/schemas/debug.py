@@ -0,0 +1,12 @@
+from todo_api.api.schemas.base import BaseSchema
+
+
+class QueryShapeRead(BaseSchema):
+    statement_id: str
+    statement: str
+    service_method: str
+    count: int
+    total_time: float
+    mean_time: float
+    max_time: float
+    rows: int
@@ -1,5 +1,15 @@
+from pydantic import Field, field_validator
+
+from todo_api.api.exceptions import ErrorResponse
 from todo_api.api.schemas.base import BaseSchema, BaseSchemaId, Timestamp
 
+BATCH_MAX_SIZE = 100
+
+
+def _check_unique_ids(ids: list[int]) -> None:
+    if len(set(ids)) != len(ids):
+        raise ValueError("Ids must be unique")
+
 
 class TodoBase(BaseSchema):
     title: str
@@ -15,3 +25,54 @@ class TodoCreate(TodoBase):
 
 
 class TodoUpdate(TodoBase): ...
+
+
+class TodoBatchUpdateItem(BaseSchemaId[int]):
+    """Omitted fields are left unchanged."""
+
+    title: str | None = None
+    description: str | None = None
+    is_completed: bool | None = None
+
+    @field_validator("title", "is_completed")
+    @classmethod
+    def not_null(cls, value: object) -> object:
+        # Only runs for values sent by the client, omitted fields keep the `None` default
+        if value is None:
+            raise ValueError("Field may not be null")
+        return value
+
+
+class TodoBatchCreate(BaseSchema):
+    items: list[TodoCreate] = Field(min_length=1, max_length=BATCH_MAX_SIZE)
+
+
+class TodoBatchUpdate(BaseSchema):
+    items: list[TodoBatchUpdateItem] = Field(min_length=1, max_length=BATCH_MAX_SIZE)
+
+    @field_validator("items")
+    @classmethod
+    def unique_ids(cls, items: list[TodoBatchUpdateItem]) -> list[TodoBatchUpdateItem]:
+        _check_unique_ids([item.id for item in items])
+        return items
+
+
+class TodoBatchDelete(BaseSchema):
+    ids: list[int] = Field(min_length=1, max_length=BATCH_MAX_SIZE)
+
+    @field_validator("ids")
+    @classmethod
+    def unique_ids(cls, ids: list[int]) -> list[int]:
+        _check_unique_ids(ids)
+        return ids
+
+
+class TodoBatchItemResult(BaseSchema):
+    id: int | None
+    status: int
+    item: TodoRead | None = None
+    error: ErrorResponse | None = None
+
+
+class TodoBatchResult(BaseSchema):
+    items: list[TodoBatchItemResult]
@@ -0,0 +1,108 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from prometheus_client import Counter
+from sqlalchemy import Connection, event
+from sqlalchemy.orm import Mapper
+
+from todo_api.auth.models import UserSession
+from todo_api.core.config import settings
+from todo_api.utils import utc_now
+
+SESSION_CACHE_HITS = Counter(
+    "todo_api_session_cache_hits_total",
+    "Total count of session lookups served from the in-process session cache",
+)
+
+SESSION_CACHE_MISSES = Counter(
+    "todo_api_session_cache_misses_total",
+    "Total count of session lookups not found in the in-process session cache",
+)
+
+SESSION_CACHE_EVICTIONS = Counter(
+    "todo_api_session_cache_evictions_total",
+    "Total count of entries removed from the in-process session cache by reason",
+    ["reason"],
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedSession:
+    user_id: int
+    username: str
+    expires_at: datetime
+
+
+def hash_session_token(session_token: str) -> str:
+    return hashlib.sha256(session_token.encode()).hexdigest()
+
+
+class SessionCache:
+    """Bounded TTL + LRU cache of validated user sessions keyed by session token hash.
+
+    An entry lives for at most `ttl` seconds and never past the session's `expires_at`.
+    Sessions deleted in another process stay valid here until the entry expires,
+    so `ttl` bounds how long a revoked session can still authenticate.
+    """
+
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[CachedSession, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, session_token: str) -> CachedSession | None:
+        key = hash_session_token(session_token)
+        entry = self._entries.get(key)
+        if entry is None:
+            SESSION_CACHE_MISSES.inc()
+            return None
+
+        cached_session, deadline = entry
+        if deadline <= time.monotonic() or cached_session.expires_at <= utc_now():
+            del self._entries[key]
+            SESSION_CACHE_EVICTIONS.labels(reason="expired").inc()
+            SESSION_CACHE_MISSES.inc()
+            return None
+
+        self._entries.move_to_end(key)
+        SESSION_CACHE_HITS.inc()
+        return cached_session
+
+    def set(self, session_token: str, cached_session: CachedSession) -> None:
+        if self.max_size <= 0:
+            return
+
+        key = hash_session_token(session_token)
+        self._entries[key] = (cached_session, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            SESSION_CACHE_EVICTIONS.labels(reason="size").inc()
+
+    def invalidate(self, session_token: str) -> None:
+        self._entries.pop(hash_session_token(session_token), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+session_cache = SessionCache(
+    max_size=settings.SESSION_CACHE_MAX_SIZE, ttl=settings.SESSION_CACHE_TTL
+)
+
+
+@event.listens_for(UserSession, "after_delete")
+def _invalidate_deleted_session(  # pyright: ignore[reportUnusedFunction]
+    mapper: Mapper[UserSession], connection: Connection, target: UserSession
+) -> None:
+    session_cache.invalidate(target.session_token)
+
+
+__all__ = ("CachedSession", "SessionCache", "hash_session_token", "session_cache")
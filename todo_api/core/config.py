@@ -1,5 +1,7 @@
+import os
 from datetime import timedelta
 from enum import StrEnum
+from typing import Literal
 
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings
@@ -44,18 +46,46 @@ class Settings(BaseSettings):
     ENABLED_LOGGERS: list[str] = ["granian", "sqlalchemy", "opentelemetry"]
 
     OTEL_ENABLED: bool = True
+    # Production trace sampling: "ratio" keeps OTEL_SAMPLING_RATIO of the traces, "adaptive"
+    # OTEL_SAMPLING_ROUTE_RATE traces per second per route plus all failed or slow ones
+    OTEL_SAMPLER: Literal["ratio", "adaptive"] = "ratio"
+    OTEL_SAMPLING_RATIO: float = 0.1
+    OTEL_SAMPLING_ROUTE_RATE: float = 1  # traces per second
+    OTEL_TAIL_LATENCY_THRESHOLD: float = 1  # seconds
+    # Export request, DB pool and service metrics over OTLP next to the Prometheus ones
+    OTEL_METRICS_ENABLED: bool = False
+    OTEL_METRICS_EXPORT_INTERVAL: float = 15  # seconds
     OTLP_GRPC_ENDPOINT: str = "127.0.0.1:4317"
     OTLP_EXPORTER_INSECURE: bool = True
     SECRET: SecretStr = SecretStr("Q3VmtUkDnRt17XmYdodWHC_laJ1sOFeyof7bgGP1RC4")
     USER_SESSION_TTL: int = 24 * 31  # hours
+    SESSION_CACHE_ENABLED: bool = True
+    SESSION_CACHE_MAX_SIZE: int = 10_000
+    SESSION_CACHE_TTL: int = 60  # seconds
+    # argon2 is CPU-bound, leave a core for the event loop
+    PASSWORD_HASHING_CONCURRENCY: int = max(1, (os.cpu_count() or 1) - 1)
     JWT_EXPIRATION: int = 3600 * 72  # seconds
     PROMETHEUS_MULTIPROC_DIR: str | None = "/tmp/prometheus"
+    PROMETHEUS_SCRAPE_CACHE_TTL: float = 1  # seconds
 
     DB_HOST: str = "127.0.0.1"
     DB_DATABASE: str = "todo_api"
     DB_USER: str = "todo_api"
     DB_PASSWORD: SecretStr = SecretStr("todo_api")
     DB_PORT: int = 5432
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30  # seconds
+    DB_POOL_RECYCLE: int = 3600  # seconds
+    DB_PRE_PING: bool = True
+    # Disable behind PgBouncer in transaction mode, prepared statements are per connection
+    DB_PREPARED_STATEMENTS: bool = True
+    # Executions of a query on a connection before psycopg prepares it server-side
+    DB_PREPARE_THRESHOLD: int = 5
+    # Full DSNs (`postgresql+psycopg://...`) of read replicas, reads are routed there when set
+    DB_REPLICA_DSNS: list[SecretStr] = []
+    # Query time and rows by statement shape and service method, see `/api/v1/debug/queries`
+    DB_QUERY_STATS_ENABLED: bool = True
 
     def get_user_session_ttl_timedelta(self) -> timedelta:
         return timedelta(hours=self.USER_SESSION_TTL)
@@ -70,5 +100,11 @@ class Settings(BaseSettings):
             database=self.DB_DATABASE,
         ).render_as_string(hide_password=False)
 
+    def get_prepare_threshold(self) -> int | None:
+        return self.DB_PREPARE_THRESHOLD if self.DB_PREPARED_STATEMENTS else None
+
+    def get_postgres_replica_dsns(self) -> list[str]:
+        return [dsn.get_secret_value() for dsn in self.DB_REPLICA_DSNS]
+
 
 settings = Settings()
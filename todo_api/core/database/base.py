@@ -1,15 +1,26 @@
-from opentelemetry.instrumentation.sqlalchemy import (  # pyright: ignore[reportMissingTypeStubs]
-    SQLAlchemyInstrumentor,
-)
-from sqlalchemy import Engine, MetaData, create_engine as _create_engine
-from sqlalchemy.ext.asyncio import (
-    AsyncEngine,
-    async_sessionmaker,
-    create_async_engine as _create_async_engine,
+from functools import cache
+from typing import Any
+
+import sqlalchemy
+import sqlalchemy.ext.asyncio
+from sqlalchemy import Engine, MetaData, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    ORMExecuteState,
+    Session,
+    SessionTransaction,
+    UOWTransaction,
+    sessionmaker,
 )
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from todo_api.core.config import settings
+from todo_api.core.database.routing import RoutingSession
+from todo_api.core.observability.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+)
+from todo_api.core.observability.queries import query_stats
 
 metadata_ = MetaData(
     naming_convention={
@@ -22,23 +33,44 @@ metadata_ = MetaData(
 )
 
 
+def _connect_args(app_name: str | None, prepare_threshold: int | None) -> dict[str, Any]:
+    # psycopg prepares a query server-side once it ran `prepare_threshold` times on a connection
+    connect_args: dict[str, Any] = {"prepare_threshold": prepare_threshold}
+    if app_name:
+        connect_args["server_settings"] = {"application_name": app_name}
+    return connect_args
+
+
 def create_engine(
     *,
     dsn: str,
     app_name: str | None = None,
     pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_timeout: float = 30,
     pool_recycle: int = 3600,
     pool_pre_ping: bool = True,
+    pool_name: str | None = None,
+    prepare_threshold: int | None = 5,
+    track_queries: bool = True,
     debug: bool = False,
 ) -> Engine:
-    return _create_engine(
+    # Looked up at call time so engines are traced once `instrument_engine_creation` ran
+    engine = sqlalchemy.create_engine(
         dsn,
         echo=debug,
+        poolclass=InstrumentedQueuePool,
         pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
         pool_recycle=pool_recycle,
         pool_pre_ping=pool_pre_ping,
-        connect_args={"server_settings": {"application_name": app_name}} if app_name else {},
+        pool_logging_name=pool_name,
+        connect_args=_connect_args(app_name, prepare_threshold),
     )
+    if track_queries:
+        query_stats.track(engine)
+    return engine
 
 
 def create_async_engine(
@@ -46,29 +78,164 @@ def create_async_engine(
     dsn: str,
     app_name: str | None = None,
     pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_timeout: float = 30,
     pool_recycle: int = 3600,
     pool_pre_ping: bool = True,
+    pool_name: str | None = None,
+    prepare_threshold: int | None = 5,
+    track_queries: bool = True,
     debug: bool = False,
 ) -> AsyncEngine:
-    return _create_async_engine(
+    engine = sqlalchemy.ext.asyncio.create_async_engine(
         dsn,
         echo=debug,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
         pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
         pool_recycle=pool_recycle,
         pool_pre_ping=pool_pre_ping,
-        connect_args={"server_settings": {"application_name": app_name}} if app_name else {},
+        pool_logging_name=pool_name,
+        connect_args=_connect_args(app_name, prepare_threshold),
     )
+    if track_queries:
+        query_stats.track(engine.sync_engine)
+    return engine
 
 
-engine = create_engine(dsn=settings.get_postgres_dsn(), debug=settings.ENVIRONMENT.is_qa)
-async_engine = create_async_engine(
-    dsn=settings.get_postgres_dsn(), debug=settings.ENVIRONMENT.is_qa
-)
+@cache
+def instrument_engine_creation() -> None:
+    """Trace every engine created from now on with OpenTelemetry."""
+    from opentelemetry.instrumentation.sqlalchemy import (  # pyright: ignore[reportMissingTypeStubs]
+        SQLAlchemyInstrumentor,
+    )
+
+    SQLAlchemyInstrumentor().instrument()
+
+
+# Engines are built on first use rather than at import time: creating one imports
+# the DB driver and OTel instrumentation, and most processes only need the async one.
+@cache
+def get_engine() -> Engine:
+    instrument_engine_creation()
+    return create_engine(
+        dsn=settings.get_postgres_dsn(),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_PRE_PING,
+        prepare_threshold=settings.get_prepare_threshold(),
+        track_queries=settings.DB_QUERY_STATS_ENABLED,
+        debug=settings.ENVIRONMENT.is_qa,
+    )
+
+
+@cache
+def get_async_engine() -> AsyncEngine:
+    instrument_engine_creation()
+    return create_async_engine(
+        dsn=settings.get_postgres_dsn(),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_PRE_PING,
+        prepare_threshold=settings.get_prepare_threshold(),
+        track_queries=settings.DB_QUERY_STATS_ENABLED,
+        debug=settings.ENVIRONMENT.is_qa,
+    )
+
+
+@cache
+def get_async_replica_engines() -> tuple[AsyncEngine, ...]:
+    instrument_engine_creation()
+    return tuple(
+        create_async_engine(
+            dsn=dsn,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_PRE_PING,
+            prepare_threshold=settings.get_prepare_threshold(),
+            track_queries=settings.DB_QUERY_STATS_ENABLED,
+            pool_name=f"async_replica_{i}",
+            debug=settings.ENVIRONMENT.is_qa,
+        )
+        for i, dsn in enumerate(settings.get_postgres_replica_dsns())
+    )
+
+
+@cache
+def get_session_maker() -> sessionmaker[Session]:
+    return sessionmaker(get_engine(), expire_on_commit=False)
+
+
+@cache
+def get_async_session_maker() -> async_sessionmaker[AsyncSession]:
+    if replicas := get_async_replica_engines():
+        return async_sessionmaker(
+            get_async_engine(),
+            expire_on_commit=False,
+            sync_session_class=RoutingSession,
+            replicas=[replica.sync_engine for replica in replicas],
+        )
+
+    return async_sessionmaker(get_async_engine(), expire_on_commit=False)
+
+
+async def dispose_engines() -> None:
+    """Dispose the engines that were created, the next use creates new ones."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_async_replica_engines.cache_info().currsize:
+        for replica in get_async_replica_engines():
+            await replica.dispose()
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+
+    for getter in (
+        get_async_session_maker,
+        get_session_maker,
+        get_async_replica_engines,
+        get_async_engine,
+        get_engine,
+    ):
+        getter.cache_clear()
+
+
+_HAS_WRITES = "todo_api_has_writes"
+
+
+def _after_flush(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[_HAS_WRITES] = True
+
+
+def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    # Bulk DML and raw SQL, anything but a `SELECT` may have written
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_HAS_WRITES] = True
+
+
+def _after_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_HAS_WRITES, None)
+
+
+event.listen(Session, "after_flush", _after_flush)
+event.listen(Session, "do_orm_execute", _do_orm_execute)
+event.listen(Session, "after_transaction_end", _after_transaction_end)
+
 
-SQLAlchemyInstrumentor().instrument(engines=[engine, async_engine.sync_engine])
+def has_writes(session: Session | AsyncSession) -> bool:
+    """Whether `session` has changes to flush, or its transaction may have written.
 
-SyncSessionMaker = sessionmaker(engine, expire_on_commit=False)
-AsyncSessionMaker = async_sessionmaker(async_engine, expire_on_commit=False)
+    Otherwise `commit()` has nothing to persist, and the transaction can end with the
+    `ROLLBACK` of closing the session instead, skipping the flush and expiry work.
+    """
+    return bool(session.info.get(_HAS_WRITES) or session.new or session.deleted or session.dirty)
 
 
 class Model(DeclarativeBase):
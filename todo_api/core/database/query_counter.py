@@ -0,0 +1,57 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+_query_counter: ContextVar[QueryCounter | None] = ContextVar("query_counter", default=None)
+
+
+@dataclass(slots=True)
+class QueryCounter:
+    """Queries executed while counting, on any engine, including lazy loads and flushes"""
+
+    parent: QueryCounter | None = None
+    count: int = 0
+    statements: list[str] = field(default_factory=list[str])
+
+
+def _before_cursor_execute(
+    conn: Any,  # noqa: ANN401
+    cursor: Any,  # noqa: ANN401
+    statement: str,
+    *_: Any,  # noqa: ANN401
+) -> None:
+    counter = _query_counter.get()
+    # Nested counters each count the queries run within them
+    while counter is not None:
+        counter.count += 1
+        counter.statements.append(statement)
+        counter = counter.parent
+
+
+@cache
+def _listen() -> None:
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@contextmanager
+def count_queries() -> Generator[QueryCounter]:
+    """Count the queries executed in the current context until the block exits.
+
+    The counter follows the context into tasks and threads started within the block, so
+    wrapping a request counts the queries of every dependency and of the endpoint.
+    """
+    _listen()
+    counter = QueryCounter(parent=_query_counter.get())
+    token = _query_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _query_counter.reset(token)
+
+
+__all__ = ("QueryCounter", "count_queries")
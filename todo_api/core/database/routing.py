@@ -0,0 +1,53 @@
+import itertools
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Connection, Engine, Select
+from sqlalchemy.orm import Mapper, Session
+from sqlalchemy.sql import ClauseElement
+
+from todo_api.core.database.service import Explain
+
+_replica_counter = itertools.count()
+
+
+def _is_read_only(clause: ClauseElement | None) -> bool:
+    if isinstance(clause, Explain):
+        clause = clause.statement
+    if not isinstance(clause, Select):
+        return False
+    return clause._for_update_arg is None  # pyright: ignore[reportPrivateUsage]
+
+
+class RoutingSession(Session):
+    """Session that sends plain `SELECT`s, and their `EXPLAIN`s, to a read replica.
+
+    Each session picks one replica round-robin on its first read, so reads in one
+    request see a single consistent replica. Everything else - flushes, DML,
+    `SELECT ... FOR UPDATE`, raw SQL - goes to the primary, and once that happened
+    all following reads do too, so a request always reads its own writes.
+    """
+
+    def __init__(self, *, replicas: Sequence[Engine] = (), **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(**kwargs)
+        self.replicas = replicas
+        self.replica: Engine | None = None
+        self.uses_primary = False
+
+    def get_bind(
+        self,
+        mapper: Mapper[Any] | type[Any] | None = None,
+        *,
+        clause: ClauseElement | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Engine | Connection:
+        if self.replicas and not self.uses_primary and _is_read_only(clause):
+            if self.replica is None:
+                self.replica = self.replicas[next(_replica_counter) % len(self.replicas)]
+            return self.replica
+
+        self.uses_primary = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+__all__ = ("RoutingSession",)
@@ -2,13 +2,35 @@
 
 from collections.abc import Generator, Iterable, Sequence
 from contextlib import contextmanager
-from typing import Any, Literal, NamedTuple, TypeVar, cast
+from dataclasses import dataclass, field as dataclass_field
+from enum import StrEnum
+from functools import lru_cache
+from typing import Any, ClassVar, Literal, NamedTuple, TypeVar, cast
 
 import structlog
-from sqlalchemy import Select, asc, desc, func as sqla_func, select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    asc,
+    bindparam,
+    delete as sqla_delete,
+    desc,
+    func as sqla_func,
+    select,
+    tuple_,
+    update as sqla_update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute, QueryableAttribute, class_mapper
+from sqlalchemy.orm.base import instance_state
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.cache_key import HasCacheKey
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from todo_api.core.database.exceptions import (
     DatabaseOperationError,
@@ -24,6 +46,51 @@ class OrderBy(NamedTuple):
     order: Literal["asc", "desc"]
 
 
+class Keyset(NamedTuple):
+    """Sort key of the last row of a page; the next page starts right after it."""
+
+    value: Any
+    id: Any
+
+
+class CountStrategy(StrEnum):
+    """How `list_and_count` computes the total number of rows.
+
+    - `EXACT`: `SELECT count(*)` over the filtered rows
+    - `NONE`: skip counting, total is `None`
+    - `ESTIMATE`: planner row estimate from `EXPLAIN`, cheap but approximate
+    - `CAPPED`: exact count of at most `count_cap` rows
+    - `WINDOW`: exact count from `count(*) OVER ()` fetched together with the page,
+      one round trip instead of two
+    """
+
+    EXACT = "exact"
+    NONE = "none"
+    ESTIMATE = "estimate"
+    CAPPED = "capped"
+    WINDOW = "window"
+
+
+DEFAULT_COUNT_CAP = 10_000
+STATEMENT_CACHE_SIZE = 1024
+
+
+class Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON)` of a statement, returns a single row with the JSON plan."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(  # pyright: ignore[reportUnusedFunction]
+    element: Explain, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}"
+
+
 @contextmanager
 def sql_error_handler() -> Generator[None]:
     try:
@@ -39,12 +106,144 @@ def sql_error_handler() -> Generator[None]:
 T = TypeVar("T")
 U = TypeVar("U")
 
-RESERVED_KWARGS = {"offset", "limit", "order_by"}
+RESERVED_KWARGS = {"offset", "limit", "order_by", "keyset"}
+
+
+async def _execute_count(
+    session: AsyncSession,
+    statement: Select[Any],
+    *,
+    strategy: CountStrategy,
+    cap: int,
+    params: dict[str, Any] | None = None,
+) -> int | None:
+    """Count rows of `statement` which must not be ordered or paginated."""
+    if strategy == CountStrategy.NONE:
+        return None
+
+    if strategy == CountStrategy.ESTIMATE:
+        plan = (await session.execute(Explain(statement), params)).scalar_one()
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    if strategy == CountStrategy.CAPPED:
+        statement = statement.limit(cap)
+
+    count_stmt = select(sqla_func.count()).select_from(statement.subquery())
+    return (await session.execute(count_stmt, params)).scalar_one()
+
+
+def _is_exact_zero(total: int | None, strategy: CountStrategy) -> bool:
+    return total == 0 and strategy in {CountStrategy.EXACT, CountStrategy.CAPPED}
+
+
+async def _execute_with_window_count(
+    session: AsyncSession,
+    statement: Select[Any],
+    count_statement: Select[Any],
+    params: dict[str, Any] | None = None,
+    *,
+    scalars: bool = True,
+) -> tuple[list[Any], int]:
+    """Fetch rows of `statement` and the total from `count(*) OVER ()` in a single query.
+
+    Returns the first column of each row with `scalars`, otherwise whole rows which then
+    also carry a `total_count` column.
+
+    `count_statement` is only executed when the page is empty, e.g. past the last page,
+    where there is no row to carry the total.
+    """
+    window_stmt = statement.add_columns(sqla_func.count().over().label("total_count"))
+    rows = (await session.execute(window_stmt, params)).all()
+    if rows:
+        return [row[0] for row in rows] if scalars else list(rows), rows[0][-1]
+
+    total_count = await _execute_count(
+        session,
+        count_statement,
+        strategy=CountStrategy.EXACT,
+        cap=DEFAULT_COUNT_CAP,
+        params=params,
+    )
+    return [], cast(int, total_count)
+
+
+@dataclass(frozen=True, slots=True)
+class LoaderOptions:
+    """Loader options compared by their SQL cache key, so that equal options built on every
+    call share a cached statement."""
+
+    options: tuple[ExecutableOption, ...] = dataclass_field(compare=False)
+    cache_key: tuple[Any, ...]
+
+    @classmethod
+    def from_options(cls, options: tuple[ExecutableOption, ...]) -> LoaderOptions | None:
+        """`None` when an option can't be cached or carries bound values, e.g. loader criteria"""
+        cache_keys: list[Any] = []
+        for option in options:
+            if not isinstance(option, HasCacheKey):
+                return None
+            cache_key = option._generate_cache_key()  # pyright: ignore[reportPrivateUsage]
+            if cache_key is None or cache_key.bindparams:
+                return None
+            cache_keys.append(cache_key.key)
+        return cls(options, tuple(cache_keys))
+
+
+class StatementShape(NamedTuple):
+    """Everything that decides the SQL of a kwargs-built statement, but not the values."""
+
+    kind: Literal["select", "ids", "count", "exists"]
+    filter_keys: tuple[str, ...]
+    order_by: OrderBy | None = None
+    has_offset: bool = False
+    has_limit: bool = False
+    options: LoaderOptions | None = None
+    columns: tuple[str, ...] = ()
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _build_shaped_statement(
+    model: type[Any], id_attr: InstrumentedAttribute[Any], shape: StatementShape
+) -> Select[Any]:
+    """Build the statement of `shape` with filter values and pagination as bind parameters.
+
+    Reusing the statement object skips rebuilding it on every call and lets SQLAlchemy reuse
+    its memoized cache key to look up the compiled SQL.
+    """
+    stmt = select(model).where(
+        *(getattr(model, key) == bindparam(f"filter_{key}") for key in shape.filter_keys)
+    )
+
+    if shape.kind == "ids":
+        return stmt.with_only_columns(id_attr)
+    if shape.kind == "count":
+        return select(sqla_func.count()).select_from(stmt.with_only_columns(id_attr).subquery())
+    if shape.kind == "exists":
+        return stmt.with_only_columns(id_attr).limit(1)
+
+    if shape.has_offset:
+        stmt = stmt.offset(bindparam("page_offset", type_=Integer))
+    if shape.has_limit:
+        stmt = stmt.limit(bindparam("page_limit", type_=Integer))
+    if shape.order_by is not None:
+        order_func = asc if shape.order_by.order == "asc" else desc
+        stmt = stmt.order_by(order_func(getattr(model, shape.order_by.field)))
+    if shape.options is not None:
+        stmt = stmt.options(*shape.options.options)
+    if shape.columns:
+        stmt = stmt.with_only_columns(*(getattr(model, column) for column in shape.columns))
+    return stmt
 
 
 class SQLAlchemyService:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> None:
         self.session = session
+        self.count_strategy = count_strategy
 
     async def execute_one[V](self, statement: Select[tuple[V]]) -> V:
         with sql_error_handler():
@@ -73,14 +272,22 @@ class SQLAlchemyService:
     async def execute_list_and_count[V](
         self,
         statement: Select[tuple[V]],
-    ) -> tuple[Sequence[V], int]:
+        *,
+        count_strategy: CountStrategy | None = None,
+        count_cap: int = DEFAULT_COUNT_CAP,
+    ) -> tuple[Sequence[V], int | None]:
+        count_strategy_ = self.count_strategy if count_strategy is None else count_strategy
         with sql_error_handler():
-            count_stmt = select(sqla_func.count()).select_from(
-                statement.order_by(None).limit(None).offset(None).subquery()
+            count_stmt = statement.order_by(None).limit(None).offset(None)
+
+            if count_strategy_ == CountStrategy.WINDOW:
+                return await _execute_with_window_count(self.session, statement, count_stmt)
+
+            total_count = await _execute_count(
+                self.session, count_stmt, strategy=count_strategy_, cap=count_cap
             )
-            total_count = (await self.session.execute(count_stmt)).scalar_one()
 
-            if total_count == 0:
+            if _is_exact_zero(total_count, count_strategy_):
                 return [], 0
 
             result = await self.session.execute(statement)
@@ -91,6 +298,11 @@ class SQLAlchemyService:
 class SQLAlchemyModelService[T, U]:
     model: type[T]
     model_id_attr_name: str = "id"
+    # Reuse statements built from kwargs, see `_shaped_statement`
+    statement_cache: ClassVar[bool] = True
+    # Nullable fields seeked by `list_keyset` mapped to the non-null field they fall back to,
+    # a NULL in the sort key would end the pagination early
+    keyset_fallbacks: ClassVar[dict[str, str]] = {}
 
     def __init__(
         self,
@@ -100,17 +312,144 @@ class SQLAlchemyModelService[T, U]:
         auto_expunge: bool = False,
         auto_refresh: bool = True,
         auto_commit: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        options: Sequence[ExecutableOption] = (),
     ) -> None:
         self.session = session
 
         self.statement = statement if statement is not None else select(self.model)
+        self._default_statement = statement is None
         self.auto_expunge = auto_expunge
         self.auto_refresh = auto_refresh
         self.auto_commit = auto_commit
+        self.count_strategy = count_strategy
+        self.options = tuple(options)
 
     def _get_statement(self, statement: Select[tuple[T]] | None = None) -> Select[tuple[T]]:
         return statement if statement is not None else self.statement
 
+    def _get_options(
+        self, options: Sequence[ExecutableOption] | None = None
+    ) -> tuple[ExecutableOption, ...]:
+        return (*self.options, *options) if options else self.options
+
+    def _with_options(
+        self, statement: Select[tuple[T]], options: Sequence[ExecutableOption] | None = None
+    ) -> Select[tuple[T]]:
+        if options_ := self._get_options(options):
+            return statement.options(*options_)
+        return statement
+
+    def _shaped_statement(
+        self,
+        kind: Literal["select", "ids", "count", "exists"],
+        statement: Select[tuple[T]] | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        columns: Sequence[str] = (),
+        **kwargs: Any,
+    ) -> tuple[Select[Any], dict[str, Any]] | None:
+        """Cached statement for this call and its bind parameters.
+
+        `None` when the call has to build its statement from scratch: a custom statement,
+        filters on anything but columns (e.g. relationships, or unknown attributes logged by
+        `_filters_from_kwargs`), `None` values that compile to `IS NULL`, SQL expressions as
+        values or loader options with bound values.
+
+        Loader `options` are part of the shape and compared by their SQL cache key.
+        """
+        if not (self.statement_cache and self._default_statement and statement is None):
+            return None
+
+        columns_ = class_mapper(self.model).columns
+        filter_keys = tuple(sorted(k for k in kwargs if k not in RESERVED_KWARGS))
+        for key in filter_keys:
+            value = kwargs[key]
+            if (
+                key not in columns_
+                or value is None
+                or isinstance(value, ClauseElement | QueryableAttribute)
+            ):
+                return None
+
+        params = {f"filter_{key}": kwargs[key] for key in filter_keys}
+        shape = StatementShape(kind=kind, filter_keys=filter_keys)
+        if kind == "select":
+            loader_options = None
+            if options_ := self._get_options(options):
+                loader_options = LoaderOptions.from_options(options_)
+                if loader_options is None:
+                    return None
+            shape = shape._replace(options=loader_options, columns=tuple(columns))
+            order_by = kwargs.get("order_by")
+            if order_by is not None and not (
+                isinstance(order_by, OrderBy) and order_by.field in columns_
+            ):
+                return None
+
+            offset, limit = kwargs.get("offset"), kwargs.get("limit")
+            shape = shape._replace(
+                order_by=order_by, has_offset=offset is not None, has_limit=limit is not None
+            )
+            if offset is not None:
+                params["page_offset"] = offset
+            if limit is not None:
+                params["page_limit"] = limit
+
+        return _build_shaped_statement(self.model, self._get_model_id_attr(), shape), params
+
+    def _list_and_count_statements(
+        self,
+        statement: Select[tuple[T]] | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        columns: Sequence[str] = (),
+        **kwargs: Any,
+    ) -> tuple[Select[Any], Select[Any], dict[str, Any]]:
+        """Page statement, count statement and their bind parameters."""
+        shaped_data = self._shaped_statement("select", statement, options, columns, **kwargs)
+        shaped_count = self._shaped_statement("ids", statement, **kwargs)
+        if shaped_data and shaped_count:
+            return shaped_data[0], shaped_count[0], shaped_data[1]
+
+        base_stmt = self._get_statement(statement)
+        base_stmt = self._where_from_kwargs(base_stmt, **kwargs)
+        count_stmt = base_stmt.with_only_columns(self._get_model_id_attr())
+
+        data_stmt = self._paginate_from_kwargs(base_stmt, **kwargs)
+        data_stmt = self._order_by_from_kwargs(data_stmt, **kwargs)
+        data_stmt = self._with_options(data_stmt, options)
+        if columns:
+            data_stmt = data_stmt.with_only_columns(*self._get_columns(columns))
+        return data_stmt, count_stmt, {}
+
+    async def _execute_list_and_count(
+        self,
+        data_stmt: Select[Any],
+        count_stmt: Select[Any],
+        params: dict[str, Any],
+        *,
+        count_strategy: CountStrategy | None,
+        count_cap: int,
+        scalars: bool,
+    ) -> tuple[list[Any], int | None]:
+        count_strategy_ = self.count_strategy if count_strategy is None else count_strategy
+        if count_strategy_ == CountStrategy.WINDOW:
+            return await _execute_with_window_count(
+                self.session, data_stmt, count_stmt, params, scalars=scalars
+            )
+
+        total_count = await _execute_count(
+            self.session, count_stmt, strategy=count_strategy_, cap=count_cap, params=params
+        )
+
+        if _is_exact_zero(total_count, count_strategy_):
+            return [], 0
+
+        result = await self.session.execute(data_stmt, params)
+        return list(result.scalars().all() if scalars else result.all()), total_count
+
+    def _get_columns(self, columns: Sequence[str]) -> list[InstrumentedAttribute[Any]]:
+        return [getattr(self.model, column) for column in columns]
+
     def _get_model_id_attr(self) -> InstrumentedAttribute[U]:
         return getattr(self.model, self.model_id_attr_name)
 
@@ -149,22 +488,66 @@ class SQLAlchemyModelService[T, U]:
                 with_for_update=with_for_update,
             )
 
+    async def _refresh_many(
+        self, instances: Sequence[T], *, auto_refresh: bool | None = None
+    ) -> None:
+        """Refresh `instances` with a single `SELECT ... WHERE id IN (...)`."""
+        auto_refresh_ = self.auto_refresh if auto_refresh is None else auto_refresh
+        if auto_refresh_ and instances:
+            ids = [getattr(instance, self.model_id_attr_name) for instance in instances]
+            stmt = (
+                select(self.model)
+                .where(self._get_model_id_attr().in_(ids))
+                .execution_options(populate_existing=True)
+            )
+            await self.session.execute(stmt)
+
     def _expunge(self, instance: T, auto_expunge: bool | None = None) -> None:
         auto_expunge_ = self.auto_expunge if auto_expunge is None else auto_expunge
         if auto_expunge_:
             self.session.expunge(instance)
 
-    def _where_from_kwargs(self, statement: Select[tuple[T]], **kwargs: Any) -> Select[tuple[T]]:
-        stmt = statement
+    async def _delete_returning(
+        self,
+        filters: Sequence[ColumnElement[bool]],
+        *,
+        auto_commit: bool | None,
+        auto_expunge: bool | None,
+    ) -> Sequence[T]:
+        stmt = sqla_delete(self.model).where(*filters).returning(self.model)
+        result = await self.session.execute(stmt)
+        instances = list(result.scalars().all())
+        await self._flush_or_commit(auto_commit=auto_commit)
+        for instance in instances:
+            self._expunge(instance, auto_expunge=auto_expunge)
+        return instances
+
+    def _filters_from_kwargs(self, **kwargs: Any) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = []
         for k, v in kwargs.items():
             if k not in RESERVED_KWARGS and hasattr(self.model, k):
-                stmt = stmt.where(getattr(self.model, k) == v)
+                filters.append(getattr(self.model, k) == v)
             elif k not in RESERVED_KWARGS:
                 logger.warning(
                     f"Attempted to filter by non-existent attribute '{k}' on model {self.model.__name__}"
                 )
 
-        return stmt
+        return filters
+
+    def _column_filters_from_kwargs(self, **kwargs: Any) -> list[ColumnElement[bool]]:
+        """Equality filters of a destructive statement, raising on keys that aren't columns.
+
+        Dropping a misspelled filter would widen the UPDATE or DELETE to more rows.
+        """
+        columns = class_mapper(self.model).columns
+        if unknown := [k for k in kwargs if k not in columns]:
+            msg = f"Cannot filter {self.model.__name__} by non-column attributes {unknown}"
+            logger.error(msg)
+            raise DatabaseOperationError(detail=msg)
+        return [getattr(self.model, k) == v for k, v in kwargs.items()]
+
+    def _where_from_kwargs(self, statement: Select[tuple[T]], **kwargs: Any) -> Select[tuple[T]]:
+        return statement.where(*self._filters_from_kwargs(**kwargs))
 
     def _offset_from_kwargs(self, statement: Select[tuple[T]], **kwargs: Any) -> Select[tuple[T]]:
         if (offset := kwargs.get("offset")) is not None:
@@ -206,6 +589,59 @@ class SQLAlchemyModelService[T, U]:
 
         return statement
 
+    def _get_keyset_order_by(self, order_by: OrderBy | None) -> OrderBy:
+        if order_by is None:
+            return OrderBy(field=self.model_id_attr_name, order="asc")
+
+        if not hasattr(self.model, order_by.field):
+            logger.warning(
+                f"Attempted to seek by non-existent attribute '{order_by.field}' on model {self.model.__name__}"
+            )
+            return OrderBy(field=self.model_id_attr_name, order=order_by.order)
+
+        return order_by
+
+    def _get_keyset_column(self, field: str) -> ColumnElement[Any]:
+        column = getattr(self.model, field)
+        if fallback := self.keyset_fallbacks.get(field):
+            return sqla_func.coalesce(column, getattr(self.model, fallback))
+        return column
+
+    def _keyset_from_kwargs(self, statement: Select[tuple[T]], **kwargs: Any) -> Select[tuple[T]]:
+        """Order by `(order_by.field, id)` and seek past `keyset` if given.
+
+        The id is used as a tie-breaker so rows sharing the same `order_by.field` value
+        are neither skipped nor repeated between pages.
+        """
+        order_by = self._get_keyset_order_by(kwargs.get("order_by"))
+        keyset: Keyset | None = kwargs.get("keyset")
+
+        id_attr = self._get_model_id_attr()
+        if order_by.field == self.model_id_attr_name:
+            columns = (id_attr,)
+            values = (keyset.id,) if keyset is not None else ()
+        else:
+            columns = (self._get_keyset_column(order_by.field), id_attr)
+            values = (keyset.value, keyset.id) if keyset is not None else ()
+
+        order_func = asc if order_by.order == "asc" else desc
+        statement = statement.order_by(*(order_func(column) for column in columns))
+
+        if keyset is not None:
+            row, position = tuple_(*columns), tuple_(*values)
+            statement = statement.where(
+                row > position if order_by.order == "asc" else row < position
+            )
+
+        return statement
+
+    def _get_keyset(self, instance: T, order_by: OrderBy | None) -> Keyset:
+        order_by = self._get_keyset_order_by(order_by)
+        value = getattr(instance, order_by.field)
+        if value is None and (fallback := self.keyset_fallbacks.get(order_by.field)):
+            value = getattr(instance, fallback)
+        return Keyset(value=value, id=getattr(instance, self.model_id_attr_name))
+
     def check_not_found(self, item: T | None) -> T:
         if item is None:
             msg = "No record found"
@@ -214,14 +650,17 @@ class SQLAlchemyModelService[T, U]:
 
     async def count(self, statement: Select[tuple[T]] | None = None, **kwargs: Any) -> int:
         with sql_error_handler():
-            stmt = self._get_statement(statement)
-            stmt = self._where_from_kwargs(stmt, **kwargs)
-
-            count_statement = select(sqla_func.count()).select_from(
-                stmt.with_only_columns(self._get_model_id_attr()).subquery()
-            )
+            if shaped := self._shaped_statement("count", statement, **kwargs):
+                count_statement, params = shaped
+            else:
+                stmt = self._get_statement(statement)
+                stmt = self._where_from_kwargs(stmt, **kwargs)
+                count_statement = select(sqla_func.count()).select_from(
+                    stmt.with_only_columns(self._get_model_id_attr()).subquery()
+                )
+                params = {}
 
-            result = await self.session.execute(count_statement)
+            result = await self.session.execute(count_statement, params)
             count = result.scalar_one_or_none()
             return count or 0
 
@@ -240,6 +679,28 @@ class SQLAlchemyModelService[T, U]:
             self._expunge(instance, auto_expunge=auto_expunge)
             return instance
 
+    async def create_many(
+        self,
+        data: Sequence[T],
+        *,
+        auto_commit: bool | None = None,
+        auto_refresh: bool | None = None,
+        auto_expunge: bool | None = None,
+    ) -> Sequence[T]:
+        """Insert all instances in one flush.
+
+        The unit of work batches the INSERTs into multi-row `INSERT ... RETURNING`
+        statements (`insertmanyvalues`) instead of one round trip per row.
+        """
+        with sql_error_handler():
+            instances = list(data)
+            self.session.add_all(instances)
+            await self._flush_or_commit(auto_commit=auto_commit)
+            await self._refresh_many(instances, auto_refresh=auto_refresh)
+            for instance in instances:
+                self._expunge(instance, auto_expunge=auto_expunge)
+            return instances
+
     async def delete(
         self,
         id: U,
@@ -255,13 +716,60 @@ class SQLAlchemyModelService[T, U]:
 
             return instance
 
+    async def delete_many(
+        self,
+        ids: Sequence[U],
+        *,
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+    ) -> Sequence[T]:
+        """Delete rows by id with a single `DELETE ... RETURNING`, without loading them first.
+
+        Returns the deleted rows, ids that do not exist are ignored.
+        Unlike `delete`, ORM `before_delete`/`after_delete` events are not emitted.
+        """
+        with sql_error_handler():
+            if not ids:
+                return []
+            return await self._delete_returning(
+                [self._get_model_id_attr().in_(ids)],
+                auto_commit=auto_commit,
+                auto_expunge=auto_expunge,
+            )
+
+    async def delete_where(
+        self,
+        *,
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+        **kwargs: Any,
+    ) -> Sequence[T]:
+        """Delete rows matching the filters with a single `DELETE ... RETURNING`.
+
+        At least one filter is required and every filter must name a column.
+        Returns the deleted rows.
+        Unlike `delete`, ORM `before_delete`/`after_delete` events are not emitted.
+        """
+        with sql_error_handler():
+            filters = self._column_filters_from_kwargs(**kwargs)
+            if not filters:
+                logger.error(f"Refusing to delete all rows of {self.model.__name__}")
+                raise DatabaseOperationError()
+            return await self._delete_returning(
+                filters, auto_commit=auto_commit, auto_expunge=auto_expunge
+            )
+
     async def exists(self, **kwargs: Any) -> bool:
         with sql_error_handler():
-            stmt = self._get_statement()
-            stmt = self._where_from_kwargs(stmt, **kwargs)
+            if shaped := self._shaped_statement("exists", **kwargs):
+                stmt, params = shaped
+            else:
+                stmt = self._get_statement()
+                stmt = self._where_from_kwargs(stmt, **kwargs)
+                stmt = stmt.with_only_columns(self._get_model_id_attr()).limit(1)
+                params = {}
 
-            stmt = stmt.with_only_columns(self._get_model_id_attr()).limit(1)
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(stmt, params)
             return result.scalar_one_or_none() is not None
 
     async def get(
@@ -269,22 +777,31 @@ class SQLAlchemyModelService[T, U]:
         *,
         statement: Select[tuple[T]] | None = None,
         auto_expunge: bool | None = None,
+        options: Sequence[ExecutableOption] | None = None,
         **kwargs: Any,
     ) -> T:
-        return await self.get_one(statement=statement, auto_expunge=auto_expunge, **kwargs)
+        return await self.get_one(
+            statement=statement, auto_expunge=auto_expunge, options=options, **kwargs
+        )
 
     async def get_one(
         self,
         *,
         statement: Select[tuple[T]] | None = None,
         auto_expunge: bool | None = None,
+        options: Sequence[ExecutableOption] | None = None,
         **kwargs: Any,
     ) -> T:
         with sql_error_handler():
-            stmt = self._get_statement(statement)
-            stmt = self._where_from_kwargs(stmt, **kwargs)
+            if shaped := self._shaped_statement("select", statement, options, **kwargs):
+                stmt, params = shaped
+            else:
+                stmt = self._get_statement(statement)
+                stmt = self._where_from_kwargs(stmt, **kwargs)
+                stmt = self._with_options(stmt, options)
+                params = {}
 
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(stmt, params)
             instance = self.check_not_found(result.scalar_one_or_none())
             self._expunge(instance, auto_expunge=auto_expunge)
             return instance
@@ -293,13 +810,19 @@ class SQLAlchemyModelService[T, U]:
         self,
         statement: Select[tuple[T]] | None = None,
         auto_expunge: bool | None = None,
+        options: Sequence[ExecutableOption] | None = None,
         **kwargs: Any,
     ) -> T | None:
         with sql_error_handler():
-            stmt = self._get_statement(statement)
-            stmt = self._where_from_kwargs(stmt, **kwargs)
+            if shaped := self._shaped_statement("select", statement, options, **kwargs):
+                stmt, params = shaped
+            else:
+                stmt = self._get_statement(statement)
+                stmt = self._where_from_kwargs(stmt, **kwargs)
+                stmt = self._with_options(stmt, options)
+                params = {}
 
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(stmt, params)
             instance = result.scalar_one_or_none()
             if instance:
                 self._expunge(instance, auto_expunge=auto_expunge)
@@ -309,15 +832,21 @@ class SQLAlchemyModelService[T, U]:
         self,
         statement: Select[tuple[T]] | None = None,
         auto_expunge: bool | None = None,
+        options: Sequence[ExecutableOption] | None = None,
         **kwargs: Any,
     ) -> Sequence[T]:
         with sql_error_handler():
-            stmt = self._get_statement(statement)
-            stmt = self._where_from_kwargs(stmt, **kwargs)
-            stmt = self._paginate_from_kwargs(stmt, **kwargs)
-            stmt = self._order_by_from_kwargs(stmt, **kwargs)
-
-            result = await self.session.execute(stmt)
+            if shaped := self._shaped_statement("select", statement, options, **kwargs):
+                stmt, params = shaped
+            else:
+                stmt = self._get_statement(statement)
+                stmt = self._where_from_kwargs(stmt, **kwargs)
+                stmt = self._paginate_from_kwargs(stmt, **kwargs)
+                stmt = self._order_by_from_kwargs(stmt, **kwargs)
+                stmt = self._with_options(stmt, options)
+                params = {}
+
+            result = await self.session.execute(stmt, params)
             items = list(result.scalars().all())
             for item in items:
                 self._expunge(item, auto_expunge=auto_expunge)
@@ -328,31 +857,127 @@ class SQLAlchemyModelService[T, U]:
         self,
         statement: Select[tuple[T]] | None = None,
         auto_expunge: bool | None = None,
+        *,
+        count_strategy: CountStrategy | None = None,
+        count_cap: int = DEFAULT_COUNT_CAP,
+        options: Sequence[ExecutableOption] | None = None,
         **kwargs: Any,
-    ) -> tuple[Sequence[T], int]:
-        with sql_error_handler():
-            base_stmt = self._get_statement(statement)
-            base_stmt = self._where_from_kwargs(base_stmt, **kwargs)
+    ) -> tuple[Sequence[T], int | None]:
+        """List a page and count all rows matching the filters.
+
+        The total is `None` with `CountStrategy.NONE`, approximate with `CountStrategy.ESTIMATE`
+        and at most `count_cap` with `CountStrategy.CAPPED`. `CountStrategy.WINDOW` returns
+        an exact total fetched in the same query as the page.
 
-            count_stmt = select(sqla_func.count()).select_from(
-                base_stmt.with_only_columns(self._get_model_id_attr()).subquery()
+        Loader `options` only apply to the page, not to the count.
+        """
+        with sql_error_handler():
+            data_stmt, count_stmt, params = self._list_and_count_statements(
+                statement, options, **kwargs
+            )
+            items, total_count = await self._execute_list_and_count(
+                data_stmt,
+                count_stmt,
+                params,
+                count_strategy=count_strategy,
+                count_cap=count_cap,
+                scalars=True,
             )
 
-            total_count = (await self.session.execute(count_stmt)).scalar_one()
+            for item in items:
+                self._expunge(item, auto_expunge=auto_expunge)
 
-            if total_count == 0:
-                return [], 0
+            return items, total_count
+
+    async def list_keyset(
+        self,
+        statement: Select[tuple[T]] | None = None,
+        auto_expunge: bool | None = None,
+        *,
+        limit: int,
+        keyset: Keyset | None = None,
+        order_by: OrderBy | None = None,
+        options: Sequence[ExecutableOption] | None = None,
+        **kwargs: Any,
+    ) -> tuple[Sequence[T], Keyset | None]:
+        """List a page using keyset (seek) pagination instead of OFFSET.
+
+        Fetches up to `limit` rows ordered by `(order_by.field, id)` that come after `keyset`,
+        so with a matching index every page costs the same as the first one.
 
-            data_stmt = self._paginate_from_kwargs(base_stmt, **kwargs)
-            data_stmt = self._order_by_from_kwargs(data_stmt, **kwargs)
+        Returns the page and the keyset of the next page, `None` if this is the last page.
+        """
+        with sql_error_handler():
+            stmt = self._get_statement(statement)
+            stmt = self._where_from_kwargs(stmt, **kwargs)
+            stmt = self._keyset_from_kwargs(stmt, keyset=keyset, order_by=order_by)
+            stmt = self._with_options(stmt, options)
+            # One extra row tells whether there is a next page without counting
+            stmt = stmt.limit(limit + 1)
 
-            result = await self.session.execute(data_stmt)
+            result = await self.session.execute(stmt)
             items = list(result.scalars().all())
 
+            next_keyset = None
+            if len(items) > limit:
+                items = items[:limit]
+                next_keyset = self._get_keyset(items[-1], order_by)
+
             for item in items:
                 self._expunge(item, auto_expunge=auto_expunge)
 
-            return items, total_count
+            return items, next_keyset
+
+    async def list_rows(
+        self,
+        statement: Select[tuple[T]] | None = None,
+        *,
+        columns: Sequence[str],
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """Like `list`, but select only `columns` into plain dicts instead of model instances.
+
+        Skips ORM instance construction and the identity map, and pydantic validates dicts
+        faster than objects with `from_attributes`.
+        """
+        with sql_error_handler():
+            if shaped := self._shaped_statement("select", statement, columns=columns, **kwargs):
+                stmt, params = shaped
+            else:
+                stmt = self._get_statement(statement)
+                stmt = self._where_from_kwargs(stmt, **kwargs)
+                stmt = self._paginate_from_kwargs(stmt, **kwargs)
+                stmt = self._order_by_from_kwargs(stmt, **kwargs)
+                stmt = stmt.with_only_columns(*self._get_columns(columns))
+                params = {}
+
+            result = await self.session.execute(stmt, params)
+            return [dict(zip(columns, row)) for row in result]
+
+    async def list_rows_and_count(
+        self,
+        statement: Select[tuple[T]] | None = None,
+        *,
+        columns: Sequence[str],
+        count_strategy: CountStrategy | None = None,
+        count_cap: int = DEFAULT_COUNT_CAP,
+        **kwargs: Any,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """`list_and_count` selecting only `columns` into plain dicts, see `list_rows`."""
+        with sql_error_handler():
+            data_stmt, count_stmt, params = self._list_and_count_statements(
+                statement, columns=columns, **kwargs
+            )
+            rows, total_count = await self._execute_list_and_count(
+                data_stmt,
+                count_stmt,
+                params,
+                count_strategy=count_strategy,
+                count_cap=count_cap,
+                scalars=False,
+            )
+            # `zip` stops before the `total_count` column added by `CountStrategy.WINDOW`
+            return [dict(zip(columns, row)) for row in rows], total_count
 
     async def update(
         self,
@@ -379,3 +1004,142 @@ class SQLAlchemyModelService[T, U]:
             )
             self._expunge(instance, auto_expunge=auto_expunge)
             return instance
+
+    async def update_where(
+        self,
+        values: dict[str, Any],
+        *,
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+        **kwargs: Any,
+    ) -> Sequence[T]:
+        """Update rows matching the filters with a single `UPDATE ... RETURNING`.
+
+        At least one filter is required and every filter must name a column. Returns the
+        updated rows, `onupdate` defaults are applied to columns missing from `values`.
+        """
+        with sql_error_handler():
+            filters = self._column_filters_from_kwargs(**kwargs)
+            if not filters:
+                logger.error(f"Refusing to update all rows of {self.model.__name__}")
+                raise DatabaseOperationError()
+
+            stmt = (
+                sqla_update(self.model)
+                .where(*filters)
+                .values(**values)
+                .returning(self.model)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.execute(stmt)
+            instances = list(result.scalars().all())
+            await self._flush_or_commit(auto_commit=auto_commit)
+            for instance in instances:
+                self._expunge(instance, auto_expunge=auto_expunge)
+            return instances
+
+    async def update_many(
+        self,
+        data: Sequence[T],
+        *,
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+    ) -> Sequence[T]:
+        """Write the changes of all instances without loading them first.
+
+        Instances in the session are flushed. The changed columns of detached instances are
+        sent with an ORM bulk UPDATE by primary key. Either way, UPDATEs that set the same
+        columns are sent as a single executemany.
+
+        Returns the updated rows, loaded with a single `SELECT ... WHERE id IN (...)`.
+        """
+        with sql_error_handler():
+            if not data:
+                return []
+
+            id_attr_name = self.model_id_attr_name
+            columns = {attr.key for attr in class_mapper(self.model).column_attrs}
+            bulk_values: list[dict[str, Any]] = []
+            for instance in data:
+                if instance in self.session:
+                    continue
+                state = instance_state(instance)
+                # Keys of the attributes set since the instance was loaded
+                changed = {
+                    key: state.dict[key]
+                    for key in state.committed_state
+                    if key in columns and key != id_attr_name
+                }
+                if changed:
+                    bulk_values.append({id_attr_name: getattr(instance, id_attr_name), **changed})
+
+            if bulk_values:
+                await self.session.execute(sqla_update(self.model), bulk_values)
+            await self.session.flush()
+
+            ids = [getattr(instance, id_attr_name) for instance in data]
+            stmt = (
+                select(self.model)
+                .where(self._get_model_id_attr().in_(ids))
+                .execution_options(populate_existing=True)
+            )
+            rows = {
+                getattr(row, id_attr_name): row
+                for row in (await self.session.execute(stmt)).scalars()
+            }
+            await self._flush_or_commit(auto_commit=auto_commit)
+            instances = [rows[id] for id in ids if id in rows]
+            for instance in instances:
+                self._expunge(instance, auto_expunge=auto_expunge)
+            return instances
+
+    async def upsert_many(
+        self,
+        data: Sequence[dict[str, Any]],
+        *,
+        index_elements: Sequence[str] | None = None,
+        update_fields: Sequence[str] | None = None,
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+    ) -> Sequence[T]:
+        """Insert rows or update them on conflict with `INSERT ... ON CONFLICT DO UPDATE RETURNING`.
+
+        `index_elements` names the columns of the unique constraint, the model id by default.
+        `update_fields` are the columns overwritten on conflict, by default every key of `data`
+        that is not in `index_elements`. Columns with an `onupdate` are set to their inserted
+        value since `ON CONFLICT DO UPDATE` does not apply `onupdate`. With nothing to update,
+        conflicting rows are skipped with `ON CONFLICT DO NOTHING`.
+
+        Returns the inserted or updated rows, only the inserted ones when nothing is updated.
+        """
+        with sql_error_handler():
+            if not data:
+                return []
+
+            index_elements_ = index_elements or [self.model_id_attr_name]
+            update_fields_ = (
+                update_fields
+                if update_fields is not None
+                else [key for key in data[0] if key not in index_elements_]
+            )
+
+            onupdate_fields = [
+                column.key
+                for column in class_mapper(self.model).columns
+                if column.onupdate is not None and column.key not in update_fields_
+            ]
+
+            stmt = pg_insert(self.model)
+            set_ = {field: stmt.excluded[field] for field in [*update_fields_, *onupdate_fields]}
+            if set_:
+                stmt = stmt.on_conflict_do_update(index_elements=index_elements_, set_=set_)
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=index_elements_)
+            stmt = stmt.returning(self.model).execution_options(populate_existing=True)
+
+            result = await self.session.execute(stmt, list(data))
+            instances = list(result.scalars().all())
+            await self._flush_or_commit(auto_commit=auto_commit)
+            for instance in instances:
+                self._expunge(instance, auto_expunge=auto_expunge)
+            return instances
@@ -1,9 +1,23 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
+    from opentelemetry.sdk.resources import Resource
+
     from todo_api.core.config import Environment
 
 
+def _create_resource(*, app_name: str, app_version: str, app_environment: Environment) -> Resource:
+    from opentelemetry.sdk.resources import Resource
+
+    return Resource(
+        attributes={
+            "service.name": app_name,
+            "service.version": app_version,
+            "deployment.environment": app_environment,
+        },
+    )
+
+
 def configure(
     *,
     app_name: str,
@@ -11,38 +25,53 @@ def configure(
     app_environment: Environment,
     otlp_endpoint: str,
     otlp_endpoint_insecure: bool,
+    sampler: Literal["ratio", "adaptive"] = "ratio",
+    sampling_ratio: float = 0.1,
+    sampling_route_rate: float = 1,
+    tail_latency_threshold: float = 1,
 ) -> None:
+    """Set the global tracer provider, exporting over OTLP.
+
+    In production `sampler="ratio"` keeps `sampling_ratio` of the traces. `"adaptive"` keeps
+    up to `sampling_route_rate` traces per second for each route, plus every other trace
+    that failed or whose root span took longer than `tail_latency_threshold` seconds.
+    """
     import structlog
     from opentelemetry import trace
     from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-    from opentelemetry.sdk.resources import Resource
-    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
     from opentelemetry.sdk.trace.export import BatchSpanProcessor
     from opentelemetry.sdk.trace.sampling import (
+        Sampler,
         TraceIdRatioBased,
         _AlwaysOn,  # pyright: ignore[reportPrivateUsage]
     )
 
+    from todo_api.core.observability.sampling import TailSamplingSpanProcessor, adaptive_sampler
+
     logger: structlog.stdlib.BoundLogger = structlog.get_logger()
 
-    resource = Resource(
-        attributes={
-            "service.name": app_name,
-            "service.version": app_version,
-            "deployment.environment": app_environment,
-        },
+    resource = _create_resource(
+        app_name=app_name, app_version=app_version, app_environment=app_environment
     )
 
-    sampler = TraceIdRatioBased(1 / 10) if app_environment == "PRODUCTION" else _AlwaysOn(None)
+    tail_sampling = app_environment == "PRODUCTION" and sampler == "adaptive"
+    head_sampler: Sampler
+    if app_environment != "PRODUCTION":
+        head_sampler = _AlwaysOn(None)
+    elif tail_sampling:
+        head_sampler = adaptive_sampler(sampling_route_rate)
+    else:
+        head_sampler = TraceIdRatioBased(sampling_ratio)
 
-    provider = TracerProvider(resource=resource, sampler=sampler)
+    provider = TracerProvider(resource=resource, sampler=head_sampler)
 
     if app_environment == "TESTING":
         from opentelemetry.sdk.trace.export import SimpleSpanProcessor
         from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 
         exporter = InMemorySpanExporter()
-        processor = SimpleSpanProcessor(exporter)
+        processor: SpanProcessor = SimpleSpanProcessor(exporter)
     else:
         exporter = OTLPSpanExporter(otlp_endpoint, insecure=otlp_endpoint_insecure)
         processor = BatchSpanProcessor(
@@ -51,8 +80,53 @@ def configure(
             schedule_delay_millis=5000,
         )
 
+    if tail_sampling:
+        processor = TailSamplingSpanProcessor(processor, latency_threshold=tail_latency_threshold)
+
     provider.add_span_processor(processor)
 
     trace.set_tracer_provider(provider)
 
     logger.info(f"Opentelemetry tracer provider with {exporter.__class__.__name__!r} initialized")
+
+
+def configure_metrics(
+    *,
+    app_name: str,
+    app_version: str,
+    app_environment: Environment,
+    otlp_endpoint: str,
+    otlp_endpoint_insecure: bool,
+    export_interval: float,
+) -> None:
+    """Set the global meter provider, exporting every `export_interval` seconds over OTLP.
+
+    Instruments created from the global meter before this runs start recording once it did,
+    until then they are no-ops.
+    """
+    import structlog
+    from opentelemetry import metrics
+    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import MetricReader, PeriodicExportingMetricReader
+
+    logger: structlog.stdlib.BoundLogger = structlog.get_logger()
+
+    resource = _create_resource(
+        app_name=app_name, app_version=app_version, app_environment=app_environment
+    )
+
+    reader: MetricReader
+    if app_environment == "TESTING":
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+        reader = InMemoryMetricReader()
+    else:
+        exporter = OTLPMetricExporter(otlp_endpoint, insecure=otlp_endpoint_insecure)
+        reader = PeriodicExportingMetricReader(
+            exporter, export_interval_millis=export_interval * 1000
+        )
+
+    metrics.set_meter_provider(MeterProvider(resource=resource, metric_readers=[reader]))
+
+    logger.info(f"Opentelemetry meter provider with {reader.__class__.__name__!r} initialized")
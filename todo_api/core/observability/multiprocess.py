@@ -0,0 +1,144 @@
+import fcntl
+import glob
+import os
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import cast
+
+import anyio
+import anyio.to_thread
+from prometheus_client import CollectorRegistry, generate_latest, multiprocess
+from prometheus_client.mmap_dict import MmapedDict
+
+# Values of these types only ever add up across workers, so the files of dead workers can
+# be merged into one archive file per type without changing the scraped totals.
+_ACCUMULATED_TYPES = ("counter", "histogram", "summary")
+_ARCHIVE = "archive"
+# Gauges reported per worker (`all`, `liveall`) or only while the worker lives, dropped
+# with the worker. `multiprocess.mark_process_dead` only drops the `live*` ones.
+_WORKER_GAUGE_MODES = ("all", "liveall", "livesum", "livemax", "livemin", "livemostrecent")
+
+
+@contextmanager
+def _locked(path: str, *, shared: bool = False) -> Generator[None]:
+    """Lock the metrics directory across processes, shared for scrapes."""
+    with open(os.path.join(path, ".lock"), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _file_pid(filename: str) -> str:
+    return os.path.basename(filename).removesuffix(".db").rsplit("_", 1)[-1]
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _remove(filename: str) -> None:
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
+
+
+def _compact_worker_files(path: str, pid: int | str) -> None:
+    for type_ in _ACCUMULATED_TYPES:
+        filename = os.path.join(path, f"{type_}_{pid}.db")
+        if not os.path.exists(filename):
+            continue
+
+        values = cast(
+            list[tuple[str, float, float, int]],
+            MmapedDict.read_all_values_from_file(filename),  # pyright: ignore[reportUnknownMemberType]
+        )
+        archive = MmapedDict(os.path.join(path, f"{type_}_{_ARCHIVE}.db"))
+        try:
+            for key, value, timestamp, _ in values:
+                archived, _ = cast(tuple[float, float], archive.read_value(key))  # pyright: ignore[reportUnknownMemberType]
+                archive.write_value(key, archived + value, timestamp)  # pyright: ignore[reportUnknownMemberType]
+        finally:
+            archive.close()
+        _remove(filename)
+
+
+def _mark_worker_dead(path: str, pid: int | str) -> None:
+    for mode in _WORKER_GAUGE_MODES:
+        for filename in glob.glob(os.path.join(path, f"gauge_{mode}_{pid}.db")):
+            _remove(filename)
+    _compact_worker_files(path, pid)
+
+
+def compact_worker_files(path: str, pid: int | str) -> None:
+    """Merge the counters, histograms and summaries of a dead worker into the archive files.
+
+    Removes the worker's files afterwards, so the directory no longer grows with every
+    worker restart while the scraped totals stay the same.
+    """
+    with _locked(path):
+        _compact_worker_files(path, pid)
+
+
+def mark_worker_dead(path: str, pid: int) -> None:
+    """Drop the per-worker gauges of a worker and compact its other metric files."""
+    with _locked(path):
+        _mark_worker_dead(path, pid)
+
+
+def compact_dead_workers(path: str) -> None:
+    """Compact the files of workers which exited without cleaning up, e.g. when killed.
+
+    Workers starting together run this at the same time, the directory stays locked from
+    listing the files to removing them.
+    """
+    with _locked(path):
+        pids = {_file_pid(filename) for filename in glob.glob(os.path.join(path, "*.db"))}
+        for pid in pids:
+            if pid.isdigit() and not _is_alive(int(pid)):
+                _mark_worker_dead(path, pid)
+
+
+class MultiProcessScrape:
+    """Metrics of all workers, aggregated at most once per `ttl` seconds.
+
+    Aggregating reads and merges every file in the metrics directory, so it runs in a
+    worker thread, and concurrent scrapes within `ttl` share the last result.
+    """
+
+    def __init__(self, path: str, ttl: float) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(self.registry, path)
+        self._lock = anyio.Lock()
+        self._body = b""
+        self._expires_at = 0.0
+
+    def _generate(self) -> bytes:
+        with _locked(self.path, shared=True):
+            return generate_latest(self.registry)
+
+    async def generate(self) -> bytes:
+        async with self._lock:
+            if time.monotonic() >= self._expires_at:
+                self._body = await anyio.to_thread.run_sync(self._generate)
+                self._expires_at = time.monotonic() + self.ttl
+            return self._body
+
+
+__all__ = (
+    "MultiProcessScrape",
+    "compact_dead_workers",
+    "compact_worker_files",
+    "mark_worker_dead",
+)
@@ -0,0 +1,115 @@
+import time
+from typing import ClassVar
+
+from opentelemetry import metrics
+from prometheus_client import Gauge, Histogram
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+POOL_CHECKED_OUT = Gauge(
+    "todo_api_db_pool_checked_out",
+    "Gauge of database connections currently checked out of the pool by pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+POOL_OVERFLOW = Gauge(
+    "todo_api_db_pool_overflow",
+    "Gauge of database connections opened beyond pool_size by pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+POOL_WAIT_TIME = Histogram(
+    "todo_api_db_pool_wait_seconds",
+    "Histogram of time spent waiting for a database connection from the pool by pool in seconds",
+    ["pool"],
+)
+
+POOL_HOLD_TIME = Histogram(
+    "todo_api_db_pool_hold_seconds",
+    "Histogram of time database connections stay checked out of the pool by pool in seconds",
+    ["pool"],
+)
+
+# Recorded once a meter provider is configured, see `OTEL_METRICS_ENABLED`
+_meter = metrics.get_meter(__name__)
+
+OTEL_POOL_CHECKED_OUT = _meter.create_gauge(
+    "todo_api.db.pool.checked_out",
+    unit="{connection}",
+    description="Database connections currently checked out of the pool by pool",
+)
+
+OTEL_POOL_OVERFLOW = _meter.create_gauge(
+    "todo_api.db.pool.overflow",
+    unit="{connection}",
+    description="Database connections opened beyond pool_size by pool",
+)
+
+OTEL_POOL_WAIT_TIME = _meter.create_histogram(
+    "todo_api.db.pool.wait.duration",
+    unit="s",
+    description="Time spent waiting for a database connection from the pool by pool",
+)
+
+OTEL_POOL_HOLD_TIME = _meter.create_histogram(
+    "todo_api.db.pool.hold.duration",
+    unit="s",
+    description="Time database connections stay checked out of the pool by pool",
+)
+
+_CHECKED_OUT_AT = "todo_api_checked_out_at"
+
+
+class _InstrumentedQueuePoolMixin(QueuePool):
+    """Exports pool usage gauges, how long each checkout waits and holds a connection.
+
+    SQLAlchemy has no pool event fired before a checkout starts waiting, and `checkin`
+    fires before the connection is back in the pool, so the metrics are taken around
+    `QueuePool._do_get` and `QueuePool._do_return_conn` instead.
+    """
+
+    metrics_label: ClassVar[str]
+
+    @property
+    def pool_label(self) -> str:
+        """`pool_logging_name` of the engine if set, to tell apart pools of the same class"""
+        return self.logging_name or self.metrics_label
+
+    def _update_gauges(self) -> None:
+        checked_out, overflow = self.checkedout(), max(self.overflow(), 0)
+        POOL_CHECKED_OUT.labels(pool=self.pool_label).set(checked_out)
+        POOL_OVERFLOW.labels(pool=self.pool_label).set(overflow)
+        OTEL_POOL_CHECKED_OUT.set(checked_out, {"pool": self.pool_label})
+        OTEL_POOL_OVERFLOW.set(overflow, {"pool": self.pool_label})
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        t0 = time.perf_counter()
+        try:
+            record = super()._do_get()
+            record.info[_CHECKED_OUT_AT] = time.perf_counter()
+            return record
+        finally:
+            wait_time = time.perf_counter() - t0
+            POOL_WAIT_TIME.labels(pool=self.pool_label).observe(wait_time)
+            OTEL_POOL_WAIT_TIME.record(wait_time, {"pool": self.pool_label})
+            self._update_gauges()
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        if (checked_out_at := record.info.pop(_CHECKED_OUT_AT, None)) is not None:
+            hold_time = time.perf_counter() - checked_out_at
+            POOL_HOLD_TIME.labels(pool=self.pool_label).observe(hold_time)
+            OTEL_POOL_HOLD_TIME.record(hold_time, {"pool": self.pool_label})
+        super()._do_return_conn(record)
+        self._update_gauges()
+
+
+class InstrumentedQueuePool(_InstrumentedQueuePoolMixin, QueuePool):
+    metrics_label = "sync"
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedQueuePoolMixin, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+__all__ = ("InstrumentedAsyncAdaptedQueuePool", "InstrumentedQueuePool")
@@ -0,0 +1,161 @@
+import hashlib
+import re
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Literal
+
+from prometheus_client import Histogram
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import ExceptionContext
+
+# Set by the service instrumentators for the duration of each public method call
+current_service_method: ContextVar[str] = ContextVar("current_service_method", default="none")
+
+DB_QUERY_DURATION = Histogram(
+    "todo_api_db_query_duration_seconds",
+    "Histogram of database query execution time by service method and statement in seconds",
+    ["service_method", "statement"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+
+DB_QUERY_ROWS = Histogram(
+    "todo_api_db_query_rows",
+    "Histogram of rows returned or affected by database queries by service method and statement",
+    ["service_method", "statement"],
+    buckets=(0, 1, 5, 10, 25, 50, 100, 500, 1000),
+)
+
+# Shapes past this many share one entry, so that ad hoc SQL can't grow the labels unbounded
+_MAX_SHAPES = 1000
+_OTHER_SHAPES = "other"
+
+_START_TIMES = "todo_api_query_start_times"
+
+# Bound parameters may carry a cast, e.g. the psycopg dialect renders `%(id_1_1)s::INTEGER`
+_LITERALS = re.compile(
+    r"(?:'(?:[^']|'')*'|%\(\w+\)s|%s|\$\d+|\b\d+(?:\.\d+)?\b)(?:::\w+(?:\[\])?)?"
+)
+_IN_LISTS = re.compile(r"\bIN \(\?(?:, \?)*\)", re.IGNORECASE)
+_REPEATED_TUPLES = re.compile(r"(\((?:\?, )*\?\))(?:, \1)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> tuple[str, str]:
+    """Normalize `statement` to its shape, and a short id of the shape.
+
+    Literals and bound parameters become `?`, whitespace is collapsed and `IN` lists or
+    multi-row `VALUES` collapse to a single item, so the same query with a different number
+    of parameters has the same shape.
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _LITERALS.sub("?", shape)
+    shape = _IN_LISTS.sub("IN (?, ...)", shape)
+    shape = _REPEATED_TUPLES.sub(r"\1, ...", shape)
+    return hashlib.blake2b(shape.encode(), digest_size=6).hexdigest(), shape
+
+
+@dataclass(slots=True)
+class QueryShapeStats:
+    statement_id: str
+    statement: str
+    service_method: str
+    count: int = 0
+    total_time: float = 0
+    max_time: float = 0
+    rows: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.count if self.count else 0
+
+
+class QueryStats:
+    """Aggregates the queries executed on tracked engines by statement shape and service method.
+
+    Durations and row counts are exported as Prometheus histograms, and kept per shape and
+    service method in this process to list the slowest ones.
+    """
+
+    def __init__(self, max_shapes: int = _MAX_SHAPES) -> None:
+        self.max_shapes = max_shapes
+        self._shapes: dict[tuple[str, str], QueryShapeStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, statement: str, duration: float, rows: int, service_method: str = "none"
+    ) -> None:
+        statement_id, shape = fingerprint(statement)
+        key = (statement_id, service_method)
+        with self._lock:
+            stats = self._shapes.get(key)
+            if stats is None:
+                if len(self._shapes) >= self.max_shapes:
+                    statement_id = shape = _OTHER_SHAPES
+                    key = (statement_id, service_method)
+                stats = self._shapes.setdefault(
+                    key, QueryShapeStats(statement_id, shape, service_method)
+                )
+            stats.count += 1
+            stats.total_time += duration
+            stats.max_time = max(stats.max_time, duration)
+            stats.rows += rows
+
+        DB_QUERY_DURATION.labels(service_method, statement_id).observe(duration)
+        DB_QUERY_ROWS.labels(service_method, statement_id).observe(rows)
+
+    def top(
+        self,
+        n: int = 20,
+        order_by: Literal["total_time", "mean_time", "max_time", "count"] = "total_time",
+    ) -> list[QueryShapeStats]:
+        with self._lock:
+            shapes = list(self._shapes.values())
+        return sorted(shapes, key=lambda stats: getattr(stats, order_by), reverse=True)[:n]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._shapes.clear()
+
+    def _before_cursor_execute(self, conn: Any, *_: Any) -> None:  # noqa: ANN401
+        conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self,
+        conn: Any,  # noqa: ANN401
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        *_: Any,  # noqa: ANN401
+    ) -> None:
+        duration = time.perf_counter() - conn.info[_START_TIMES].pop()
+        self.record(statement, duration, max(cursor.rowcount, 0), current_service_method.get())
+
+    def _handle_error(self, context: ExceptionContext) -> None:
+        # `after_cursor_execute` isn't fired for failed queries
+        if context.connection is not None and context.cursor is not None:
+            start_times: list[float] = context.connection.info.get(_START_TIMES, [])
+            if start_times:
+                start_times.pop()
+
+    def track(self, engine: Engine) -> None:
+        """Record the queries of `engine`, the `sync_engine` of async engines"""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+
+query_stats = QueryStats()
+
+
+__all__ = (
+    "DB_QUERY_DURATION",
+    "DB_QUERY_ROWS",
+    "QueryShapeStats",
+    "QueryStats",
+    "current_service_method",
+    "fingerprint",
+    "query_stats",
+)
@@ -0,0 +1,182 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.sampling import Decision, ParentBased, Sampler, SamplingResult
+from opentelemetry.trace import Link, SpanContext, SpanKind, StatusCode, TraceFlags, TraceState
+from opentelemetry.util.types import Attributes
+
+# Routes past this many share one budget, so unmatched paths can't grow the buckets
+_MAX_ROUTES = 1024
+_OTHER_ROUTES = "<other>"
+
+
+class _TokenBucket:
+    __slots__ = ("capacity", "rate", "tokens", "updated_at")
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.capacity = max(rate, 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class RouteRateSampler(Sampler):
+    """Head sampler keeping up to `rate` traces per second for each route.
+
+    Root spans are grouped by their `http.route` attribute, or their name without one. Traces
+    over the budget are still recorded, without the sampled flag, so that
+    `TailSamplingSpanProcessor` can keep them when they fail or are slow.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, route: str) -> _TokenBucket:
+        bucket = self._buckets.get(route)
+        if bucket is None:
+            with self._lock:
+                if len(self._buckets) >= _MAX_ROUTES:
+                    route = _OTHER_ROUTES
+                bucket = self._buckets.setdefault(route, _TokenBucket(self.rate))
+        return bucket
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: TraceState | None = None,
+    ) -> SamplingResult:
+        route = str((attributes or {}).get("http.route") or name)
+        bucket = self._bucket(route)
+        with self._lock:
+            sampled = bucket.take()
+        decision = Decision.RECORD_AND_SAMPLE if sampled else Decision.RECORD_ONLY
+        return SamplingResult(decision, attributes, trace_state)
+
+    def get_description(self) -> str:
+        return f"RouteRateSampler{{{self.rate}}}"
+
+
+class _RecordOnly(Sampler):
+    """Records the children of recorded but unsampled spans for tail sampling"""
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: TraceState | None = None,
+    ) -> SamplingResult:
+        return SamplingResult(Decision.RECORD_ONLY, attributes, trace_state)
+
+    def get_description(self) -> str:
+        return "RecordOnly"
+
+
+def adaptive_sampler(rate: float) -> Sampler:
+    """`RouteRateSampler` for root spans, children follow their parent's decision."""
+    return ParentBased(root=RouteRateSampler(rate), local_parent_not_sampled=_RecordOnly())
+
+
+def _as_sampled(span: ReadableSpan) -> ReadableSpan:
+    context = span.context
+    assert context is not None
+    return ReadableSpan(
+        name=span.name,
+        context=SpanContext(
+            context.trace_id,
+            context.span_id,
+            context.is_remote,
+            TraceFlags(context.trace_flags | TraceFlags.SAMPLED),
+            context.trace_state,
+        ),
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Pass sampled spans on to `processor`, and unsampled traces that failed or were slow.
+
+    Spans recorded without the sampled flag are buffered per trace until the local root
+    span ends. The whole trace is then passed on, marked as sampled, if any of its spans
+    has an error status or the root took longer than `latency_threshold` seconds, and
+    dropped otherwise. At most `max_traces` traces are buffered, the oldest are dropped
+    first.
+    """
+
+    def __init__(
+        self, processor: SpanProcessor, *, latency_threshold: float, max_traces: int = 2048
+    ) -> None:
+        self.processor = processor
+        self.latency_threshold_ns = int(latency_threshold * 1e9)
+        self.max_traces = max_traces
+        self._traces: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _keep(self, spans: list[ReadableSpan], root: ReadableSpan) -> bool:
+        duration = (root.end_time or 0) - (root.start_time or 0)
+        return duration > self.latency_threshold_ns or any(
+            span.status.status_code is StatusCode.ERROR for span in spans
+        )
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        self.processor.on_start(span, parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        context = span.context
+        if context is None or context.trace_flags.sampled:
+            self.processor.on_end(span)
+            return
+
+        is_local_root = span.parent is None or span.parent.is_remote
+        with self._lock:
+            spans = self._traces.setdefault(context.trace_id, [])
+            spans.append(span)
+            if is_local_root:
+                del self._traces[context.trace_id]
+            elif len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+
+        if is_local_root and self._keep(spans, span):
+            for kept in spans:
+                self.processor.on_end(_as_sampled(kept))
+
+    def shutdown(self) -> None:
+        self.processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.processor.force_flush(timeout_millis)
+
+
+__all__ = ("RouteRateSampler", "TailSamplingSpanProcessor", "adaptive_sampler")
@@ -1,97 +1,139 @@
+import inspect
+import time
 from collections.abc import Awaitable, Callable, Collection
+from contextlib import AbstractContextManager, nullcontext
 from functools import partial
 from typing import Any, ClassVar
 
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.instrumentation.utils import unwrap
-from opentelemetry.trace import Span, SpanKind, Tracer
+from opentelemetry.metrics import Histogram
+from opentelemetry.trace import INVALID_SPAN, NoOpTracer, ProxyTracer, Span, SpanKind, Tracer
+from opentelemetry.util.types import AttributeValue
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import InstanceState
 from wrapt import (  # pyright: ignore[reportMissingTypeStubs]
     wrap_function_wrapper,  # pyright: ignore[reportUnknownVariableType]
 )
 
 from todo_api.core.database.service import SQLAlchemyModelService
+from todo_api.core.observability.queries import current_service_method
 from todo_api.version import __version__
 
 INSTRUMENTED_PUBLIC_METHODS = {
     "count",
     "create",
+    "create_many",
     "delete",
+    "delete_many",
+    "delete_where",
     "exists",
     "get",
     "get_one",
     "get_one_or_none",
     "list",
     "list_and_count",
+    "list_keyset",
+    "list_rows",
+    "list_rows_and_count",
     "update",
+    "update_many",
+    "update_where",
+    "upsert_many",
 }
 
 
-def _extract_attributes_from_public_methods(
-    instance: SQLAlchemyModelService[Any, Any],
-    args: tuple[Any],
-    kwargs: dict[str, Any],
-) -> dict[str, Any]:
-    """Extracts span attributes from SQLAlchemyModelService method calls.
+_SESSION_FLAGS = ("auto_commit", "auto_refresh", "auto_expunge")
 
-    Extracts record identification and model type for observability context.
+_AttributeExtractor = Callable[
+    [SQLAlchemyModelService[Any, Any], tuple[Any, ...], dict[str, Any]], dict[str, AttributeValue]
+]
 
-    :param instance: The SQLAlchemyModelService instance
-    :type instance: Any
-    :param args: Positional arguments (excluding self)
-    :type args: tuple[Any]
-    :param kwargs: Keyword arguments
-    :type kwargs: dict[str, Any]
-    :return: Dictionary of span attributes
-    :rtype: dict[str, Any]
+
+def _loaded_record_id(data: Any, id_attr_name: str) -> Any | None:  # noqa: ANN401
+    """Identity of a mapped instance without emitting SQL.
+
+    Persistent instances keep their identity key even when expired, pending ones only have
+    an id when it was set explicitly. Reading `data.id` instead would load expired or
+    deferred attributes.
     """
-    attrs: dict[str, Any] = {}
-
-    # Extract model_type from service instance
-    if hasattr(instance, "model"):
-        attrs["model_type"] = instance.model.__name__
-
-    # Extract record_id from id argument
-    if "id" in kwargs:
-        attrs["record_id"] = str(kwargs["id"])
-    elif len(args) > 0 and isinstance(args[0], (int, str)):
-        attrs["record_id"] = str(args[0])
-
-    # Extract model_type and record_id from data argument
-    if "data" in kwargs:
-        data = kwargs["data"]
-    elif (
-        len(args) > 0
-        and hasattr(args[0], "__class__")
-        and not isinstance(args[0], (int, str, bool))
-    ):
-        data = args[0]
-    else:
-        data = None
-
-    if data is not None:
-        attrs["model_type"] = data.__class__.__name__
-        # Try to extract id from model instance for better record tracking
-        if hasattr(data, "id"):
-            try:
-                attrs["record_id"] = str(data.id)
-            except (AttributeError, TypeError):
-                pass
+    state: InstanceState[Any] | None = sa_inspect(data, raiseerr=False)
+    if state is None:
+        return None
+    if state.identity is not None:
+        return state.identity[0] if len(state.identity) == 1 else state.identity
+    return state.dict.get(id_attr_name)
+
+
+def _build_attribute_extractor(method_name: str) -> _AttributeExtractor:
+    """Build the span attributes extractor of a `SQLAlchemyModelService` method.
+
+    The signature is inspected once, so that each call only reads the arguments the method
+    takes: the id or the instance(s) passed first, an `id` filter for methods taking
+    filters as keyword arguments, and the session behavior overrides.
+
+    :param method_name: Name of the `SQLAlchemyModelService` method
+    :type method_name: str
+    :return: Callable taking the service instance, positional and keyword arguments
+    :rtype: _AttributeExtractor
+    """
+    parameters = inspect.signature(getattr(SQLAlchemyModelService, method_name)).parameters
+    first = next(
+        (
+            name
+            for name, parameter in parameters.items()
+            if name != "self" and parameter.kind is parameter.POSITIONAL_OR_KEYWORD
+        ),
+        None,
+    )
+    record_id_param = first if first == "id" else None
+    data_param = first if first in {"data", "ids"} else None
+    takes_filters = any(
+        parameter.kind is parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+    session_flags = tuple(flag for flag in _SESSION_FLAGS if flag in parameters)
+
+    def extract(
+        instance: SQLAlchemyModelService[Any, Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> dict[str, AttributeValue]:
+        attrs: dict[str, AttributeValue] = {"model_type": instance.model.__name__}
 
-    # Extract session behavior overrides
-    if "auto_commit" in kwargs and kwargs["auto_commit"] is not None:
-        attrs["auto_commit"] = kwargs["auto_commit"]
-    if "auto_refresh" in kwargs and kwargs["auto_refresh"] is not None:
-        attrs["auto_refresh"] = kwargs["auto_refresh"]
-    if "auto_expunge" in kwargs and kwargs["auto_expunge"] is not None:
-        attrs["auto_expunge"] = kwargs["auto_expunge"]
+        if record_id_param is not None:
+            record_id = args[0] if args else kwargs.get(record_id_param)
+            if record_id is not None:
+                attrs["record_id"] = str(record_id)
+        elif takes_filters and "id" in kwargs:
+            attrs["record_id"] = str(kwargs["id"])
 
-    return attrs
+        if data_param is not None:
+            data = args[0] if args else kwargs.get(data_param)
+            if isinstance(data, (list, tuple)):
+                # Bulk methods take a sequence of instances, dicts or ids
+                attrs["record_count"] = len(data)  # pyright: ignore[reportUnknownArgumentType]
+            elif data is not None:
+                attrs["model_type"] = data.__class__.__name__
+                record_id = _loaded_record_id(data, instance.model_id_attr_name)
+                if record_id is not None:
+                    attrs["record_id"] = str(record_id)
 
+        for flag in session_flags:
+            value = kwargs.get(flag)
+            if value is not None:
+                attrs[flag] = value
 
-def _apply_attrs_to_span(span: Span, attrs: dict[str, Any]) -> None:
-    for key, value in attrs.items():
-        span.set_attribute(key, value)
+        return attrs
+
+    return extract
+
+
+def _is_noop_tracer(tracer: Tracer) -> bool:
+    """Whether spans of `tracer` are dropped, resolving proxies to the global provider"""
+    if isinstance(tracer, ProxyTracer):
+        tracer = tracer._tracer  # pyright: ignore[reportPrivateUsage]
+    return isinstance(tracer, NoOpTracer)
 
 
 class SQLAlchemyModelServiceInstrumentator(BaseInstrumentor):
@@ -119,6 +161,17 @@ class SQLAlchemyModelServiceInstrumentator(BaseInstrumentor):
             tracer_provider,
             schema_url="https://opentelemetry.io/schemas/1.11.0",
         )
+        meter = metrics.get_meter(
+            self._module_name,
+            self._version,
+            kwargs.get("meter_provider"),
+            schema_url="https://opentelemetry.io/schemas/1.11.0",
+        )
+        duration = meter.create_histogram(
+            "todo_api.service.duration",
+            unit="s",
+            description=f"Duration of {self._module_name} method calls by method",
+        )
 
         for method_name in INSTRUMENTED_PUBLIC_METHODS:
             wrap_function_wrapper(
@@ -127,7 +180,9 @@ class SQLAlchemyModelServiceInstrumentator(BaseInstrumentor):
                 partial(
                     self._async_method_wrapper,
                     tracer=tracer,
+                    duration=duration,
                     method_name=method_name,
+                    extract_attributes=_build_attribute_extractor(method_name),
                 ),
             )
 
@@ -142,16 +197,31 @@ class SQLAlchemyModelServiceInstrumentator(BaseInstrumentor):
         args: tuple[Any, ...],
         kwargs: dict[str, Any],
         tracer: Tracer,
+        duration: Histogram,
         method_name: str,
+        extract_attributes: _AttributeExtractor,
     ) -> Any:  # noqa: ANN401
-        with tracer.start_as_current_span(method_name, kind=SpanKind.INTERNAL) as span:
+        t0 = time.perf_counter()
+        attributes = {"code.function.name": method_name, "model_type": instance.model.__name__}
+        # A no-op tracer still creates a span and attaches it to the context on every call
+        spans: AbstractContextManager[Span] = (
+            nullcontext(INVALID_SPAN)
+            if _is_noop_tracer(tracer)
+            else tracer.start_as_current_span(method_name, kind=SpanKind.INTERNAL)
+        )
+        with spans as span:
             if span.is_recording():
-                span_attrs = _extract_attributes_from_public_methods(instance, args, kwargs)
-                _apply_attrs_to_span(span, span_attrs)
+                span.set_attributes(extract_attributes(instance, args, kwargs))
 
+            # Labels the query stats of the statements it executes
+            token = current_service_method.set(f"{type(instance).__name__}.{method_name}")
             try:
                 return await wrapped(*args, **kwargs)
             except Exception as exc:
                 span.record_exception(exc)
                 span.set_attribute("error", True)
+                attributes["error.type"] = type(exc).__name__
                 raise
+            finally:
+                current_service_method.reset(token)
+                duration.record(time.perf_counter() - t0, attributes)
@@ -1,16 +1,19 @@
+import time
 from collections.abc import Awaitable, Callable, Collection
 from functools import partial
 from typing import Any, ClassVar
 
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.instrumentation.utils import unwrap
+from opentelemetry.metrics import Histogram
 from opentelemetry.trace import SpanKind, Tracer
 from wrapt import (  # pyright: ignore[reportMissingTypeStubs]
     wrap_function_wrapper,  # pyright: ignore[reportUnknownVariableType]
 )
 
 from todo_api.core.database.service import SQLAlchemyService
+from todo_api.core.observability.queries import current_service_method
 from todo_api.version import __version__
 
 INSTRUMENTED_PUBLIC_METHODS = {
@@ -37,6 +40,17 @@ class SQLAlchemyServiceInstrumentator(BaseInstrumentor):
             tracer_provider,
             schema_url="https://opentelemetry.io/schemas/1.11.0",
         )
+        meter = metrics.get_meter(
+            self._module_name,
+            self._version,
+            kwargs.get("meter_provider"),
+            schema_url="https://opentelemetry.io/schemas/1.11.0",
+        )
+        duration = meter.create_histogram(
+            "todo_api.service.duration",
+            unit="s",
+            description=f"Duration of {self._module_name} method calls by method",
+        )
 
         for method_name in INSTRUMENTED_PUBLIC_METHODS:
             wrap_function_wrapper(
@@ -45,6 +59,7 @@ class SQLAlchemyServiceInstrumentator(BaseInstrumentor):
                 partial(
                     self._async_method_wrapper,
                     tracer=tracer,
+                    duration=duration,
                     method_name=method_name,
                 ),
             )
@@ -60,12 +75,21 @@ class SQLAlchemyServiceInstrumentator(BaseInstrumentor):
         args: tuple[Any, ...],
         kwargs: dict[str, Any],
         tracer: Tracer,
+        duration: Histogram,
         method_name: str,
     ) -> Any:  # noqa: ANN401
+        t0 = time.perf_counter()
+        attributes = {"code.function.name": method_name}
         with tracer.start_as_current_span(method_name, kind=SpanKind.INTERNAL) as span:
+            # Labels the query stats of the statements it executes
+            token = current_service_method.set(f"{type(instance).__name__}.{method_name}")
             try:
                 return await wrapped(*args, **kwargs)
             except Exception as exc:
                 span.record_exception(exc)
                 span.set_attribute("error", True)
+                attributes["error.type"] = type(exc).__name__
                 raise
+            finally:
+                current_service_method.reset(token)
+                duration.record(time.perf_counter() - t0, attributes)
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from todo_api.core.database.base import Model
@@ -7,6 +7,17 @@ from todo_api.core.database.mixins import TimestampMixin
 
 class Todo(TimestampMixin, Model):
     __tablename__ = "todo"
+    # Keyset pagination of a user's todos seeks on `(timestamp, id)` within `user_id`,
+    # `updated_at` falls back to `created_at` (see `TodoService.keyset_fallbacks`)
+    __table_args__ = (
+        Index(None, "user_id", "created_at", "id"),
+        Index(
+            "ix_todo_user_id_todo_coalesce_updated_at_todo_id",
+            "user_id",
+            func.coalesce(text("updated_at"), text("created_at")),
+            "id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True, autoincrement=True)
     title: Mapped[str] = mapped_column()
@@ -1,6 +1,30 @@
+from collections.abc import Sequence
+from typing import Any
+
 from todo_api.core.database.service import SQLAlchemyModelService
 from todo_api.todos.models import Todo
 
 
 class TodoService(SQLAlchemyModelService[Todo, int]):
     model = Todo
+    keyset_fallbacks = {"updated_at": "created_at"}
+
+    async def list_by_ids(self, ids: Sequence[int]) -> Sequence[Todo]:
+        """Fetch all todos with the given ids in one query, missing ids are skipped."""
+        return await self.list(statement=self.statement.where(Todo.id.in_(ids)))
+
+    async def delete_owned(self, id: int, user_id: int) -> Todo | None:
+        """Delete the todo if it belongs to `user_id` in a single statement.
+
+        Returns `None` if the todo does not exist or belongs to someone else.
+        """
+        deleted = await self.delete_where(id=id, user_id=user_id)
+        return deleted[0] if deleted else None
+
+    async def update_owned(self, id: int, user_id: int, values: dict[str, Any]) -> Todo | None:
+        """Update the todo if it belongs to `user_id` in a single statement.
+
+        Returns `None` if the todo does not exist or belongs to someone else.
+        """
+        updated = await self.update_where(values, id=id, user_id=user_id)
+        return updated[0] if updated else None
@@ -1,7 +1,30 @@
+import time
+from collections.abc import Callable
+
+import anyio
+import anyio.to_thread
 from passlib.context import CryptContext
+from prometheus_client import Gauge, Histogram
+
+from todo_api.core.config import settings
 
 pwd_context = CryptContext(schemes=["argon2"])
 
+PASSWORD_HASHING_QUEUED = Gauge(
+    "todo_api_password_hashing_queued",
+    "Gauge of password hash/verify calls waiting for a free hashing thread",
+    multiprocess_mode="livesum",
+)
+
+PASSWORD_HASHING_WAIT_TIME = Histogram(
+    "todo_api_password_hashing_wait_seconds",
+    "Histogram of time password hash/verify calls waited for a free hashing thread in seconds",
+)
+
+# argon2 releases the GIL while hashing, so a thread pool is enough to keep it off the event
+# loop. The limiter bounds how many CPU-bound hashes run at once, the rest wait in line.
+_hashing_limiter = anyio.CapacityLimiter(settings.PASSWORD_HASHING_CONCURRENCY)
+
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
@@ -9,3 +32,25 @@ def get_password_hash(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+async def _run_hashing[*Ts, R](func: Callable[[*Ts], R], *args: *Ts) -> R:
+    queued_at = time.perf_counter()
+    with PASSWORD_HASHING_QUEUED.track_inprogress():
+        await _hashing_limiter.acquire()
+    PASSWORD_HASHING_WAIT_TIME.observe(time.perf_counter() - queued_at)
+
+    try:
+        return await anyio.to_thread.run_sync(func, *args)
+    finally:
+        _hashing_limiter.release()
+
+
+async def get_password_hash_async(password: str) -> str:
+    """`get_password_hash` run in a worker thread, see `PASSWORD_HASHING_CONCURRENCY`"""
+    return await _run_hashing(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """`verify_password` run in a worker thread, see `PASSWORD_HASHING_CONCURRENCY`"""
+    return await _run_hashing(verify_password, plain_password, hashed_password)